@@ -0,0 +1,119 @@
+"""
+Offline benchmark of a full wizard submission replayed from an HTTP cassette.
+
+The first run (or ``--record``) submits an application with 1,000 fields to
+the mock Atlan server and records every HTTP exchange. Later runs replay the
+cassette without any server or network, at the recorded timings scaled by
+``--time-scales`` (0 measures client-side cost only), so regressions in
+``_handle_asset_submission`` can be tracked deterministically.
+
+A cassette recorded from a real tenant with ``ATLAN_CASSETTE_MODE=record``
+can be replayed the same way, provided it was made from the same submission.
+
+Usage:
+    python -m benchmarks.bench_replay --record
+    python -m benchmarks.bench_replay --time-scales 0,1 --iterations 10
+"""
+
+import argparse
+import os
+from datetime import datetime, timezone
+
+from benchmarks.bench_services import (
+    UNLIMITED_LANES, DEFAULT_RESULTS_DIR, run_case, prepare_submission_state, submit_prepared,
+    write_results, compare_with_baseline,
+)
+from benchmarks.mock_atlan import MockAtlanConfig, MockAtlanServer, MockCatalog
+from services.atlan_client import create_client, get_tenant_key
+from services.http_cassette import install_cassette, RECORD_MODE, REPLAY_MODE
+from services.rate_limiter import configure_tenant_limiter
+from services.single_flight import atlan_reads
+
+DEFAULT_CASSETTE = os.path.join(DEFAULT_RESULTS_DIR, "submission-cassette.jsonl")
+REPLAY_URL = "https://replay.invalid"
+
+
+def record_submission(args, config):
+    """Record one submission against the mock server into the cassette."""
+    if os.path.exists(args.cassette):
+        os.remove(args.cassette)
+    os.makedirs(os.path.dirname(os.path.abspath(args.cassette)), exist_ok=True)
+
+    with MockAtlanServer(config) as server:
+        client = create_client(server.url, "benchmark-token")
+        configure_tenant_limiter(get_tenant_key(client), UNLIMITED_LANES)
+        cassette = install_cassette(client._session, RECORD_MODE, args.cassette)
+        atlan_reads.forget()
+        search_results = prepare_submission_state(server.catalog, client, server.url, 0, args.submission_fields)
+        submit_prepared(client, search_results)
+        requests = sum(server.request_counts.values())
+    print(f"Recorded {requests} requests to {cassette.path}")
+
+
+def replay_submission(args, config, time_scale):
+    """Benchmark the submission replayed from the cassette at one time scale."""
+    client = create_client(REPLAY_URL, "replay-token")
+    configure_tenant_limiter(get_tenant_key(client), UNLIMITED_LANES)
+    cassette = install_cassette(client._session, REPLAY_MODE, args.cassette, time_scale)
+    catalog = MockCatalog(config)
+    replayed = [0]
+
+    def count_request(request):
+        replayed[0] += 1
+
+    client._session.event_hooks["request"].append(count_request)
+
+    state = {}
+
+    def setup(i):
+        cassette.rewind()
+        # Every iteration replays the recorded submission, so the session state must match it
+        state["search_results"] = prepare_submission_state(catalog, client, REPLAY_URL, 0, args.submission_fields)
+
+    row = run_case(
+        "_handle_asset_submission",
+        lambda i: submit_prepared(client, state["search_results"]),
+        args.iterations,
+        lambda: replayed[0],
+        setup=setup,
+    )
+    row["catalog_size"] = config.catalog_size
+    row["time_scale"] = time_scale
+    row["submission_fields"] = args.submission_fields
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark a wizard submission replayed from a cassette.")
+    parser.add_argument("--cassette", default=DEFAULT_CASSETTE)
+    parser.add_argument("--record", action="store_true", help="Re-record the cassette against the mock server.")
+    parser.add_argument("--submission-fields", type=int, default=1000)
+    parser.add_argument("--catalog-size", type=int, default=10_000)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Mock server latency while recording.")
+    parser.add_argument("--time-scales", default="0,1", help="Comma-separated replay timing multipliers.")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/replay-<timestamp>.json).")
+    parser.add_argument("--baseline", help="Previous results file to compare against.")
+    args = parser.parse_args()
+
+    config = MockAtlanConfig(catalog_size=args.catalog_size, latency_ms=args.latency_ms)
+    if args.record or not os.path.exists(args.cassette):
+        record_submission(args, config)
+
+    started_at = datetime.now(timezone.utc)
+    results = []
+    for time_scale in (float(s) for s in args.time_scales.split(",") if s):
+        row = replay_submission(args, config, time_scale)
+        results.append(row)
+        print(
+            f"x{time_scale:<4} {row['function']:<26} p50 {row['p50_ms']:>9.1f} ms  p99 {row['p99_ms']:>9.1f} ms  "
+            f"{row['throughput_ops_per_s']:>8.2f} ops/s  {row['requests_per_op']:>7} req/op"
+        )
+
+    write_results("replay", started_at, args, results)
+    if args.baseline:
+        compare_with_baseline(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
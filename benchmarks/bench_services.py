@@ -0,0 +1,248 @@
+"""
+Benchmark suite for the service layer against the local mock Atlan server.
+
+Reports p50/p99 latency and throughput for each service function at several
+catalog sizes and saves the results as JSON so runs can be compared.
+
+Usage:
+    python -m benchmarks.bench_services
+    python -m benchmarks.bench_services --sizes 1000,100000 --iterations 10 --latency-ms 5
+    python -m benchmarks.bench_services --baseline benchmarks/results/previous.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import time
+from datetime import datetime, timezone
+
+import streamlit as st
+from streamlit import config as streamlit_config
+from streamlit.logger import set_log_level
+
+from benchmarks.mock_atlan import MockAtlanConfig, MockAtlanServer
+from services.atlan_client import create_client, get_tenant_key
+from services.asset_service import (
+    search_applications, search_assets_direct, load_existing_application_fields, create_application_fields
+)
+from services.rate_limiter import configure_tenant_limiter
+from services.metrics import percentile
+from services.single_flight import atlan_reads
+from utils.compact_state import AssetRef, FieldStore
+
+# Service functions report progress through Streamlit, which logs a warning per call outside
+# `streamlit run`. Parse the config first, as that resets the log level to the configured one.
+streamlit_config.get_config_options()
+set_log_level("error")
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# Benchmarks measure the service layer itself, not the production rate limits
+UNLIMITED_LANES = {
+    "interactive": {"rate": 1_000_000.0, "burst": 1_000_000, "concurrency": 64},
+    "bulk": {"rate": 1_000_000.0, "burst": 1_000_000, "concurrency": 64},
+}
+
+
+def run_case(name, operation, iterations, request_count, setup=None):
+    """
+    Time an operation ``iterations`` times, returning a result row.
+
+    Args:
+        name: Function name reported in the results
+        operation: Callable taking the iteration number
+        iterations: Number of timed calls
+        request_count: Callable returning the number of HTTP requests served so far
+        setup: Optional untimed callable run before each iteration
+    """
+    requests_before = request_count()
+    samples = []
+    for i in range(iterations):
+        atlan_reads.forget()
+        if setup is not None:
+            setup(i)
+        op_start = time.perf_counter()
+        operation(i)
+        samples.append((time.perf_counter() - op_start) * 1000)
+    requests = request_count() - requests_before
+    total_seconds = sum(samples) / 1000
+
+    return {
+        "function": name,
+        "iterations": iterations,
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "throughput_ops_per_s": round(iterations / total_seconds, 3) if total_seconds else None,
+        "requests_per_op": round(requests / iterations, 2),
+    }
+
+
+def prepare_submission_state(catalog, client, server_url, iteration, field_count):
+    """Populate session state the way the wizard does before the final submit."""
+    connection_qn = catalog.connection_qn(0)
+    st.session_state["atlan_url"] = server_url
+    st.session_state["client"] = client
+    st.session_state["asset_details"] = {
+        "connection_qualified_name": connection_qn,
+        "name": f"Benchmark Application {iteration}",
+        "app_id": f"BENCH-{iteration}",
+        "fields": FieldStore(
+            {"name": f"bench_field_{k}", "description": f"Benchmark field {k}"}
+            for k in range(field_count)
+        ),
+        "is_update": False,
+        "create_new_connection": False,
+    }
+    st.session_state["enrichment_details"] = {
+        "description": "Created by the benchmark suite",
+        "owner_users": ["user0"],
+        "owner_groups": [],
+        "tag_names": [],
+    }
+    tables = [catalog.entity(catalog.table_start + k) for k in range(min(3, catalog.n_tables))]
+    return {
+        f"Table: {t['attributes']['name']}": AssetRef(
+            t["guid"], t["attributes"]["qualifiedName"], t["typeName"], t["attributes"]["name"]
+        )
+        for t in tables
+    }
+
+
+def submit_prepared(client, search_results):
+    """Run the wizard's final submission: one owned asset, one lineage input and one output."""
+    # Imported here so the page module's Streamlit widgets are only loaded when benchmarking submissions
+    from ui.pages.relationships import _handle_asset_submission
+
+    selections = list(search_results)
+    _handle_asset_submission(client, False, selections[:1], selections[1:2], selections[2:3], search_results)
+
+
+def benchmark_catalog(size, args):
+    """Run every case against a mock server with the given catalog size."""
+    config = MockAtlanConfig(
+        catalog_size=size,
+        fields_per_application=args.fields_per_application,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        max_page_size=args.max_page_size,
+        failure_rate=args.failure_rate,
+    )
+    results = []
+    with MockAtlanServer(config) as server:
+        client = create_client(server.url, "benchmark-token")
+        if not args.respect_rate_limits:
+            configure_tenant_limiter(get_tenant_key(client), UNLIMITED_LANES)
+        catalog = server.catalog
+        app_qns = [catalog.application_qn(a) for a in range(catalog.n_applications)]
+
+        cases = [
+            ("search_applications",
+             lambda i: search_applications(client, ("orders", "payments", "service")[i % 3])),
+            # "table" matches every Table, more than pyatlan's 100,000-hit limit for sorted searches at 1,000,000
+            ("search_assets_direct",
+             lambda i: search_assets_direct(client, ("orders", "table_12", "table")[i % 3])),
+            ("load_existing_application_fields",
+             lambda i: load_existing_application_fields(client, app_qns[i % len(app_qns)])),
+            ("create_application_fields",
+             lambda i: create_application_fields(
+                 client,
+                 [{"name": f"bench_{i}_{k}", "description": "benchmark"} for k in range(args.create_fields)],
+                 app_qns[i % len(app_qns)],
+             )),
+        ]
+
+        def submit(i):
+            search_results = prepare_submission_state(catalog, client, server.url, i, args.submission_fields)
+            submit_prepared(client, search_results)
+
+        cases.append(("_handle_asset_submission", submit))
+
+        for name, operation in cases:
+            if args.functions and name not in args.functions:
+                continue
+            row = run_case(name, operation, args.iterations, lambda: sum(server.request_counts.values()))
+            row["catalog_size"] = size
+            results.append(row)
+            print(
+                f"{size:>9,} {name:<34} p50 {row['p50_ms']:>9.1f} ms  p99 {row['p99_ms']:>9.1f} ms  "
+                f"{row['throughput_ops_per_s']:>8.2f} ops/s  {row['requests_per_op']:>7} req/op"
+            )
+    return results
+
+
+def write_results(prefix, started_at, args, results):
+    """
+    Save benchmark results as JSON.
+
+    Args:
+        prefix: File name prefix used when ``args.output`` is not set
+        started_at: UTC datetime the run started
+        args: Parsed command-line arguments, saved as the run configuration
+        results: Result rows from run_case
+    """
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"{prefix}-{started_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "started_at": started_at.isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {k: v for k, v in vars(args).items() if k not in ("output", "baseline")},
+            "results": results,
+        }, f, indent=2)
+    print(f"\nSaved results to {output}")
+
+
+def compare_with_baseline(results, baseline_path):
+    """Print the p50 change of every case relative to a previous results file."""
+    def key(row):
+        return row["catalog_size"], row["function"], row.get("time_scale")
+
+    with open(baseline_path) as f:
+        baseline = {key(r): r for r in json.load(f)["results"]}
+    print(f"\nChange in p50 vs {baseline_path}:")
+    for row in results:
+        previous = baseline.get(key(row))
+        if previous and previous["p50_ms"]:
+            change = (row["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100
+            scale = f" x{row['time_scale']}" if "time_scale" in row else ""
+            print(f"{row['catalog_size']:>9,} {row['function'] + scale:<34} {change:+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the service layer against a mock Atlan.")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated catalog sizes.")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--functions", nargs="*", help="Only run these service functions.")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Mock server latency per request.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--max-page-size", type=int, default=300)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--fields-per-application", type=int, default=50)
+    parser.add_argument("--create-fields", type=int, default=100, help="Fields per create_application_fields call.")
+    parser.add_argument("--submission-fields", type=int, default=1000, help="Fields per wizard submission.")
+    parser.add_argument("--respect-rate-limits", action="store_true",
+                        help="Keep the production per-tenant rate limits.")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/services-<timestamp>.json).")
+    parser.add_argument("--baseline", help="Previous results file to compare against.")
+    args = parser.parse_args()
+
+    started_at = datetime.now(timezone.utc)
+    results = []
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        results.extend(benchmark_catalog(size, args))
+
+    write_results("services", started_at, args, results)
+
+    if args.baseline:
+        compare_with_baseline(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Startup-time benchmark: per-module import cost in fresh interpreters.
+
+Takes the modules exercised by ``test_imports.py``, imports each one in a new
+Python process with ``-X importtime`` and reports its total import time,
+the heaviest modules it pulls in and whether pyatlan's asset models were
+loaded. ``main`` is measured too, as it is what Streamlit imports before the
+sidebar can render.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 5 --top 5 --baseline benchmarks/results/<previous>.json
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from benchmarks.bench_services import write_results, compare_with_baseline
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_IMPORTS = os.path.join(REPO_ROOT, "test_imports.py")
+ASSET_MODELS_MODULE = "pyatlan.model.assets"
+
+
+def modules_from_test_imports(path=TEST_IMPORTS):
+    """List the modules imported by ``test_imports.py`` (``from pkg import mod`` statements)."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            modules.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple of (total microseconds, {dependency: cumulative microseconds}, asset models loaded)
+    """
+    check = f"import sys, {module}; print({ASSET_MODELS_MODULE!r} in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+
+    # Each line is "import time: self | cumulative | <indent>name"; children are listed before their parent
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        if cumulative_us.strip().isdigit():
+            entries.append((name.strip(), int(cumulative_us), len(name) - len(name.lstrip())))
+
+    total = 0
+    dependencies = {}
+    for index in range(len(entries) - 1, -1, -1):
+        name, cumulative_us, depth = entries[index]
+        if name == module:
+            total = cumulative_us
+            for child_name, child_us, child_depth in reversed(entries[:index]):
+                if child_depth <= depth:
+                    break
+                dependencies[child_name] = child_us
+            break
+    return total, dependencies, result.stdout.strip().endswith("True")
+
+
+def benchmark_module(module, repeat, top):
+    """Measure a module ``repeat`` times and summarise its import cost."""
+    totals = []
+    dependencies = {}
+    loads_asset_models = False
+    for _ in range(repeat):
+        total, dependencies, loads_asset_models = measure_import(module)
+        totals.append(total / 1000)
+
+    # Heaviest modules imported on behalf of this one, from the last run
+    heaviest = sorted(dependencies.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "function": module,
+        "catalog_size": 0,
+        "iterations": repeat,
+        "p50_ms": round(statistics.median(totals), 1),
+        "min_ms": round(min(totals), 1),
+        "loads_asset_models": loads_asset_models,
+        "heaviest_dependencies": [{"module": name, "ms": round(us / 1000, 1)} for name, us in heaviest],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-module import cost in fresh interpreters.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module.")
+    parser.add_argument("--top", type=int, default=3, help="Heaviest dependencies listed per module.")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/startup-<timestamp>.json).")
+    parser.add_argument("--baseline", help="Previous results file to compare against.")
+    args = parser.parse_args()
+
+    started_at = datetime.now(timezone.utc)
+    results = []
+    for module in ["main"] + modules_from_test_imports():
+        row = benchmark_module(module, args.repeat, args.top)
+        results.append(row)
+        heaviest = ", ".join(f"{d['module']} {d['ms']:.0f}ms" for d in row["heaviest_dependencies"])
+        marker = "asset models" if row["loads_asset_models"] else "light"
+        print(f"{module:<38} {row['p50_ms']:>8.1f} ms  {marker:<12}  {heaviest}")
+
+    write_results("startup", started_at, args, results)
+    if args.baseline:
+        compare_with_baseline(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,946 @@
+"""
+Local stand-in for the Atlan REST endpoints used by the Atlan Asset Builder.
+
+Serves index search, bulk entity save and archive, entity lookup by GUID,
+lineage lists, typedefs (all or by name), users, groups and the current user
+over plain HTTP, so the service layer can be exercised and benchmarked with a
+real AtlanClient and no network access.
+
+The catalog is generated procedurally from each asset's index, so even a
+1M-asset catalog costs no memory until assets are saved through the API.
+
+Usage:
+    python -m benchmarks.mock_atlan --catalog-size 100000 --latency-ms 20
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+BASE_TIMESTAMP = 1_700_000_000_000  # Creation time (ms) of the first catalog asset
+CONNECTION_EPOCH = 1_700_000_000
+
+_APPLICATION_WORDS = (
+    "Orders", "Payments", "Inventory", "Shipping", "Customer", "Billing",
+    "Catalog", "Pricing", "Search", "Identity", "Reporting", "Notification",
+)
+_TAG_NAMES = ("PII", "Confidential", "Finance", "Deprecated", "Gold", "Internal")
+_RELATIONSHIP_ATTRIBUTES = ("inputs", "outputs", "applicationOwnedAssets", "inputToProcesses", "outputFromProcesses")
+
+
+@dataclass
+class MockAtlanConfig:
+    """Behaviour of the mock server."""
+
+    catalog_size: int = 1000
+    connections: int = 10
+    fields_per_application: int = 50
+    latency_ms: float = 0.0  # Fixed latency added to every request
+    jitter_ms: float = 0.0  # Additional uniformly distributed latency
+    max_page_size: int = 300  # Server-side cap on the requested page size
+    failure_rate: float = 0.0  # Fraction of requests answered with failure_status
+    failure_status: int = 429
+    retry_after: float = 1.0  # Retry-After header (seconds) sent with injected 429s
+    users: int = 200
+    groups: int = 20
+    tags: list = field(default_factory=lambda: list(_TAG_NAMES))
+
+
+class MockCatalog:
+    """
+    Procedurally generated catalog of Connection, Application, ApplicationField
+    and Table assets, plus an in-memory overlay of everything saved through the API.
+
+    Catalog order (and therefore GUID and creation-time order) is: connections,
+    applications, application fields, tables.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        size = max(config.catalog_size, config.connections + 2)
+        self.n_connections = config.connections
+        self.n_api_connections = max(1, self.n_connections // 2)
+        self.n_applications = max(1, min(size // 1000 or 1, size - self.n_connections))
+        remaining = size - self.n_connections - self.n_applications
+        self.fields_per_application = max(0, min(config.fields_per_application, remaining // self.n_applications))
+        self.n_fields = self.n_applications * self.fields_per_application
+        self.n_tables = remaining - self.n_fields
+        self.size = size
+
+        self.app_start = self.n_connections
+        self.field_start = self.app_start + self.n_applications
+        self.table_start = self.field_start + self.n_fields
+        self.segments = {
+            "Connection": (0, self.app_start),
+            "Application": (self.app_start, self.field_start),
+            "ApplicationField": (self.field_start, self.table_start),
+            "Table": (self.table_start, self.size),
+        }
+
+        # Saved entities: catalog overrides by index, and new entities appended after the catalog
+        self._lock = threading.Lock()
+        self._updates = {}
+        self._created = []
+        self._created_by_qn = {}
+        # Inverse lineage relationships of saved processes: qualified name -> {attribute: process qualified names}
+        self._relations = {}
+        # Catalog indices archived (soft-deleted) since start
+        self._archived = set()
+        # Catalog indices matching recent queries that needed a scan, so paging does not rescan
+        self._match_cache = {}
+
+    # Identity helpers -----------------------------------------------------
+
+    @staticmethod
+    def guid(index):
+        return f"00000000-0000-4000-8000-{index:012d}"
+
+    def connection_qn(self, j):
+        connector = "api" if j < self.n_api_connections else "snowflake"
+        return f"default/{connector}/{CONNECTION_EPOCH + j}"
+
+    def application_qn(self, a):
+        return f"{self.connection_qn(a % self.n_api_connections)}/app_{a}"
+
+    def table_connection(self, t):
+        snowflake = self.n_connections - self.n_api_connections
+        return self.n_api_connections + (t % snowflake if snowflake else 0)
+
+    def index_for_qualified_name(self, qualified_name):
+        """Map a catalog qualified name back to its index (None if not a catalog asset)."""
+        match = re.fullmatch(r"default/(api|snowflake)/(\d+)(?:/(.*))?", qualified_name or "")
+        if not match:
+            return None
+        j = int(match.group(2)) - CONNECTION_EPOCH
+        if not 0 <= j < self.n_connections:
+            return None
+        rest = match.group(3)
+        if rest is None:
+            return j
+        app = re.fullmatch(r"app_(\d+)(?:/field_(\d+))?", rest)
+        if app:
+            a = int(app.group(1))
+            if a >= self.n_applications or a % self.n_api_connections != j:
+                return None
+            if app.group(2) is None:
+                return self.app_start + a
+            k = int(app.group(2))
+            return self.field_start + a * self.fields_per_application + k if k < self.fields_per_application else None
+        table = re.fullmatch(r"db/schema/table_(\d+)", rest)
+        if table:
+            t = int(table.group(1))
+            return self.table_start + t if t < self.n_tables and self.table_connection(t) == j else None
+        return None
+
+    def indices_for_name(self, name):
+        """Catalog indices whose name equals the given value."""
+        match = re.fullmatch(r"(?:.* )?(?:app|field|table|connection)?_?(\d+)", name or "")
+        if not match:
+            return []
+        n = int(match.group(1))
+        candidates = [n, self.app_start + n, self.table_start + n]
+        candidates += range(self.field_start + n, self.table_start, max(1, self.fields_per_application))
+        return sorted({i for i in candidates if 0 <= i < self.size and self.entity(i)["attributes"]["name"] == name})
+
+    # Entity rendering -----------------------------------------------------
+
+    def type_name(self, index):
+        for type_name, (start, end) in self.segments.items():
+            if start <= index < end:
+                return type_name
+        return None
+
+    def entity(self, index, relations=True):
+        """
+        Render the catalog (or created) entity at an index as Atlan JSON.
+
+        With ``relations``, relationship attributes (process inputs and outputs,
+        owned assets and the inverse lineage of saved processes) are rendered as
+        references carrying the related asset's GUID, name and qualified name.
+        """
+        if index >= self.size:
+            entity = self._created[index - self.size]
+            return self._with_relations(entity) if relations else entity
+
+        type_name = self.type_name(index)
+        if type_name == "Connection":
+            qn = self.connection_qn(index)
+            attributes = {
+                "name": f"connection_{index}",
+                "qualifiedName": qn,
+                "connectorName": qn.split("/")[1],
+                "connectionQualifiedName": qn,
+            }
+        elif type_name == "Application":
+            a = index - self.app_start
+            qn = self.application_qn(a)
+            attributes = {
+                "name": f"{_APPLICATION_WORDS[a % len(_APPLICATION_WORDS)]} Service {a}",
+                "qualifiedName": qn,
+                "appId": f"APP-{a:05d}",
+                "description": f"Mock application {a}",
+                "connectionQualifiedName": self.connection_qn(a % self.n_api_connections),
+                "connectorName": "api",
+            }
+        elif type_name == "ApplicationField":
+            a, k = divmod(index - self.field_start, self.fields_per_application)
+            app_qn = self.application_qn(a)
+            attributes = {
+                "name": f"field_{k}",
+                "qualifiedName": f"{app_qn}/field_{k}",
+                "description": f"Field {k} of application {a}",
+                "applicationParentQualifiedName": app_qn,
+                "connectionQualifiedName": self.connection_qn(a % self.n_api_connections),
+                "connectorName": "api",
+            }
+        else:
+            t = index - self.table_start
+            connection_qn = self.connection_qn(self.table_connection(t))
+            attributes = {
+                "name": f"table_{t}",
+                "qualifiedName": f"{connection_qn}/db/schema/table_{t}",
+                "connectionQualifiedName": connection_qn,
+                "connectorName": "snowflake",
+            }
+
+        entity = {
+            "typeName": type_name,
+            "guid": self.guid(index),
+            "status": "DELETED" if index in self._archived else "ACTIVE",
+            "attributes": attributes,
+            "createTime": BASE_TIMESTAMP + index,
+            "updateTime": BASE_TIMESTAMP + index,
+        }
+        update = self._updates.get(index)
+        if update:
+            entity["attributes"] = {**attributes, **update}
+        return self._with_relations(entity) if relations else entity
+
+    def _with_relations(self, entity):
+        attributes = entity["attributes"]
+        inverse = self._relations.get(attributes.get("qualifiedName"), {})
+        if not inverse and not any(name in attributes for name in _RELATIONSHIP_ATTRIBUTES):
+            return entity
+        attributes = {**attributes, **{name: [{"uniqueAttributes": {"qualifiedName": qn}} for qn in sorted(qns)]
+                                       for name, qns in inverse.items()}}
+        for name in _RELATIONSHIP_ATTRIBUTES:
+            if attributes.get(name):
+                attributes[name] = [ref for ref in map(self._reference, attributes[name]) if ref]
+        return {**entity, "attributes": attributes}
+
+    def _reference(self, ref):
+        """Resolve a saved reference (by qualified name) to the related asset's header."""
+        qn = (ref.get("uniqueAttributes") or {}).get("qualifiedName") or (ref.get("attributes") or {}).get("qualifiedName")
+        index = self.index_for_qualified_name(qn)
+        if index is None:
+            index = self._created_by_qn.get(qn)
+        if index is None:
+            return None
+        related = self.entity(index, relations=False)
+        return {
+            "typeName": related["typeName"],
+            "guid": related["guid"],
+            "attributes": {"name": related["attributes"].get("name"), "qualifiedName": qn},
+            "uniqueAttributes": {"qualifiedName": qn},
+        }
+
+    # Search ---------------------------------------------------------------
+
+    def search(self, dsl, attributes=None):
+        """Run an index search DSL against the catalog, returning (count, entities, aggregations)."""
+        query = dsl.get("query") or {"match_all": {}}
+        start = int(dsl.get("from", 0) or 0)
+        size = min(int(10 if dsl.get("size") is None else dsl["size"]), self.config.max_page_size)
+
+        candidates, residual = self._narrow(query)
+        matcher = _compile_query({"bool": {"filter": residual}}) if residual else None
+        full_matcher = _compile_query(query)
+
+        with self._lock:
+            overlay = range(self.size, self.size + len(self._created))
+
+        if matcher is None and isinstance(candidates, range) and _sort_field(dsl) is None:
+            matched = candidates
+        else:
+            sort_field = _sort_field(dsl)
+            cache_key = json.dumps([query, _sorts_by_score(dsl), sort_field], sort_keys=True)
+            with self._lock:
+                matched = self._match_cache.get(cache_key)
+            if matched is None:
+                matched = [i for i in candidates if matcher is None or matcher(self.entity(i))]
+                scorer = _compile_scorer(query) if _sorts_by_score(dsl) else None
+                if scorer is not None:
+                    matched.sort(key=lambda i: -scorer(self.entity(i)))
+                elif sort_field is not None:
+                    matched.sort(key=lambda i: str(_entity_value(self.entity(i), sort_field) or ""))
+                with self._lock:
+                    if len(self._match_cache) >= 32:
+                        self._match_cache.clear()
+                    self._match_cache[cache_key] = matched
+        catalog_count = len(matched)
+        page_indices = list(matched[start:start + size])
+
+        overlay_matches = [i for i in overlay if full_matcher(self.entity(i))]
+        count = catalog_count + len(overlay_matches)
+        if len(page_indices) < size:
+            overlay_start = max(0, start - catalog_count)
+            page_indices += overlay_matches[overlay_start:overlay_start + size - len(page_indices)]
+
+        aggregations = self._aggregate(dsl.get("aggregations") or {}, matched, overlay_matches)
+        return count, [_project(self.entity(i), attributes) for i in page_indices], aggregations
+
+    def _aggregate(self, requested, matched, overlay_matches):
+        """Compute terms (by count or by key) and cardinality aggregations over all matching entities."""
+        results = {}
+        for key, aggregation in requested.items():
+            terms = aggregation.get("terms") or aggregation.get("cardinality")
+            if not terms:
+                continue
+            field_name = _field_name(terms["field"])
+            counts = {}
+            for indices in (matched, overlay_matches):
+                for i in indices:
+                    value = _entity_value(self.entity(i), field_name)
+                    if value is not None:
+                        counts[value] = counts.get(value, 0) + 1
+            if "cardinality" in aggregation:
+                results[key] = {"value": len(counts)}
+                continue
+            if "_key" in (terms.get("order") or {}):
+                ordered = sorted(counts.items(), key=lambda item: str(item[0]), reverse=terms["order"]["_key"] == "desc")
+            else:
+                ordered = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+            top = ordered[:int(terms.get("size", 10))]
+            results[key] = {
+                "doc_count_error_upper_bound": 0,
+                "sum_other_doc_count": sum(count for _, count in ordered[len(top):]),
+                "buckets": [{"key": value, "doc_count": count} for value, count in top],
+            }
+        return results
+
+    def _narrow(self, query):
+        """
+        Turn the top-level filters the catalog can index into a candidate index
+        set, returning (candidates, residual filters still to evaluate).
+        """
+        candidates = range(0, self.size)
+        clauses = _top_level_filters(query)
+        if clauses is None:
+            return candidates, [query]
+
+        residual = []
+        for clause in clauses:
+            kind, field_name, value = _describe_clause(clause)
+            values = value if kind == "terms" else [value]
+            if kind in ("term", "terms") and field_name == "__typeName":
+                if len(values) == 1:
+                    candidates = _intersect(candidates, range(*self.segments.get(values[0], (0, 0))))
+                else:
+                    allowed = set(values)
+                    candidates = [i for i in candidates if self.type_name(i) in allowed]
+            elif kind == "term" and field_name == "__state" and value == "ACTIVE" and not self._archived:
+                continue
+            elif kind in ("term", "terms") and field_name == "qualifiedName":
+                wanted = {self.index_for_qualified_name(qn) for qn in values} - {None}
+                candidates = _intersect(candidates, sorted(wanted))
+            elif kind == "term" and field_name == "name":
+                candidates = _intersect(candidates, self.indices_for_name(value))
+            elif kind in ("term", "terms") and field_name == "applicationParentQualifiedName":
+                wanted = set()
+                for qualified_name in values:
+                    app_index = self.index_for_qualified_name(qualified_name)
+                    if app_index is not None and self.type_name(app_index) == "Application":
+                        first = self.field_start + (app_index - self.app_start) * self.fields_per_application
+                        wanted.update(range(first, first + self.fields_per_application))
+                if len(values) == 1 and wanted:
+                    candidates = _intersect(candidates, range(min(wanted), max(wanted) + 1))
+                else:
+                    candidates = _intersect(candidates, sorted(wanted))
+            elif kind == "range" and field_name == "__timestamp" and ("gte" in value or "gt" in value):
+                first = int(value["gte"]) if "gte" in value else int(value["gt"]) + 1
+                candidates = _intersect(candidates, range(first - BASE_TIMESTAMP, self.size))
+            else:
+                residual.append(clause)
+        return candidates, residual
+
+    # Mutations ------------------------------------------------------------
+
+    def save(self, entities):
+        """Create or update entities, returning an Atlan bulk mutation response."""
+        created, updated, assignments = [], [], {}
+        with self._lock:
+            self._match_cache.clear()
+            for entity in entities:
+                attributes = dict(entity.get("attributes") or {})
+                qn = attributes.get("qualifiedName")
+                index = self.index_for_qualified_name(qn)
+                if index is None:
+                    index = self._created_by_qn.get(qn)
+                header = {"typeName": entity.get("typeName")}
+
+                if index is not None and index < self.size:
+                    self._updates.setdefault(index, {}).update(attributes)
+                    header["guid"] = self.guid(index)
+                    updated.append(header)
+                elif index is not None:
+                    stored = self._created[index - self.size]
+                    stored["attributes"].update(attributes)
+                    header["guid"] = stored["guid"]
+                    updated.append(header)
+                else:
+                    guid = str(uuid.uuid4())
+                    index = self.size + len(self._created)
+                    self._created.append({
+                        "typeName": entity.get("typeName"),
+                        "guid": guid,
+                        "status": "ACTIVE",
+                        "attributes": attributes,
+                        "createTime": BASE_TIMESTAMP + index,
+                        "updateTime": BASE_TIMESTAMP + index,
+                    })
+                    if qn:
+                        self._created_by_qn[qn] = index
+                    header["guid"] = guid
+                    created.append(header)
+
+                if (entity.get("typeName") or "").endswith("Process"):
+                    for name, inverse in (("inputs", "inputToProcesses"), ("outputs", "outputFromProcesses")):
+                        if name in attributes:
+                            self._unlink(qn, inverse)
+                        for ref in attributes.get(name) or []:
+                            target = (ref.get("uniqueAttributes") or {}).get("qualifiedName")
+                            self._relations.setdefault(target, {}).setdefault(inverse, set()).add(qn)
+
+                header["attributes"] = {"qualifiedName": qn, "name": attributes.get("name")}
+                header["status"] = "ACTIVE"
+                if entity.get("guid"):
+                    assignments[entity["guid"]] = header["guid"]
+
+        mutated = {}
+        if created:
+            mutated["CREATE"] = created
+        if updated:
+            mutated["UPDATE"] = updated
+        return {"mutatedEntities": mutated, "guidAssignments": assignments}
+
+    def archive(self, guids):
+        """Archive (soft-delete) entities by GUID, returning an Atlan bulk mutation response."""
+        deleted = []
+        with self._lock:
+            self._match_cache.clear()
+            for guid in guids:
+                match = re.fullmatch(r"00000000-0000-4000-8000-(\d{12})", guid)
+                if match and int(match.group(1)) < self.size:
+                    self._archived.add(int(match.group(1)))
+                    entity = self.entity(int(match.group(1)), relations=False)
+                else:
+                    entity = next((stored for stored in self._created if stored["guid"] == guid), None)
+                    if entity is None:
+                        continue
+                    entity["status"] = "DELETED"
+                qn = entity["attributes"].get("qualifiedName")
+                if entity["typeName"].endswith("Process"):
+                    for inverse in ("inputToProcesses", "outputFromProcesses"):
+                        self._unlink(qn, inverse)
+                deleted.append({
+                    "typeName": entity["typeName"],
+                    "guid": guid,
+                    "status": "DELETED",
+                    "attributes": {"qualifiedName": qn, "name": entity["attributes"].get("name")},
+                })
+        return {"mutatedEntities": {"DELETE": deleted} if deleted else {}}
+
+    def _unlink(self, process_qn, inverse):
+        """Drop a process from the inverse lineage relationship of every asset (caller holds the lock)."""
+        for relations in self._relations.values():
+            relations.get(inverse, set()).discard(process_qn)
+
+    # Lineage ---------------------------------------------------------------
+
+    def lineage(self, guid, depth, downstream, offset, size, attributes=None):
+        """
+        List the assets within ``depth`` hops of a catalog asset.
+
+        Catalog lineage is a binary tree over asset indices: asset i feeds
+        assets 2i+1 and 2i+2, so every asset has one upstream asset (except the
+        first) and up to two downstream assets.
+
+        Returns:
+            Tuple of (entities of the requested page, whether there are more)
+        """
+        match = re.fullmatch(r"00000000-0000-4000-8000-(\d{12})", guid or "")
+        start = int(match.group(1)) if match else None
+        if start is None or start >= self.size:
+            return None, False
+        found = []
+        frontier = [start]
+        for _ in range(depth):
+            if downstream:
+                frontier = [child for i in frontier for child in (2 * i + 1, 2 * i + 2) if child < self.size]
+            else:
+                frontier = [(i - 1) // 2 for i in frontier if i > 0]
+            if not frontier or len(found) >= offset + size:
+                break
+            found.extend(frontier)
+        page = found[offset:offset + size]
+        return [_project(self.entity(i), attributes) for i in page], len(found) > offset + size
+
+    def entity_by_guid(self, guid):
+        match = re.fullmatch(r"00000000-0000-4000-8000-(\d{12})", guid)
+        if match and int(match.group(1)) < self.size:
+            return self.entity(int(match.group(1)))
+        with self._lock:
+            for entity in self._created:
+                if entity["guid"] == guid:
+                    return entity
+        return None
+
+
+def _intersect(candidates, other):
+    """Intersect two sorted index collections, keeping ranges as ranges."""
+    if isinstance(candidates, range) and isinstance(other, range):
+        start = max(candidates.start, other.start, 0)
+        return range(start, max(start, min(candidates.stop, other.stop)))
+    if isinstance(other, range):
+        candidates, other = other, candidates
+    if isinstance(candidates, range):
+        return [i for i in other if i in candidates]
+    wanted = set(other)
+    return [i for i in candidates if i in wanted]
+
+
+def _top_level_filters(query):
+    """Return the AND-ed clauses of a query (should/must_not parts are kept together as one clause)."""
+    if "bool" not in query:
+        return [query]
+    bool_query = query["bool"]
+    clauses = list(bool_query.get("filter") or []) + list(bool_query.get("must") or [])
+    if bool_query.get("should") or bool_query.get("must_not"):
+        # Evaluated per entity after narrowing on the other clauses
+        clauses.append({"bool": {
+            key: bool_query[key] for key in ("should", "must_not", "minimum_should_match") if key in bool_query
+        }})
+    return clauses
+
+
+def _field_name(name):
+    for suffix in (".keyword", ".text"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return name
+
+
+def _describe_clause(clause):
+    """Return (kind, field name, value) for term, terms and range clauses."""
+    for kind in ("term", "terms", "range"):
+        if kind in clause:
+            body = dict(clause[kind])
+            body.pop("boost", None)
+            field_name, value = next(iter(body.items()))
+            if kind == "term" and isinstance(value, dict):
+                value = value.get("value")
+            return kind, _field_name(field_name), value
+    return None, None, None
+
+
+def _entity_value(entity, field_name):
+    if field_name == "__typeName":
+        return entity.get("typeName")
+    if field_name == "__state":
+        return entity.get("status", "ACTIVE")
+    if field_name == "__guid":
+        return entity.get("guid")
+    if field_name == "__timestamp":
+        return entity.get("createTime")
+    return (entity.get("attributes") or {}).get(field_name)
+
+
+def _sorts_by_score(dsl):
+    sort = dsl.get("sort") or []
+    return bool(sort) and "_score" in sort[0]
+
+
+def _sort_field(dsl):
+    """Field the hits are sorted on, or None for catalog (GUID) order or relevance."""
+    sort = dsl.get("sort") or []
+    field_name = _field_name(next(iter(sort[0]))) if sort else None
+    return None if field_name in (None, "_score", "__guid") else field_name
+
+
+def _compile_scorer(query):
+    """
+    Crude relevance for ``_score`` sorting: the summed boosts of the matching
+    should clauses. Returns None if the query has none.
+    """
+    should = (query.get("bool") or {}).get("should") if isinstance(query, dict) else None
+    if not should:
+        return None
+    weighted = []
+    for clause in should:
+        body = next(iter(clause.values()))
+        options = next(iter(body.values())) if isinstance(body, dict) and body else None
+        boost = options.get("boost") if isinstance(options, dict) else None
+        weighted.append((_compile_query(clause), boost or 1.0))
+    return lambda entity: sum(boost for matcher, boost in weighted if matcher(entity))
+
+
+def _words(text):
+    # Like Elasticsearch's standard tokenizer, underscores join words
+    return re.findall(r"[a-z0-9_]+", str(text or "").lower())
+
+
+def _compile_query(query):
+    """Compile an Elasticsearch-style query into a predicate over entity JSON."""
+    if not query or "match_all" in query:
+        return lambda entity: True
+    if "bool" in query:
+        body = query["bool"]
+        required = [_compile_query(q) for q in (body.get("filter") or []) + (body.get("must") or [])]
+        excluded = [_compile_query(q) for q in body.get("must_not") or []]
+        optional = [_compile_query(q) for q in body.get("should") or []]
+        minimum = int(body.get("minimum_should_match", 1 if optional and not required else 0) or 0)
+
+        def match_bool(entity):
+            if not all(m(entity) for m in required):
+                return False
+            if any(m(entity) for m in excluded):
+                return False
+            return sum(1 for m in optional if m(entity)) >= minimum if optional else True
+        return match_bool
+
+    kind, field_name, value = _describe_clause(query)
+    if kind == "term":
+        case_insensitive = isinstance(query["term"], dict) and any(
+            isinstance(v, dict) and v.get("case_insensitive") for v in query["term"].values()
+        )
+        if case_insensitive:
+            return lambda entity: str(_entity_value(entity, field_name) or "").lower() == str(value).lower()
+        return lambda entity: _entity_value(entity, field_name) == value
+    if kind == "terms":
+        values = set(value)
+        return lambda entity: _entity_value(entity, field_name) in values
+    if kind == "range":
+        def match_range(entity):
+            actual = _entity_value(entity, field_name)
+            if actual is None:
+                return False
+            return all(
+                (op == "gte" and actual >= bound) or (op == "gt" and actual > bound)
+                or (op == "lte" and actual <= bound) or (op == "lt" and actual < bound)
+                for op, bound in value.items() if op in ("gte", "gt", "lte", "lt")
+            )
+        return match_range
+    if "exists" in query:
+        name = _field_name(query["exists"]["field"])
+        return lambda entity: _entity_value(entity, name) is not None
+    if "prefix" in query:
+        name, value = next(iter(query["prefix"].items()))
+        value = value.get("value") if isinstance(value, dict) else value
+        name = _field_name(name)
+        return lambda entity: str(_entity_value(entity, name) or "").startswith(value)
+    if "wildcard" in query:
+        name, value = next(iter(query["wildcard"].items()))
+        case_insensitive = isinstance(value, dict) and value.get("case_insensitive")
+        value = value.get("value") if isinstance(value, dict) else value
+        pattern = re.compile(
+            ".*".join(re.escape(part) for part in value.split("*")), re.IGNORECASE if case_insensitive else 0
+        )
+        name = _field_name(name)
+        return lambda entity: pattern.fullmatch(str(_entity_value(entity, name) or "")) is not None
+    if "match" in query:
+        # Analysed text match: any query word equals a word of the value (fuzziness is ignored)
+        name, value = next(iter(query["match"].items()))
+        value = value.get("query") if isinstance(value, dict) else value
+        words = set(_words(value))
+        name = _field_name(name)
+        return lambda entity: not words.isdisjoint(_words(_entity_value(entity, name)))
+    # Unsupported clauses match everything rather than hiding results
+    return lambda entity: True
+
+
+def _project(entity, attributes):
+    """Limit an entity's attributes to those requested (identity attributes are always kept)."""
+    if not attributes:
+        return entity
+    keep = set(attributes) | {"name", "qualifiedName"}
+    return {**entity, "attributes": {k: v for k, v in entity["attributes"].items() if k in keep}}
+
+
+class MockAtlanServer:
+    """Threaded HTTP server serving a MockCatalog; usable as a context manager."""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockAtlanConfig()
+        self.catalog = MockCatalog(self.config)
+        self.request_counts = {}
+        self._counts_lock = threading.Lock()
+        self._random = random.Random(42)
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def count_request(self, route):
+        with self._counts_lock:
+            self.request_counts[route] = self.request_counts.get(route, 0) + 1
+
+    def simulate_conditions(self):
+        """Sleep for the configured latency; return an injected failure status or None."""
+        delay = self.config.latency_ms + self._random.uniform(0, self.config.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if self.config.failure_rate and self._random.random() < self.config.failure_rate:
+            return self.config.failure_status
+        return None
+
+    # Route handlers return (status, body) --------------------------------
+
+    def handle_search(self, body):
+        count, entities, aggregations = self.catalog.search(body.get("dsl") or {}, body.get("attributes"))
+        response = {"queryId": str(uuid.uuid4()), "approximateCount": count, "searchParameters": body}
+        if entities:
+            response["entities"] = entities
+        if aggregations:
+            response["aggregations"] = aggregations
+        return 200, response
+
+    def handle_bulk_save(self, body):
+        return 200, self.catalog.save(body.get("entities") or [])
+
+    def handle_archive(self, params):
+        return 200, self.catalog.archive(params.get("guid") or [])
+
+    def handle_entity_by_guid(self, guid):
+        entity = self.catalog.entity_by_guid(guid)
+        if entity is None:
+            return 404, {"errorCode": "ATLAS-404-00-005", "errorMessage": f"Given instance guid {guid} is invalid/not found"}
+        return 200, {"entity": entity, "referredEntities": {}}
+
+    def handle_lineage_list(self, body):
+        entities, has_more = self.catalog.lineage(
+            body.get("guid"),
+            int(body.get("depth") or 1),
+            body.get("direction") != "INPUT",
+            int(body.get("from") or 0),
+            int(body.get("size") or 10),
+            body.get("attributes"),
+        )
+        if entities is None:
+            return 404, {"errorCode": "ATLAS-404-00-005", "errorMessage": f"Given instance guid {body.get('guid')} is invalid/not found"}
+        return 200, {"entities": entities, "hasMore": has_more}
+
+    def _tag_defs(self):
+        return [
+            {
+                "category": "CLASSIFICATION",
+                "guid": str(uuid.UUID(int=i + 1)),
+                "name": f"tag{i:04d}hash",
+                "displayName": tag_name,
+                "description": f"Mock tag {tag_name}",
+                "attributeDefs": [],
+                "superTypes": [],
+                "entityTypes": [],
+                "subTypes": [],
+                "options": {"color": "Green", "iconType": "icon"},
+            }
+            for i, tag_name in enumerate(self.config.tags)
+        ]
+
+    def handle_typedefs(self, params):
+        tag_defs = self._tag_defs()
+        # pyatlan's tag cache requires struct definitions alongside the tags
+        struct_defs = [{"category": "STRUCT", "name": "SourceTagAttachment", "attributeDefs": []}]
+        type_filter = ",".join(params.get("type", [])).lower()
+        if type_filter and "classification" not in type_filter:
+            tag_defs = []
+        if type_filter and "struct" not in type_filter:
+            struct_defs = []
+        return 200, {
+            "classificationDefs": tag_defs,
+            "entityDefs": [],
+            "enumDefs": [],
+            "structDefs": struct_defs,
+            "relationshipDefs": [],
+            "businessMetadataDefs": [],
+        }
+
+    def handle_typedef_by_name(self, name):
+        for tag_def in self._tag_defs():
+            if tag_def["name"] == name:
+                return 200, tag_def
+        return 404, {"errorCode": "ATLAS-404-00-007", "errorMessage": f"Given typename {name} was invalid"}
+
+    def handle_users(self, params):
+        return 200, _filtered_records(params, [
+            {
+                "id": str(uuid.UUID(int=10_000 + i)),
+                "username": f"user{i}",
+                "email": f"user{i}@example.com",
+                "firstName": "User",
+                "lastName": str(i),
+                "enabled": True,
+            }
+            for i in range(self.config.users)
+        ])
+
+    def handle_groups(self, params):
+        return 200, _filtered_records(params, [
+            {
+                "id": str(uuid.UUID(int=20_000 + i)),
+                "name": f"group_{i}",
+                "alias": f"Group {i}",
+                "path": f"/group_{i}",
+                "attributes": {},
+            }
+            for i in range(self.config.groups)
+        ])
+
+    def handle_current_user(self):
+        return 200, {"id": str(uuid.UUID(int=10_000)), "username": "user0", "email": "user0@example.com"}
+
+
+def _filtered_records(params, records):
+    """Page user or group records, applying a ``{"field": {"$in": [...]}}`` filter if given."""
+    limit = int(params.get("limit", ["20"])[0])
+    offset = int(params.get("offset", ["0"])[0])
+    total = len(records)
+    for field_name, condition in json.loads(params.get("filter", ["{}"])[0] or "{}").items():
+        if isinstance(condition, dict) and "$in" in condition:
+            wanted = set(condition["$in"])
+            records = [record for record in records if record.get(field_name) in wanted]
+    return {"totalRecord": total, "filterRecord": len(records), "records": records[offset:offset + limit]}
+
+
+def _make_handler(server):
+    """Build the request handler class bound to a MockAtlanServer."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            return json.loads(raw) if raw else {}
+
+        def _send(self, status, body, headers=None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _dispatch(self, method):
+            parsed = urlparse(self.path)
+            path = parsed.path.rstrip("/")
+            params = parse_qs(parsed.query)
+            body = self._read_json() if method == "POST" else {}
+
+            routes = {
+                ("POST", "/api/meta/search/indexsearch"): ("search", lambda: server.handle_search(body)),
+                ("POST", "/api/meta/entity/bulk"): ("bulk_save", lambda: server.handle_bulk_save(body)),
+                ("DELETE", "/api/meta/entity/bulk"): ("archive", lambda: server.handle_archive(params)),
+                ("POST", "/api/meta/lineage/list"): ("lineage_list", lambda: server.handle_lineage_list(body)),
+                ("GET", "/api/meta/types/typedefs"): ("typedefs", lambda: server.handle_typedefs(params)),
+                ("GET", "/api/service/users"): ("users", lambda: server.handle_users(params)),
+                ("GET", "/api/service/users/current"): ("current_user", server.handle_current_user),
+                ("GET", "/api/service/v2/groups"): ("groups", lambda: server.handle_groups(params)),
+                ("GET", "/api/service/groups"): ("groups", lambda: server.handle_groups(params)),
+            }
+            route = routes.get((method, path))
+            if route is None and method == "GET" and path.startswith("/api/meta/types/typedef/name/"):
+                type_name = path.rsplit("/", 1)[-1]
+                route = ("typedef_by_name", lambda: server.handle_typedef_by_name(type_name))
+            if route is None and method == "GET" and path.startswith("/api/meta/entity/guid/"):
+                guid = path.rsplit("/", 1)[-1]
+                route = ("entity_by_guid", lambda: server.handle_entity_by_guid(guid))
+            if route is None:
+                server.count_request("not_found")
+                self._send(404, {"errorCode": "ATLAS-404-00-000", "errorMessage": f"No mock for {method} {path}"})
+                return
+
+            name, handler = route
+            server.count_request(name)
+            failure = server.simulate_conditions()
+            if failure is not None:
+                headers = {"Retry-After": str(server.config.retry_after)} if failure == 429 else None
+                self._send(failure, {"errorCode": f"ATLAS-{failure}-00-000", "errorMessage": "Injected failure"}, headers)
+                return
+            status, response = handler()
+            self._send(status, response)
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def do_DELETE(self):
+            self._dispatch("DELETE")
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local mock of the Atlan REST API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    parser.add_argument("--fields-per-application", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--max-page-size", type=int, default=300)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=429)
+    args = parser.parse_args()
+
+    config = MockAtlanConfig(
+        catalog_size=args.catalog_size,
+        fields_per_application=args.fields_per_application,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        max_page_size=args.max_page_size,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+    )
+    server = MockAtlanServer(config, host=args.host, port=args.port)
+    print(f"Mock Atlan serving {server.catalog.size} assets at {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Configuration settings for the Atlan Asset Builder application.
 """
 
 import logging
+import os
 
 # Logging configuration
 LOGGING_LEVEL = logging.DEBUG
@@ -16,16 +17,115 @@ DEFAULT_PAGE_SIZE = 100
 MAX_SEARCH_RESULTS = 50
 MAX_CONNECTIONS_TO_FETCH = 20
 MAX_SEARCH_ITERATIONS = 50  # Prevent infinite loops
+CONNECTIONS_CACHE_TTL = 300  # Seconds the connection list is cached per tenant
+SEARCH_DEADLINE_SECONDS = 5.0  # Asset searches return partial results after this long
+SEARCH_PAGE_BUDGET = 20  # Pages an asset search scans before offering "more"
+SEARCH_FACETS = ("type", "connection")  # Aggregations returned with the first page of an asset search
+SEARCH_FACET_SIZE = 10  # Values shown per facet
+NAME_MATCH_MIN_SCORE = 0.4  # Lowest fuzzy match score (0-1) shown in search results
+NAME_MATCH_MIN_SHARED_TRIGRAMS = 0.34  # Share of the query's trigrams a name needs to be scored
+NAME_MATCH_MAX_FUZZY_CANDIDATES = 300  # Names checked for typos/abbreviations per query
+APPLICATION_SEARCH_MAX_CANDIDATES = 300  # Best server-side matches ranked per application search
+
+# Warm-up on connect configuration
+WARMUP_MAX_WORKERS = 4  # Concurrent background lookups across all tenants
+WARMUP_MIN_INTERVAL = 60  # Seconds before the same tenant is warmed up again
+ASSET_NAME_INDEX_ENABLED = os.environ.get("ATLAN_ASSET_NAME_INDEX", "") in ("1", "true")  # Bootstrap the name index
+ASSET_NAME_INDEX_MAX_ASSETS = 50000  # Larger catalogs are searched in Atlan instead
+ASSET_NAME_INDEX_PAGE_SIZE = 300  # Assets fetched per page while bootstrapping
+ASSET_NAME_INDEX_TTL = 600  # Seconds before the index is considered stale
+
+# Update-mode field prefetch configuration
+FIELD_PREFETCH_TOP_HITS = 3  # Application search hits whose fields are prefetched
+FIELD_PREFETCH_MAX_APPLICATIONS = 32  # Applications kept in the LRU across all tenants
+FIELD_PREFETCH_TTL = 120  # Seconds prefetched fields are served before being fetched again
+FIELD_PREFETCH_MAX_WORKERS = 2  # Concurrent background prefetches across all tenants
+
+# Update-mode state loader configuration
+STATE_LOADER_MAX_WORKERS = 4  # Concurrent requests while loading an application for update
+STATE_FIELD_PAGE_SIZE = 300  # Fields fetched per concurrent page
+STATE_FIELD_MAX_OFFSET = 10000  # Atlan's search window; applications with more fields are paged in order
+
+# Explorer configuration
+EXPLORER_PAGE_SIZE = 50  # Children fetched per page at each level of the explorer tree
+
+# Lineage impact preview configuration
+IMPACT_DEFAULT_DEPTH = 3  # Lineage hops walked by default
+IMPACT_MAX_DEPTH = 10  # Deepest walk the preview offers
+IMPACT_MAX_NODES = 500  # Assets found before the walk stops early
+IMPACT_MAX_WORKERS = 8  # Concurrent lineage requests per hop (still bounded by the interactive lane)
+IMPACT_CACHE_TTL = 300  # Seconds an asset's lineage neighbours are reused
+IMPACT_CACHE_MAX_ENTRIES = 10000  # Assets whose neighbours are kept across all tenants
+
+# User, group and tag resolution configuration
+IDENTITY_MISS_TTL = 60  # Seconds an unknown username, group or tag is not looked up again
+
+# Request coalescing (single-flight) configuration
+SINGLE_FLIGHT_RESULT_TTL = 2.0  # Seconds a completed read is shared with late arrivals
+SINGLE_FLIGHT_MAX_ENTRIES = 1024  # Completed results kept before expired ones are purged
+
+# Per-tenant rate limiting configuration (Atlan allows 1800 requests per minute)
+RATE_LIMIT_LANES = {
+    "interactive": {"rate": 20.0, "burst": 40, "concurrency": 8},  # Searches and single saves
+    "bulk": {"rate": 10.0, "burst": 10, "concurrency": 4},  # Batch writes
+}
+RATE_LIMIT_MIN_FACTOR = 0.1  # Lowest fraction of the configured rate after repeated 429s
+RATE_LIMIT_RECOVERY_STEP = 0.05  # Rate fraction restored per successful response
+RATE_LIMIT_DEFAULT_BACKOFF = 2.0  # Seconds to pause on 429 without a Retry-After header
+RATE_LIMIT_MAX_RETRIES = 3  # Retries of an HTTP request answered with 429
+
+# Tracing configuration
+TRACING_EXPORTER = os.environ.get("ATLAN_TRACING_EXPORTER", "")  # "console", "file" or empty to disable
+TRACING_FILE_PATH = os.environ.get("ATLAN_TRACING_FILE", "traces.jsonl")  # OTLP/JSON output of the file exporter
+TRACING_SERVICE_NAME = "atlan-asset-builder"  # service.name resource attribute
+
+# Performance dashboard configuration
+METRICS_ENABLED = os.environ.get("ATLAN_METRICS_ENABLED", "0") == "1"  # Record dashboard metrics from startup (admins can also switch them on)
+METRICS_RING_SIZE = 10000  # Latency samples kept in memory
+METRICS_WINDOW_SECONDS = 900  # Rolling window for dashboard percentiles
+ACTIVE_SESSION_WINDOW_SECONDS = 300  # Sessions that reran within this window count as active
+
+# HTTP record/replay (cassette) configuration
+CASSETTE_MODE = os.environ.get("ATLAN_CASSETTE_MODE", "")  # "record", "replay" or empty for live traffic
+CASSETTE_PATH = os.environ.get("ATLAN_CASSETTE_PATH", "atlan_cassette.jsonl")  # Recorded request/response pairs
+CASSETTE_TIME_SCALE = float(os.environ.get("ATLAN_CASSETTE_TIME_SCALE", "1.0"))  # Replay delay multiplier (0 = none)
+
+# Per-rerun profiler configuration
+PROFILER_ENABLED = os.environ.get("ATLAN_PROFILE", "") in ("1", "true")  # Profile every rerun
+PROFILER_QUERY_PARAM_ENABLED = os.environ.get("ATLAN_PROFILE_QUERY_PARAM", "") in ("1", "true")  # Allow ?profile=1
+PROFILE_OUTPUT_DIR = os.environ.get("ATLAN_PROFILE_DIR", "profiles")  # Where .prof files are written
+PROFILE_MAX_FILES = 50  # Newest .prof files kept; older ones are deleted
+PROFILE_TOP_FUNCTIONS = 25  # Functions listed in the sidebar panel
 
 # Application workflow configuration
 FIELD_BATCH_SIZE = 20  # For ApplicationField batch operations
+FIELD_TAG_BATCH_SIZE = 200  # Fields sharing a tag set appended per request
+COLUMN_LINEAGE_BATCH_SIZE = 100  # Column-level lineage processes saved per request
+COLUMN_LINEAGE_MAX_COLUMNS = 20000  # Columns of the selected assets scanned when matching by name
+BULK_WRITER_MAX_WORKERS = 4  # Concurrent bulk-write requests (still bounded by the bulk lane)
+
+# Pre-submission validation configuration
+VALIDATION_TERMS_BATCH_SIZE = 1000  # Qualified names resolved per terms query
+
+# OpenAPI / JSON Schema field import configuration
+SCHEMA_IMPORT_CHUNK_SIZE = 64 * 1024  # Bytes read from the spec at a time
+
+# Offline drafts and queued submission configuration
+DRAFTS_DIR = os.environ.get("ATLAN_DRAFTS_DIR", "drafts")  # Where drafts are saved, one gzipped JSON file each
+DRAFT_BROWSER_QUERY_PARAM = "drafts"  # URL parameter identifying a browser's drafts saved before connecting
+REPLAY_BATCH_SIZE = 100  # Assets saved per request when queued drafts are submitted together
+
+# Multi-tenant publishing configuration
+FANOUT_MAX_WORKERS = 4  # Tenants an application is published to at the same time
 
 # Session state keys that should persist across workflow restarts
 PERSISTENT_SESSION_KEYS = [
     "client", 
     "user", 
     "atlan_url", 
-    "atlan_api_token"
+    "atlan_api_token",
+    "page",
+    "tenant_clients",
 ]
 
 # UI Configuration
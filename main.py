@@ -11,17 +11,41 @@ Features:
 - Update existing Application assets
 - Add enrichment details (descriptions, owners, tags)
 - Define relationships and lineage
+- Browse connections, applications and fields in a lazily loaded explorer
+- Save drafts locally (also offline) and submit queued drafts together
 - Automatic client reconnection handling
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from ui.components.sidebar import render_sidebar
 from ui.pages.operation_selection import step0_choose_operation
-from ui.pages.application_selection import step1_select_existing_application
-from ui.pages.asset_definition import step1_define_asset
-from ui.pages.enrichment import step2_enrich_asset
-from ui.pages.relationships import step3_relationships_and_submit
+from ui.pages.performance_dashboard import render_performance_dashboard
 from utils.session_state import clear_workflow_state
+from utils.drafts import autosave_session_draft
+from utils.profiler import profile_rerun
+from utils.lazy_imports import preload_in_background, load_attribute
+from services.atlan_client import get_tenant_key
+from services.tracing import span
+from services.metrics import record_session_activity
+
+BUILDER_PAGE = "🤖 Asset Builder"
+EXPLORER_PAGE = "🗂️ Explorer"
+DRAFTS_PAGE = "📝 Drafts"
+DASHBOARD_PAGE = "📈 Performance Dashboard (admin)"
+
+# Steps after step 0 import pyatlan's asset models, so their modules are loaded on first use
+STEP_MODULES = {
+    "step1_select_existing_application": "ui.pages.application_selection",
+    "step1_define_asset": "ui.pages.asset_definition",
+    "step2_enrich_asset": "ui.pages.enrichment",
+    "step3_relationships_and_submit": "ui.pages.relationships",
+}
+
+
+def load_step(step_name):
+    """Import a wizard step's page module on first use and return the step function."""
+    return load_attribute(STEP_MODULES[step_name], step_name)
 
 
 def main():
@@ -34,24 +58,62 @@ def main():
     
     st.title("🤖 Atlan Asset Builder")
 
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        record_session_activity(ctx.session_id)
+
     # Render sidebar for Atlan connection
     client = render_sidebar()
+
+    page = st.sidebar.radio("Page", (BUILDER_PAGE, EXPLORER_PAGE, DRAFTS_PAGE, DASHBOARD_PAGE), key="page")
+    if page == DASHBOARD_PAGE:
+        render_performance_dashboard()
+        return
+
+    if page == DRAFTS_PAGE:
+        # Imports the mutation queue (and with it pyatlan's asset models), so it is loaded on first use
+        render_drafts = load_attribute("ui.pages.drafts", "render_drafts")
+        render_drafts(client, BUILDER_PAGE)
+        return
     
     if client is None:
-        st.info("Please connect to your Atlan instance using the sidebar to begin.")
+        # Warm up pyatlan while the user enters their credentials
+        preload_in_background()
+        if page == EXPLORER_PAGE:
+            st.info("Please connect to your Atlan instance using the sidebar to begin.")
+            return
+        st.info(
+            "Working offline: connect to your Atlan instance using the sidebar to search and submit. "
+            f"Your progress is saved as a draft ({DRAFTS_PAGE}) that can be queued for submission."
+        )
+
+    if page == EXPLORER_PAGE:
+        # Imports pyatlan's search models, so it is loaded on first use like the wizard steps
+        render_explorer = load_attribute("ui.pages.explorer", "render_explorer")
+        with span("wizard.render_explorer", **{"wizard.step": "render_explorer", "atlan.tenant": get_tenant_key(client)}):
+            render_explorer(client)
         return
 
     # State-based navigation through the workflow
     if "operation_type" not in st.session_state:
-        step0_choose_operation()
+        step, step_args = step0_choose_operation, ()
     elif st.session_state.get("operation_type") == "Update an existing Application" and "selected_application" not in st.session_state:
-        step1_select_existing_application(client)
+        step, step_args = load_step("step1_select_existing_application"), (client,)
     elif "asset_details" not in st.session_state:
-        step1_define_asset(client)
+        step, step_args = load_step("step1_define_asset"), (client,)
     elif "enrichment_details" not in st.session_state:
-        step2_enrich_asset(client)
+        step, step_args = load_step("step2_enrich_asset"), (client,)
+    else:
+        step, step_args = load_step("step3_relationships_and_submit"), (client,)
+
+    if client is None and step.__name__ == "step1_select_existing_application":
+        st.warning("Connect to Atlan to pick the application to update, or resume an update draft.")
     else:
-        step3_relationships_and_submit(client)
+        # Time each step render, including the Atlan calls it makes
+        with span(f"wizard.{step.__name__}", **{"wizard.step": step.__name__, "atlan.tenant": get_tenant_key(client)}):
+            step(*step_args)
+    # Save progress to the session's draft (only written when something changed)
+    autosave_session_draft()
 
     # Always show start over button at the bottom
     st.markdown("---")
@@ -61,4 +123,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Opt-in cProfile of the whole rerun (ATLAN_PROFILE=1, or ?profile=1 when ATLAN_PROFILE_QUERY_PARAM=1)
+    with profile_rerun():
+        main() 
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+One-round-trip loading of an existing application for update mode.
+
+The application is fetched in one search together with its owners, tags,
+owned assets and the lineage processes it takes part in, while its fields
+are fetched as concurrent pages (the first page tells how many follow).
+The processes' inputs and outputs are then resolved in one more search, so
+the wizard opens with the enrichment and relationship steps pre-populated.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.assets import Application, Asset
+from pyatlan.model.enums import SortOrder
+from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
+from services.atlan_client import execute_with_auto_reconnect
+from services.asset_service import (
+    application_fields_search, application_field_dict, direct_tag_names, fetch_application_fields,
+    asset_display_names,
+)
+from services.field_prefetch import get_prefetched_fields
+from config.settings import STATE_LOADER_MAX_WORKERS, STATE_FIELD_PAGE_SIZE, STATE_FIELD_MAX_OFFSET
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=STATE_LOADER_MAX_WORKERS, thread_name_prefix="atlan-state")
+
+
+def _fetch_application_core(client: AtlanClient, app_qualified_name: str):
+    """Fetch an application with its owners, tags and relationships (related assets by name)."""
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(Application))
+        .where(CompoundQuery.active_assets())
+        .where(Asset.QUALIFIED_NAME.eq(app_qualified_name))
+        .page_size(1)
+        .include_on_results(Asset.NAME)
+        .include_on_results(Asset.QUALIFIED_NAME)
+        .include_on_results(Asset.DESCRIPTION)
+        .include_on_results(Application.APP_ID)
+        .include_on_results(Asset.CONNECTION_QUALIFIED_NAME)
+        .include_on_results(Asset.OWNER_USERS)
+        .include_on_results(Asset.OWNER_GROUPS)
+        .include_on_results(Application.APPLICATION_OWNED_ASSETS)
+        .include_on_results(Application.INPUT_TO_PROCESSES)
+        .include_on_results(Application.OUTPUT_FROM_PROCESSES)
+        .include_on_relations(Asset.NAME)
+        .include_on_relations(Asset.QUALIFIED_NAME)
+    ).to_request()
+    page = client.asset.search(request).current_page()
+    return page[0] if page else None
+
+
+def _fetch_field_page_core(client: AtlanClient, app_qualified_name: str, offset: int):
+    """Fetch one page of an application's fields, in a stable order so pages can be fetched concurrently."""
+    request = (
+        application_fields_search(app_qualified_name)
+        .sort(Asset.QUALIFIED_NAME.order(SortOrder.ASCENDING))
+        .page_size(STATE_FIELD_PAGE_SIZE)
+    ).to_request()
+    request.dsl.from_ = offset
+    results = client.asset.search(request)
+    return [application_field_dict(field) for field in results.current_page()], results.count
+
+
+def _fetch_processes_core(client: AtlanClient, guids):
+    """Fetch lineage processes with their inputs and outputs (related assets by name)."""
+    request = (
+        FluentSearch()
+        .where(Asset.GUID.within(list(guids)))
+        .where(CompoundQuery.active_assets())
+        .page_size(len(guids))
+        .include_on_results(Asset.NAME)
+        .include_on_results(Asset.QUALIFIED_NAME)
+        # pyatlan has no search fields for a process's inputs and outputs, so they are named directly
+        .include_on_results("inputs")
+        .include_on_results("outputs")
+        .include_on_relations(Asset.NAME)
+        .include_on_relations(Asset.QUALIFIED_NAME)
+    ).to_request()
+    return list(client.asset.search(request).current_page())
+
+
+def _submit(operation_func, client, *args):
+    return _executor.submit(execute_with_auto_reconnect, operation_func, client, *args)
+
+
+def _load_fields(client, app_qualified_name, first_page):
+    """Fetch the pages after the first one concurrently; past Atlan's search window, page in order instead."""
+    result = first_page.result()
+    if result is None:
+        return None
+    fields, count = result
+    if count > STATE_FIELD_MAX_OFFSET:
+        return fetch_application_fields(client, app_qualified_name)
+    pages = [
+        _submit(_fetch_field_page_core, client, app_qualified_name, offset)
+        for offset in range(len(fields), count, STATE_FIELD_PAGE_SIZE)
+    ] if fields else []
+    for page in pages:
+        result = page.result()
+        if result is None:
+            return None
+        fields.extend(result[0])
+    return fields
+
+
+def _lineage_assets(processes, app_guid):
+    """
+    The upstream and downstream assets of the application, and a summary of each of its lineage processes.
+
+    A process summary is a dict with its "direction" ("upstream" when the
+    application is among its outputs, "downstream" when among its inputs),
+    "guid", "qualified_name", "name", the qualified names of the "assets" on
+    the other side, and whether it is "shared" with assets other than the
+    application on the application's side (so is not the application's own).
+    """
+    upstream, downstream, summaries = [], [], []
+    for process in processes:
+        inputs = getattr(process, 'inputs', None) or []
+        outputs = getattr(process, 'outputs', None) or []
+        for direction, own_side, other_side, found in (
+            ("upstream", outputs, inputs, upstream), ("downstream", inputs, outputs, downstream),
+        ):
+            if not any(asset.guid == app_guid for asset in own_side):
+                continue
+            assets = [asset for asset in other_side if asset.guid != app_guid]
+            found.extend(assets)
+            summaries.append({
+                "direction": direction,
+                "guid": process.guid,
+                "qualified_name": process.qualified_name,
+                "name": process.name,
+                "assets": [asset.qualified_name for asset in assets],
+                "shared": any(asset.guid != app_guid for asset in own_side),
+            })
+    return asset_display_names(upstream), asset_display_names(downstream), summaries
+
+
+def load_application_state(client: AtlanClient, app_qualified_name: str):
+    """
+    Load everything update mode edits about an application.
+
+    Fields prefetched in the background are reused instead of being fetched again.
+
+    Args:
+        client: AtlanClient instance
+        app_qualified_name: Qualified name of the application
+
+    Returns:
+        Dict with the "application", its "fields" (field editor dicts), "owner_users",
+        "owner_groups", "tag_names", and "owned_assets", "lineage_inputs" and
+        "lineage_outputs" (each keyed by relationship picker display name),
+        and "lineage_processes" (see ``_lineage_assets``), or None if the application could not be loaded
+    """
+    application = _submit(_fetch_application_core, client, app_qualified_name)
+    prefetched = get_prefetched_fields(client, app_qualified_name)
+    first_page = None if prefetched is not None else _submit(_fetch_field_page_core, client, app_qualified_name, 0)
+
+    try:
+        app = application.result()
+        if app is None:
+            return None
+        process_guids = {
+            process.guid
+            for process in (app.input_to_processes or []) + (app.output_from_processes or [])
+            if process.guid
+        }
+        processes = _submit(_fetch_processes_core, client, process_guids) if process_guids else None
+        fields = [dict(field) for field in prefetched] if prefetched is not None else _load_fields(client, app_qualified_name, first_page)
+        lineage_inputs, lineage_outputs, lineage_processes = _lineage_assets((processes.result() or []) if processes else [], app.guid)
+    except Exception:
+        logger.exception("Could not load application %s", app_qualified_name)
+        return None
+    if fields is None:
+        return None
+
+    return {
+        "application": app,
+        "fields": fields,
+        "owner_users": sorted(app.owner_users or ()),
+        "owner_groups": sorted(app.owner_groups or ()),
+        "tag_names": direct_tag_names(app),
+        "owned_assets": asset_display_names(app.application_owned_assets or []),
+        "lineage_inputs": lineage_inputs,
+        "lineage_outputs": lineage_outputs,
+        "lineage_processes": lineage_processes,
+    }
@@ -0,0 +1,146 @@
+"""
+Tenant- and token-scoped in-memory index of asset names for relationship search.
+
+The index is bootstrapped in the background after connecting (when enabled)
+by paging through active assets with only their name, qualified name and
+type. If the whole catalog fits within the configured limit, asset searches
+are answered from memory instead of scanning Atlan; otherwise the index is
+marked incomplete and searches keep going to Atlan.
+"""
+
+import threading
+import time
+
+from config.settings import ASSET_NAME_INDEX_MAX_ASSETS, ASSET_NAME_INDEX_PAGE_SIZE, ASSET_NAME_INDEX_TTL
+from services.atlan_client import execute_with_auto_reconnect, get_cache_scope
+from services.rate_limiter import get_tenant_limiter, BULK_LANE
+from services.write_through import register_write_hook
+from utils.compact_state import AssetRef
+from utils.name_matching import NameRanker
+
+
+class AssetNameIndex:
+    """Asset references with a fuzzy name ranker built on first search."""
+
+    __slots__ = ("scope", "refs", "complete", "built_at", "_ranker", "_ranker_lock")
+
+    def __init__(self, scope, refs, complete, built_at=None):
+        self.scope = scope  # Cache scope (tenant and API token) the assets were listed with
+        self.refs = refs
+        self.complete = complete
+        self.built_at = time.monotonic() if built_at is None else built_at
+        self._ranker = None
+        self._ranker_lock = threading.Lock()
+
+    def is_fresh(self):
+        return time.monotonic() - self.built_at < ASSET_NAME_INDEX_TTL
+
+    def ranker(self):
+        """The NameRanker over all indexed assets, built once per index copy."""
+        with self._ranker_lock:
+            if self._ranker is None:
+                self._ranker = NameRanker(self.refs)
+            return self._ranker
+
+    def search(self, search_term, limit):
+        """
+        Find the assets whose names best match the search term.
+
+        Args:
+            search_term: Name, fragment, abbreviation or misspelling
+            limit: Maximum number of results
+
+        Returns:
+            List of AssetRef, best match first
+        """
+        return [ref for _, ref in self.ranker().rank(search_term, limit)]
+
+    def with_upserts(self, refs):
+        """
+        Copy the index with assets added or, matched on qualified name, replaced.
+
+        Readers keep using the old copy until the new one is swapped in.
+
+        Args:
+            refs: AssetRef of written assets; those without a name are ignored
+
+        Returns:
+            A new AssetNameIndex with the same build time
+        """
+        updates = {ref.qualified_name: ref for ref in refs if ref.name}
+        merged = []
+        for ref in self.refs:
+            update = updates.pop(ref.qualified_name, None)
+            if update is None:
+                merged.append(ref)
+            else:
+                # Writes reported without a GUID keep the one already indexed
+                merged.append(AssetRef(update.guid or ref.guid, update.qualified_name, update.type_name, update.name))
+        merged.extend(updates.values())
+        return AssetNameIndex(self.scope, merged, self.complete, self.built_at)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _build_asset_name_index_core(client, scope):
+    """Page through active assets, keeping only identifying attributes."""
+    from pyatlan.model.assets import Asset
+    from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
+
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.active_assets())
+        .page_size(ASSET_NAME_INDEX_PAGE_SIZE)
+        .include_on_results(Asset.NAME)
+        .include_on_results(Asset.QUALIFIED_NAME)
+    ).to_request()
+
+    refs = []
+    complete = True
+    for asset in client.asset.search(request):
+        if len(refs) >= ASSET_NAME_INDEX_MAX_ASSETS:
+            complete = False
+            break
+        if getattr(asset, "name", None):
+            refs.append(AssetRef.from_asset(asset))
+    index = AssetNameIndex(scope, refs, complete)
+    index.ranker()  # Build it here, in the background, rather than on the first search
+    return index
+
+
+def build_asset_name_index(client):
+    """
+    Build (or rebuild) the asset-name index for the client's tenant and API token in the bulk lane.
+
+    Returns:
+        The new AssetNameIndex, or None if the build failed
+    """
+    scope = get_cache_scope(client)
+    with get_tenant_limiter(scope[0]).slot(BULK_LANE):
+        index = execute_with_auto_reconnect(_build_asset_name_index_core, client, scope)
+    if index is not None:
+        with _indexes_lock:
+            _indexes[scope] = index
+    return index
+
+
+def get_asset_name_index(client):
+    """Get the index of the client's tenant and API token if it is complete and fresh, otherwise None."""
+    with _indexes_lock:
+        index = _indexes.get(get_cache_scope(client))
+    if index is not None and index.complete and index.is_fresh():
+        return index
+    return None
+
+
+def _upsert_written_assets(scope, refs):
+    """Write hook: make saved assets searchable by their writer without waiting for a rebuild."""
+    with _indexes_lock:
+        index = _indexes.get(scope)
+        if index is not None:
+            _indexes[scope] = index.with_upserts(refs)
+
+
+register_write_hook(_upsert_written_assets)
@@ -2,14 +2,32 @@
 Asset service module for handling Application and ApplicationField operations.
 """
 
+import time
+
 import streamlit as st
 from pyatlan.client.atlan import AtlanClient
 from pyatlan.client.asset import Batch
 from pyatlan.model.assets import Application, ApplicationField, Asset, Process
 from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
-from pyatlan.model.enums import CertificateStatus
-from services.atlan_client import execute_with_auto_reconnect
-from config.settings import DEFAULT_PAGE_SIZE, MAX_SEARCH_RESULTS, FIELD_BATCH_SIZE
+from pyatlan.model.search import Match, SortItem, Term, Wildcard
+from pyatlan.model.core import AtlanTag, AtlanTagName
+from pyatlan.errors import ErrorCode, InvalidRequestError
+from pyatlan.model.enums import CertificateStatus, SortOrder
+from services.atlan_client import execute_with_auto_reconnect, get_tenant_key, get_cache_scope
+from services.single_flight import atlan_reads
+from services.rate_limiter import get_tenant_limiter, BULK_LANE
+from services.tracing import span
+from services.asset_index import get_asset_name_index
+from services.field_prefetch import get_prefetched_fields
+from services.write_through import notify_assets_written, mutated_assets
+from services.identity_cache import TAGS, resolve_ids
+from services.bulk_writer import save_concurrently, chunked
+from utils.compact_state import AssetRef
+from utils.name_matching import NameRanker, tokenize
+from config.settings import (
+    DEFAULT_PAGE_SIZE, MAX_SEARCH_RESULTS, FIELD_BATCH_SIZE, SEARCH_DEADLINE_SECONDS, SEARCH_PAGE_BUDGET,
+    APPLICATION_SEARCH_MAX_CANDIDATES, SEARCH_FACETS, SEARCH_FACET_SIZE, FIELD_TAG_BATCH_SIZE,
+)
 
 
 def _search_applications_core(client: AtlanClient, search_term: str):
@@ -18,41 +36,54 @@ def _search_applications_core(client: AtlanClient, search_term: str):
         st.error("Client is not available for searching applications.")
         return {}
         
-    request = (
-        FluentSearch()
-        .where(CompoundQuery.asset_type(Application))
-        .where(CompoundQuery.active_assets())
-        .page_size(50)
-        .include_on_results(Asset.NAME)
-        .include_on_results(Asset.QUALIFIED_NAME)
-        .include_on_results(Asset.DESCRIPTION)
-        .include_on_results(Application.APP_ID)
-        .include_on_results(Asset.CONNECTION_QUALIFIED_NAME)
-    ).to_request()
-    
-    applications = {}
-    search_response = client.asset.search(request)
-    
-    # Filter results manually to match the search term
+    def build_request(by_relevance):
+        search = (
+            FluentSearch()
+            .where(CompoundQuery.asset_type(Application))
+            .where(CompoundQuery.active_assets())
+            .min_somes(1)
+            .page_size(DEFAULT_PAGE_SIZE)
+            .include_on_results(Asset.NAME)
+            .include_on_results(Asset.QUALIFIED_NAME)
+            .include_on_results(Asset.DESCRIPTION)
+            .include_on_results(Application.APP_ID)
+            .include_on_results(Asset.CONNECTION_QUALIFIED_NAME)
+        )
+        if by_relevance:
+            search = search.sort(SortItem("_score", order=SortOrder.DESCENDING))
+        for clause in _application_name_clauses(search_term):
+            search = search.where_some(clause)
+        return search.to_request()
+
+    # Atlan pre-selects and orders candidates by name and app_id; only the best of them are ranked locally
+    candidates = []
+    search_response, _ = _search_by_relevance(client, build_request)
     for app in search_response:
-        if (hasattr(app, 'name') and app.name and 
-            search_term.lower() in app.name.lower()):
-            display_name = f"{app.name}"
-            if hasattr(app, 'app_id') and app.app_id:
-                display_name += f" (ID: {app.app_id})"
-            if hasattr(app, 'description') and app.description:
-                display_name += f" - {app.description[:50]}..."
-            applications[display_name] = app
-            
-            if len(applications) >= 20:  # Limit results
+        if hasattr(app, 'name') and app.name:
+            candidates.append(app)
+            if len(candidates) >= APPLICATION_SEARCH_MAX_CANDIDATES:
                 break
     
+    # Rank by fuzzy name match, with exact app_id hits near the top
+    ranker = NameRanker(candidates, app_id=lambda app: getattr(app, 'app_id', None))
+    applications = {}
+    for _, app in ranker.rank(search_term, limit=20):  # Limit results
+        display_name = f"{app.name}"
+        if hasattr(app, 'app_id') and app.app_id:
+            display_name += f" (ID: {app.app_id})"
+        if hasattr(app, 'description') and app.description:
+            display_name += f" - {app.description[:50]}..."
+        applications[display_name] = app
+    
     return applications
 
 
 def search_applications(client: AtlanClient, search_term: str):
     """Search for existing Application assets with auto-reconnect."""
-    result = execute_with_auto_reconnect(_search_applications_core, client, search_term)
+    result = atlan_reads.do(
+        (get_cache_scope(client), "search_applications", search_term),
+        execute_with_auto_reconnect, _search_applications_core, client, search_term
+    )
     return result if result is not None else {}
 
 
@@ -62,70 +93,244 @@ def _load_existing_application_fields_core(client: AtlanClient, app_qualified_na
         st.warning("⚠️ Client is not available. You can still update the application, but existing fields won't be loaded.")
         return []
     
-    request = (
-        FluentSearch()
-        .where(CompoundQuery.asset_type(ApplicationField))
-        .where(CompoundQuery.active_assets())
-        .where(ApplicationField.APPLICATION_PARENT_QUALIFIED_NAME.eq(app_qualified_name))
-        .page_size(DEFAULT_PAGE_SIZE)
-        .include_on_results(Asset.NAME)
-        .include_on_results(Asset.QUALIFIED_NAME)
-        .include_on_results(Asset.DESCRIPTION)
-    ).to_request()
+    request = application_fields_search(app_qualified_name).page_size(DEFAULT_PAGE_SIZE).to_request()
     
     fields = []
     search_response = client.asset.search(request)
     
     for field in search_response:
-        field_data = {
-            "name": getattr(field, 'name', ''),
-            "type": getattr(field, 'application_field_type', ''),
-            "description": getattr(field, 'description', ''),
-            "qualified_name": getattr(field, 'qualified_name', ''),
-            "is_existing": True
-        }
-        fields.append(field_data)
-    
-    if fields:
-        st.success(f"✅ Loaded {len(fields)} existing fields from the application")
-    else:
-        st.info("ℹ️ No existing fields found for this application")
+        fields.append(application_field_dict(field))
     
     return fields
 
 
+def application_fields_search(app_qualified_name: str):
+    """Search for an application's active fields, with every attribute the field editor shows."""
+    return (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(ApplicationField))
+        .where(CompoundQuery.active_assets())
+        .where(ApplicationField.APPLICATION_PARENT_QUALIFIED_NAME.eq(app_qualified_name))
+        .include_on_results(Asset.NAME)
+        .include_on_results(Asset.QUALIFIED_NAME)
+        .include_on_results(Asset.DESCRIPTION)
+        .include_on_results(Asset.SUB_TYPE)
+    )
+
+
+def direct_tag_names(asset):
+    """Display names of the Atlan tags applied to an asset itself (propagated and deleted tags are left out)."""
+    deleted = AtlanTagName.get_deleted_sentinel()
+    return [
+        str(tag.type_name)
+        for tag in getattr(asset, 'atlan_tags', None) or []
+        if tag.type_name and tag.type_name != deleted and tag.entity_guid in (None, asset.guid)
+    ]
+
+
+def application_field_dict(field):
+    """Convert an ApplicationField search result into the dict edited by the field editor (its type is the subType)."""
+    return {
+        "name": getattr(field, 'name', '') or '',
+        "type": getattr(field, 'sub_type', '') or '',
+        "description": getattr(field, 'description', '') or '',
+        "qualified_name": getattr(field, 'qualified_name', '') or '',
+        "tags": direct_tag_names(field),
+        "is_existing": True
+    }
+
+
+def fetch_application_fields(client: AtlanClient, app_qualified_name: str):
+    """
+    Load existing ApplicationField assets without rendering anything.
+
+    Reads for the same application are coalesced, so a background prefetch
+    and a click on "Edit" that overlap share one search.
+
+    Returns:
+        List of field dicts, or None if the search failed
+    """
+    return atlan_reads.do(
+        (get_cache_scope(client), "load_existing_application_fields", app_qualified_name),
+        execute_with_auto_reconnect, _load_existing_application_fields_core, client, app_qualified_name
+    )
+
+
 def load_existing_application_fields(client: AtlanClient, app_qualified_name: str):
-    """Load existing ApplicationField assets with auto-reconnect."""
-    result = execute_with_auto_reconnect(_load_existing_application_fields_core, client, app_qualified_name)
+    """Load existing ApplicationField assets with auto-reconnect, using prefetched fields when available."""
+    result = get_prefetched_fields(client, app_qualified_name)
+    if result is None:
+        result = fetch_application_fields(client, app_qualified_name)
     if result is not None:
-        return result
+        if result:
+            st.success(f"✅ Loaded {len(result)} existing fields from the application")
+        else:
+            st.info("ℹ️ No existing fields found for this application")
+        # Shared with other readers, while the wizard edits its fields in place
+        return [dict(field) for field in result]
     else:
         st.warning("⚠️ You can still proceed to update the application, but existing fields cannot be loaded.")
         return []
 
 
-def _search_assets_direct_core(client: AtlanClient, search_term: str):
-    """Core asset search logic."""
-    request = (
+def asset_display_names(assets):
+    """Key assets by the name shown in the relationship pickers."""
+    return {f"{a.type_name}: {a.name}": a for a in assets if hasattr(a, 'name') and a.name}
+
+
+def _asset_name_clauses(search_term: str):
+    """
+    Server-side name clauses that pre-select candidates for fuzzy ranking,
+    boosted so that Atlan returns the likeliest matches first: the exact name,
+    substrings and analysed word matches (typo tolerant).
+    """
+    term = search_term.strip().replace("*", "").replace("?", "")
+    return [
+        Term(field=Asset.NAME.keyword_field_name, value=term, case_insensitive=True, boost=10.0),
+        Wildcard(field=Asset.NAME.keyword_field_name, value=f"*{term}*", case_insensitive=True, boost=3.0),
+        Match(field=Asset.NAME.text_field_name, query=term, fuzziness="AUTO"),
+    ]
+
+
+def _application_name_clauses(search_term: str):
+    """
+    Name clauses of an application search: those of an asset search, the
+    exact ``app_id``, and substrings of each word of the query (for
+    abbreviations such as "ord serv" or "ordersvc").
+    """
+    term = search_term.strip().replace("*", "").replace("?", "")
+    clauses = _asset_name_clauses(term)
+    clauses.append(Term(field=Application.APP_ID.elastic_field_name, value=term, case_insensitive=True, boost=10.0))
+    for token in dict.fromkeys(token for token in tokenize(term) if len(token) >= 2):
+        clauses.append(Wildcard(field=Asset.NAME.keyword_field_name, value=f"*{token[:3]}*", case_insensitive=True))
+    return clauses
+
+
+def _search_by_relevance(client: AtlanClient, build_request):
+    """
+    Run a search sorted by relevance, falling back to creation order.
+
+    Atlan can only page through more than 100,000 hits in creation order, and
+    pyatlan refuses relevance-sorted searches that match that many, so those
+    are rerun unsorted.
+
+    Args:
+        client: AtlanClient instance
+        build_request: Callable taking whether to sort by relevance and returning the request
+
+    Returns:
+        Tuple of (search results, whether they are sorted by relevance)
+    """
+    try:
+        return client.asset.search(build_request(True)), True
+    except InvalidRequestError as e:
+        if e.error_code is not ErrorCode.UNABLE_TO_RUN_BULK_WITH_SORTS:
+            raise
+    return client.asset.search(build_request(False)), False
+
+
+def _asset_search_request(search_term, cursor, type_names, connection_qualified_names, by_relevance):
+    """Build the index search request for one page budget of _search_assets_direct_core."""
+    search = (
         FluentSearch()
         .where(CompoundQuery.active_assets())
+        .min_somes(1)
         .page_size(DEFAULT_PAGE_SIZE)
         .include_on_results(Asset.NAME)
         .include_on_results(Asset.QUALIFIED_NAME)
-    ).to_request()
-    
-    results = []
-    search_response = client.asset.search(request)
+    )
+    if by_relevance:
+        search = search.sort(SortItem("_score", order=SortOrder.DESCENDING))
+    for clause in _asset_name_clauses(search_term):
+        search = search.where_some(clause)
+    if type_names:
+        search = search.where(Asset.TYPE_NAME.within(list(type_names)))
+    if connection_qualified_names:
+        search = search.where(Asset.CONNECTION_QUALIFIED_NAME.within(list(connection_qualified_names)))
+    if not cursor:
+        # Facet counts come back with the first page of hits
+        search = (
+            search
+            .aggregate("type", Asset.TYPE_NAME.bucket_by(SEARCH_FACET_SIZE))
+            .aggregate("connection", Asset.CONNECTION_QUALIFIED_NAME.bucket_by(SEARCH_FACET_SIZE))
+        )
+    request = search.to_request()
+    request.dsl.from_ = cursor or 0
+    return request
+
+
+def _parse_facets(aggregations):
+    """Turn terms aggregations into {facet: [(value, count), ...]}."""
+    facets = {}
+    for facet in SEARCH_FACETS:
+        result = aggregations.get(facet) if aggregations else None
+        facets[facet] = [(bucket.key, bucket.doc_count) for bucket in getattr(result, "buckets", None) or []]
+    return facets
+
+
+def _search_assets_direct_core(client: AtlanClient, search_term: str, cursor=None, on_page=None,
+                               type_names=None, connection_qualified_names=None):
+    """
+    Core asset search logic, bounded by a deadline and a page budget.
+
+    Args:
+        client: AtlanClient instance
+        search_term: Name, fragment, abbreviation or misspelling
+        cursor: Offset returned by a previous call, to continue where it stopped
+        on_page: Optional callback receiving the results found so far after each page
+        type_names: Optional asset types to narrow the search to
+        connection_qualified_names: Optional connections to narrow the search to
+
+    Returns:
+        Tuple of (results keyed by display name, cursor for more results or None when exhausted,
+        facet counts for the first page of a search or None when continuing)
+    """
+    deadline = time.monotonic() + SEARCH_DEADLINE_SECONDS
+    # NameRanker still ranks every page when the search falls back to creation order
+    search_response, by_relevance = _search_by_relevance(
+        client,
+        lambda by_relevance: _asset_search_request(
+            search_term, cursor, type_names, connection_qualified_names, by_relevance
+        ),
+    )
+    if not by_relevance:
+        st.info(
+            f"More than 100,000 assets match '{search_term}', so only the first of them (in creation order) "
+            "were searched. Filter by type or connection to narrow the search."
+        )
+
+    scored = []  # (score, position, asset)
+    offset = cursor or 0
+    pages = 0
+    facets = None if cursor else _parse_facets(search_response.aggregations)
     
-    for asset in search_response:
-        if (hasattr(asset, 'name') and asset.name and 
-            search_term.lower() in asset.name.lower()):
-            results.append(asset)
-            if len(results) >= MAX_SEARCH_RESULTS:
-                break
+    while True:
+        raw_page = search_response.current_page()
+        page = [asset for asset in raw_page if asset is not None]
+        pages += 1
+        matches = NameRanker(page).rank(search_term)
+        if len(scored) + len(matches) > MAX_SEARCH_RESULTS:
+            # Keep page order when cutting off, so the cursor resumes after the last asset kept
+            positions = {id(asset): position for position, asset in enumerate(raw_page) if asset is not None}
+            matches.sort(key=lambda match: positions[id(match[1])])
+            matches = matches[:MAX_SEARCH_RESULTS - len(scored)]
+            offset += positions[id(matches[-1][1])] + 1
+        else:
+            offset += len(raw_page)
+        for score, asset in matches:
+            scored.append((score, len(scored), asset))
+        results = [asset for _, _, asset in sorted(scored, key=lambda item: (-item[0], item[1]))]
+        
+        if on_page is not None:
+            on_page(asset_display_names(results))
+        if len(results) >= MAX_SEARCH_RESULTS or pages >= SEARCH_PAGE_BUDGET or time.monotonic() >= deadline:
+            break
+        if not raw_page or not search_response.next_page():
+            offset = None  # Catalog exhausted
+            break
     
-    # If no results found with partial matching, try exact name search
-    if not results:
+    # If no results found with fuzzy matching, try exact name search
+    if not results and offset is None and not cursor:
         st.info(f"No partial matches found for '{search_term}', trying exact match...")
         try:
             exact_request = (
@@ -144,13 +349,34 @@ def _search_assets_direct_core(client: AtlanClient, search_term: str):
         except Exception as exact_e:
             st.warning(f"Exact match search also failed: {exact_e}")
     
-    return {f"{a.type_name}: {a.name}": a for a in results if hasattr(a, 'name') and a.name}
+    if not by_relevance:
+        offset = None  # Creation-order (bulk) searches cannot be resumed from an offset
+    return asset_display_names(results), offset, facets
 
 
-def search_assets_direct(client: AtlanClient, search_term: str):
-    """Search assets using FluentSearch with auto-reconnect."""
-    result = execute_with_auto_reconnect(_search_assets_direct_core, client, search_term)
-    return result if result is not None else {}
+def search_assets_direct(client: AtlanClient, search_term: str, cursor=None, on_page=None,
+                         type_names=None, connection_qualified_names=None):
+    """
+    Search assets using FluentSearch with auto-reconnect.
+
+    Each call stops after SEARCH_DEADLINE_SECONDS or SEARCH_PAGE_BUDGET pages,
+    returning what it found so far and a cursor to continue from. The first
+    call of a search also returns counts of the matching assets per type and
+    connection, which can be passed back as filters to narrow it.
+
+    Returns:
+        Tuple of (results keyed by display name, cursor for more results or None,
+        {"type": [(value, count)], "connection": [(value, count)]} or None)
+    """
+    # Answer from the bootstrapped asset-name index when it covers the whole catalog (it has no facets)
+    index = get_asset_name_index(client)
+    if index is not None and not type_names and not connection_qualified_names:
+        return {f"{ref.type_name}: {ref.name}": ref for ref in index.search(search_term, MAX_SEARCH_RESULTS)}, None, None
+
+    result = execute_with_auto_reconnect(
+        _search_assets_direct_core, client, search_term, cursor, on_page, type_names, connection_qualified_names
+    )
+    return result if result is not None else ({}, None, None)
 
 
 def _save_application_core(client: AtlanClient, application):
@@ -159,12 +385,27 @@ def _save_application_core(client: AtlanClient, application):
 
 
 def save_application(client: AtlanClient, application):
-    """Save application with auto-reconnect."""
-    return execute_with_auto_reconnect(_save_application_core, client, application)
+    """Save application with auto-reconnect, then update the read caches."""
+    response = execute_with_auto_reconnect(_save_application_core, client, application)
+    notify_assets_written(client, mutated_assets(response))
+    return response
 
 
 def _add_atlan_tags_core(client: AtlanClient, asset_type, qualified_name, tag_names):
-    """Core logic for adding Atlan tags."""
+    """
+    Core logic for adding Atlan tags.
+
+    Tag names are checked against the tenant's resolution cache first, so a
+    tag that no longer exists is skipped instead of failing the whole update
+    after the asset has been retrieved.
+    """
+    known = resolve_ids(client, TAGS, tag_names)
+    unknown = [name for name in tag_names if name not in known]
+    if unknown:
+        st.warning(f"Skipping unknown Atlan tags: {', '.join(unknown)}")
+        tag_names = [name for name in tag_names if name in known]
+    if not tag_names:
+        return None
     return client.asset.add_atlan_tags(
         asset_type=asset_type,
         qualified_name=qualified_name,
@@ -174,14 +415,49 @@ def _add_atlan_tags_core(client: AtlanClient, asset_type, qualified_name, tag_na
 
 
 def add_atlan_tags(client: AtlanClient, asset_type, qualified_name, tag_names):
-    """Add Atlan tags with auto-reconnect."""
-    return execute_with_auto_reconnect(
+    """Add Atlan tags with auto-reconnect, then update the read caches."""
+    result = execute_with_auto_reconnect(
         _add_atlan_tags_core,
         client,
         asset_type,
         qualified_name,
         tag_names
     )
+    if result is not None:
+        notify_assets_written(client, [AssetRef(None, qualified_name, asset_type.__name__, None)])
+    return result
+
+
+def application_field_writer(field_data, app_qualified_name=None, existing=None):
+    """
+    Build the ApplicationField creator or updater for a field editor row.
+
+    Args:
+        field_data: Field row with a name and optional type, description and qualified name
+        app_qualified_name: Qualified name of the field's application (new fields only)
+        existing: Whether the field already exists in Atlan; defaults to the row's ``is_existing``
+
+    Returns:
+        ApplicationField creator (new field) or updater (existing field, by qualified name)
+    """
+    if existing is None:
+        existing = field_data.get("is_existing")
+    if existing:
+        field = ApplicationField.create_for_modification(
+            qualified_name=field_data["qualified_name"],
+            name=field_data["name"]
+        )
+    else:
+        field = ApplicationField.creator(
+            name=field_data["name"],
+            application_qualified_name=app_qualified_name,
+        )
+    # pyatlan's ApplicationField has no data type attribute, so the type is kept in the generic subType
+    if field_data.get("type"):
+        field.sub_type = field_data.get("type")
+    if field_data.get("description"):
+        field.description = field_data.get("description")
+    return field
 
 
 def create_application_fields(client: AtlanClient, fields, app_qualified_name):
@@ -190,25 +466,25 @@ def create_application_fields(client: AtlanClient, fields, app_qualified_name):
         return
         
     st.write(f"🆕 **Creating {len(fields)} new ApplicationField assets...**")
-    field_batch = Batch(client, max_size=FIELD_BATCH_SIZE)
-    
-    for field_data in fields:
-        if not field_data.get("name"):
-            continue
-            
-        field_to_create = ApplicationField.creator(
-            name=field_data["name"],
-            application_qualified_name=app_qualified_name,
-        )
+    tenant = get_tenant_key(client)
+    with span("atlan.create_application_fields", **{
+        "atlan.operation": "create_application_fields", "atlan.tenant": tenant,
+        "batch.size": FIELD_BATCH_SIZE, "batch.items": len(fields),
+    }), get_tenant_limiter(tenant).slot(BULK_LANE):
+        field_batch = Batch(client, max_size=FIELD_BATCH_SIZE)
+        written = []
         
-        if field_data.get("type"):
-            field_to_create.application_field_type = field_data.get("type")
-        if field_data.get("description"):
-            field_to_create.description = field_data.get("description")
-            
-        field_batch.add(field_to_create)
-    
-    field_batch.flush()
+        for field_data in fields:
+            if not field_data.get("name"):
+                continue
+                
+            field_to_create = application_field_writer(field_data, app_qualified_name, existing=False)
+            field_batch.add(field_to_create)
+            # The batch only knows placeholder GUIDs, so the written fields are identified by qualified name
+            written.append(AssetRef(None, field_to_create.qualified_name, "ApplicationField", field_to_create.name))
+        
+        field_batch.flush()
+    notify_assets_written(client, written)
     st.success(f"✅ Created {len(fields)} new fields")
 
 
@@ -218,33 +494,170 @@ def update_application_fields(client: AtlanClient, fields):
         return
         
     st.write(f"✏️ **Updating {len(fields)} existing ApplicationField assets...**")
-    update_batch = Batch(client, max_size=FIELD_BATCH_SIZE)
-    
-    for field_data in fields:
-        if not field_data.get("name") or not field_data.get("qualified_name"):
-            continue
-            
-        field_to_update = ApplicationField.create_for_modification(
-            qualified_name=field_data["qualified_name"],
-            name=field_data["name"]
-        )
+    tenant = get_tenant_key(client)
+    with span("atlan.update_application_fields", **{
+        "atlan.operation": "update_application_fields", "atlan.tenant": tenant,
+        "batch.size": FIELD_BATCH_SIZE, "batch.items": len(fields),
+    }), get_tenant_limiter(tenant).slot(BULK_LANE):
+        update_batch = Batch(client, max_size=FIELD_BATCH_SIZE)
+        written = []
         
-        if field_data.get("type"):
-            field_to_update.application_field_type = field_data.get("type")
-        if field_data.get("description"):
-            field_to_update.description = field_data.get("description")
-            
-        update_batch.add(field_to_update)
-    
-    update_batch.flush()
+        for field_data in fields:
+            if not field_data.get("name") or not field_data.get("qualified_name"):
+                continue
+                
+            field_to_update = application_field_writer(field_data, existing=True)
+            update_batch.add(field_to_update)
+            written.append(AssetRef(None, field_to_update.qualified_name, "ApplicationField", field_to_update.name))
+        
+        update_batch.flush()
+    notify_assets_written(client, written)
     st.success(f"✅ Updated {len(fields)} existing fields")
 
 
+def tag_updater(asset_type, qualified_name, name, tag_names):
+    """Minimal updater carrying the tags to append (save it with ``append_atlan_tags=True``)."""
+    updater = asset_type.updater(qualified_name=qualified_name, name=name)
+    updater.atlan_tags = [AtlanTag(type_name=AtlanTagName(tag), propagate=True) for tag in tag_names]
+    return updater
+
+
+def append_field_tags(client: AtlanClient, fields, app_qualified_name):
+    """
+    Append the Atlan tags chosen for each field.
+
+    Fields are grouped by tag set and each group is written in chunks of
+    FIELD_TAG_BATCH_SIZE, one tag-append request per chunk, through the
+    concurrent bulk writer. Tags already on a field are kept.
+
+    Args:
+        client: AtlanClient instance
+        fields: Field rows, each with a name and optional ``tags``
+        app_qualified_name: Qualified name of the fields' application
+    """
+    groups = {}  # tag set -> [(qualified name, name)]
+    for field_data in fields:
+        tags = tuple(sorted(field_data.get("tags") or ()))
+        if tags and field_data.get("name") and not field_data.get("mark_for_deletion"):
+            qualified_name = field_data.get("qualified_name") or f"{app_qualified_name}/{field_data['name']}"
+            groups.setdefault(tags, []).append((qualified_name, field_data["name"]))
+    if not groups:
+        return
+
+    # Tags deleted since they were picked are dropped up front, which may merge tag sets
+    known = resolve_ids(client, TAGS, {tag for tags in groups for tag in tags})
+    unknown = sorted({tag for tags in groups for tag in tags if tag not in known})
+    if unknown:
+        st.warning(f"Skipping unknown Atlan tags: {', '.join(unknown)}")
+        merged = {}
+        for tags, members in groups.items():
+            kept = tuple(tag for tag in tags if tag in known)
+            if kept:
+                merged.setdefault(kept, []).extend(members)
+        groups = merged
+
+    total = sum(len(members) for members in groups.values())
+    st.write(f"🏷️ **Tagging {total} fields ({len(groups)} distinct tag sets)...**")
+    chunks = [
+        [(qualified_name, name, tags) for qualified_name, name in chunk]
+        for tags, members in groups.items()
+        for chunk in chunked(members, FIELD_TAG_BATCH_SIZE)
+    ]
+    result = save_concurrently(
+        client, "append_field_tags", chunks, FIELD_TAG_BATCH_SIZE,
+        build=lambda chunk: [tag_updater(ApplicationField, *spec) for spec in chunk], append_atlan_tags=True,
+    )
+
+    # Updaters carry placeholder GUIDs, so the tagged fields are identified by qualified name
+    notify_assets_written(client, [AssetRef(None, f.qualified_name, "ApplicationField", f.name) for f in result.written])
+    if result.written:
+        st.success(
+            f"✅ Tagged {len(result.written)} fields in {result.requests - len(result.failures)} requests, "
+            f"{result.seconds:.1f}s ({result.items_per_second:.0f} fields/s)"
+        )
+    if result.failures:
+        st.error(
+            f"❌ Failed to tag {result.failed_items} fields in {len(result.failures)} requests: {result.failures[0][1]}"
+        )
+
+
 def _save_process_core(client: AtlanClient, process):
     """Core process save logic."""
     return client.asset.save(process)
 
 
 def save_process(client: AtlanClient, process):
-    """Save process with auto-reconnect."""
-    return execute_with_auto_reconnect(_save_process_core, client, process) 
\ No newline at end of file
+    """Save process with auto-reconnect, then update the read caches."""
+    response = execute_with_auto_reconnect(_save_process_core, client, process)
+    notify_assets_written(client, mutated_assets(response))
+    return response
+
+
+def _archive_assets_core(client: AtlanClient, guids):
+    """Core archive (soft-delete) logic."""
+    return client.asset.delete_by_guid(list(guids))
+
+
+def archive_assets(client: AtlanClient, guids):
+    """Archive assets by GUID with auto-reconnect; archiving nothing is a no-op."""
+    if not guids:
+        return None
+    return execute_with_auto_reconnect(_archive_assets_core, client, guids)
+
+
+def plan_lineage_processes(app_name, app_qualified_name, input_qns, output_qns, existing_processes=()):
+    """
+    Work out the Process writes that make an application's lineage match the picked assets.
+
+    A process the application is the only output of (upstream) or the only
+    input of (downstream) is the application's own: the first of each
+    direction is updated to the picked assets, and the rest, or all of them
+    once nothing is picked, are archived. Processes shared with other assets
+    are left alone, so the assets they link stay linked even when unpicked.
+    Without existing processes (create mode) one process per direction is created.
+
+    Args:
+        app_name: Name of the application
+        app_qualified_name: Qualified name of the application
+        input_qns: Qualified names of the picked upstream assets
+        output_qns: Qualified names of the picked downstream assets
+        existing_processes: The application's "lineage_processes", as loaded by
+            ``services.application_state.load_application_state``
+
+    Returns:
+        Tuple of (list of (name, qualified name to update or None to create,
+        input qualified names, output qualified names), GUIDs of the processes
+        to archive, qualified names of unpicked assets still linked by shared processes)
+    """
+    writes, archived, still_linked = [], [], []
+    for direction, picked, suffix in (("upstream", input_qns, "Upstream"), ("downstream", output_qns, "Downstream")):
+        processes = [process for process in existing_processes if process["direction"] == direction]
+        shared = {qn for process in processes if process["shared"] for qn in process["assets"]}
+        owned = [process for process in processes if not process["shared"]]
+        wanted = [qn for qn in dict.fromkeys(picked) if qn not in shared]
+        still_linked.extend(sorted(shared.difference(picked)))
+        if wanted:
+            target = owned.pop(0) if owned else None
+            if target is None or set(target["assets"]) != set(wanted):
+                inputs, outputs = (wanted, [app_qualified_name]) if direction == "upstream" else ([app_qualified_name], wanted)
+                if target is None:
+                    writes.append((f"{app_name} {suffix} Lineage", None, inputs, outputs))
+                else:
+                    writes.append((target["name"], target["qualified_name"], inputs, outputs))
+        archived.extend(process["guid"] for process in owned)
+    return writes, archived, still_linked
+
+
+def lineage_process_writer(name, qualified_name, connection_qualified_name, inputs, outputs):
+    """Build a Process creator, or an updater when given its qualified name, linking assets by qualified name."""
+    if qualified_name is None:
+        return Process.creator(
+            name=name,
+            connection_qualified_name=connection_qualified_name,
+            inputs=[Asset.ref_by_qualified_name(qn) for qn in inputs],
+            outputs=[Asset.ref_by_qualified_name(qn) for qn in outputs],
+        )
+    process = Process.updater(qualified_name=qualified_name, name=name)
+    process.inputs = [Asset.ref_by_qualified_name(qn) for qn in inputs]
+    process.outputs = [Asset.ref_by_qualified_name(qn) for qn in outputs]
+    return process
@@ -2,10 +2,20 @@
 AtlanClient service module with automatic reconnection functionality.
 """
 
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
 import streamlit as st
-from pyatlan.client.atlan import AtlanClient
 from pyatlan.errors import AtlanError
 from config.settings import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from services.rate_limiter import get_tenant_limiter, install_rate_limiter
+from services.tracing import span, current_span, result_count, install_tracing_hooks
+from services.http_cassette import CassetteError, install_cassette
+
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
 
 
 def create_client(base_url: str, api_key: str) -> AtlanClient:
@@ -21,13 +31,57 @@ def create_client(base_url: str, api_key: str) -> AtlanClient:
         
     Raises:
         AtlanError: If client creation fails
+        CassetteError: If replay mode is set and the cassette cannot be read
     """
-    return AtlanClient(
+    # Importing AtlanClient loads pyatlan's asset model tree, so it is deferred until the first connection
+    from pyatlan.client.atlan import AtlanClient, DEFAULT_RETRY
+
+    client = AtlanClient(
         base_url=base_url,
         api_key=api_key,
         connect_timeout=DEFAULT_CONNECT_TIMEOUT,
-        read_timeout=DEFAULT_READ_TIMEOUT
+        read_timeout=DEFAULT_READ_TIMEOUT,
+        # 429s are retried by the tenant's rate limiter instead, which adapts its rate to them
+        retry=DEFAULT_RETRY.copy_with(status_forcelist=DEFAULT_RETRY.status_forcelist - {429}),
     )
+    # Count the HTTP requests made within each traced operation
+    install_tracing_hooks(client._session)
+    # Record or replay HTTP traffic when a cassette mode is configured
+    install_cassette(client._session)
+    # Route every HTTP attempt (including replayed ones) through the tenant's process-wide rate limiter
+    install_rate_limiter(client._session, get_tenant_key(client))
+    return client
+
+
+def get_tenant_key(client) -> str:
+    """
+    Get the key identifying the Atlan tenant a client talks to.
+    
+    Args:
+        client: The AtlanClient instance
+        
+    Returns:
+        The tenant base URL, used to scope process-wide caches and limits
+    """
+    base_url = getattr(client, "base_url", None)
+    return str(base_url).rstrip("/") if base_url else ""
+
+
+def get_cache_scope(client) -> tuple[str, str]:
+    """
+    Get the key scoping cached reads to a tenant and the credentials they were made with.
+    
+    Results fetched with one API token are only shared with clients using the
+    same token, so cached reads never bypass another user's permissions.
+    
+    Args:
+        client: The AtlanClient instance
+        
+    Returns:
+        Tuple of (tenant key, digest of the API token)
+    """
+    api_key = getattr(client, "api_key", None) or ""
+    return get_tenant_key(client), hashlib.sha256(api_key.encode()).hexdigest()[:16]
 
 
 def execute_with_auto_reconnect(operation_func, client, *args, **kwargs):
@@ -42,6 +96,37 @@ def execute_with_auto_reconnect(operation_func, client, *args, **kwargs):
     Returns:
         Result of the operation, or None if failed
     """
+    tenant = get_tenant_key(client)
+    limiter = get_tenant_limiter(tenant)
+    operation = get_operation_name(operation_func)
+    with span(f"atlan.{operation}", **{"atlan.operation": operation, "atlan.tenant": tenant}) as current:
+        with limiter.slot():
+            result = _execute_with_reconnect(operation_func, client, *args, **kwargs)
+        count = result_count(result)
+        if count is not None:
+            current.set_attribute("result.count", count)
+        return result
+
+
+def get_operation_name(operation_func) -> str:
+    """
+    Get the name an operation is traced under.
+    
+    Args:
+        operation_func: Function passed to execute_with_auto_reconnect
+        
+    Returns:
+        The function name without the leading underscore and ``_core``/``_internal`` suffix
+    """
+    name = getattr(operation_func, "__name__", "operation").lstrip("_")
+    for suffix in ("_core", "_internal"):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def _execute_with_reconnect(operation_func, client, *args, **kwargs):
+    """Execute an operation, reconnecting once if the client session has expired."""
     try:
         return operation_func(client, *args, **kwargs)
     except Exception as e:
@@ -49,16 +134,19 @@ def execute_with_auto_reconnect(operation_func, client, *args, **kwargs):
         if "No instance of AtlanClient has been created" in error_msg:
             # Attempt automatic reconnection
             st.warning("🔄 Client session expired. Attempting to reconnect...")
+            current_span().set_attribute("atlan.reconnected", True)
             
-            atlan_url = st.session_state.get("atlan_url")
-            atlan_api_token = st.session_state.get("atlan_api_token")
+            # Reconnect to the client's own tenant (sessions may publish to several)
+            atlan_url = get_tenant_key(client) or st.session_state.get("atlan_url")
+            atlan_api_token = getattr(client, "api_key", None) or st.session_state.get("atlan_api_token")
             
             if atlan_url and atlan_api_token:
                 try:
                     # Create a new client
                     new_client = create_client(atlan_url, atlan_api_token)
-                    # Update session state
-                    st.session_state["client"] = new_client
+                    # Update session state when it was the session's main client
+                    if get_tenant_key(st.session_state.get("client")) == get_tenant_key(new_client):
+                        st.session_state["client"] = new_client
                     st.success("✅ Reconnected! Retrying operation...")
                     
                     # Retry the operation with the new client
@@ -101,6 +189,6 @@ def connect_to_atlan(atlan_url: str, atlan_api_token: str) -> tuple[AtlanClient,
         
         return client, user
         
-    except AtlanError as e:
+    except (AtlanError, CassetteError) as e:
         st.sidebar.error(f"Connection failed: {e}")
         return None, None 
\ No newline at end of file
@@ -7,12 +7,17 @@ from pyatlan.client.atlan import AtlanClient
 from pyatlan.model.assets import Connection, Asset
 from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
 from pyatlan.model.enums import AtlanConnectorType
-from services.atlan_client import execute_with_auto_reconnect
-from config.settings import MAX_CONNECTIONS_TO_FETCH, MAX_SEARCH_ITERATIONS
+from services.atlan_client import execute_with_auto_reconnect, get_cache_scope
+from services.single_flight import atlan_reads
+from services.metrics import record_cache_lookup, record_cache_miss
+from services.write_through import register_write_hook
+from services.identity_cache import USERS, GROUPS, TAGS, seed_identities, owner_label
+from config.settings import MAX_CONNECTIONS_TO_FETCH, MAX_SEARCH_ITERATIONS, CONNECTIONS_CACHE_TTL
 
 
 def _get_connections_internal(client: AtlanClient):
     """Internal function to fetch connections."""
+    record_cache_miss("connections")
     # Simple approach: search specifically for connections with small page size
     request = (
         FluentSearch()
@@ -51,12 +56,31 @@ def _get_connections_internal(client: AtlanClient):
 
 def get_connections(client: AtlanClient):
     """
-    Fetches all connections from Atlan with automatic reconnection.
+    Fetches all connections from Atlan with automatic reconnection, cached per tenant and API token.
     """
-    result = execute_with_auto_reconnect(_get_connections_internal, client)
+    record_cache_lookup("connections")
+    return _get_connections_cached(get_cache_scope(client), client)
+
+
+@st.cache_data(ttl=CONNECTIONS_CACHE_TTL, show_spinner="Fetching connections...")
+def _get_connections_cached(scope: tuple, _client: AtlanClient):
+    """Fetches all connections for one tenant and API token."""
+    result = atlan_reads.do(
+        (scope, "get_connections"),
+        execute_with_auto_reconnect, _get_connections_internal, _client
+    )
     return result if result is not None else []
 
 
+def _invalidate_connections(scope, refs):
+    """Write hook: refetch connections (for every user) after one is created or updated."""
+    if any(ref.type_name == "Connection" for ref in refs):
+        _get_connections_cached.clear()
+
+
+register_write_hook(_invalidate_connections)
+
+
 def get_api_connections(connections):
     """
     Filter connections to get only API-type connections.
@@ -75,33 +99,83 @@ def get_api_connections(connections):
     ]
 
 
-@st.cache_data(show_spinner="Fetching users and groups...")
-def get_users_and_groups(_client: AtlanClient):
-    """Fetches all users and groups from Atlan."""
+def _get_users_and_groups_internal(client: AtlanClient):
+    """Internal function to fetch users and groups."""
+    record_cache_miss("users")
+    users = [u for u in client.user.get() if u.username]
+    groups = [g for g in client.group.get() if g.alias]
+    # Later owner and tag lookups resolve from these without another request
+    seed_identities(client, USERS, [(u.username, u.id, u) for u in users])
+    seed_identities(client, GROUPS, [(g.alias, g.id, g) for g in groups])
+    owners = {owner_label(USERS, u.username): u for u in users}
+    owners.update({owner_label(GROUPS, g.alias): g for g in groups})
+    return owners
+
+
+def get_users_and_groups(client: AtlanClient, report_errors=True):
+    """
+    Fetches all users and groups from Atlan, served from the Streamlit cache when possible.
+
+    Args:
+        client: AtlanClient instance
+        report_errors: Show a failed fetch in the page and return an empty mapping;
+            otherwise the error is raised (e.g. for background warm-up)
+    """
+    record_cache_lookup("users")
     try:
-        users = _client.user.get()
-        groups = _client.group.get()
-        owners = {f"User: {u.username}": u for u in users if u.username}
-        owners.update({f"Group: {g.alias}": g for g in groups if g.alias})
-        return owners
+        return _get_users_and_groups_cached(get_cache_scope(client), client)
     except Exception as e:
+        if not report_errors:
+            raise
         st.error(f"Error fetching users and groups: {e}")
         return {}
 
 
-@st.cache_data(show_spinner="Fetching Atlan tags...")
-def get_tags(_client: AtlanClient):
-    """Fetches all Atlan Tags (classifications)."""
+@st.cache_data(show_spinner="Fetching users and groups...")
+def _get_users_and_groups_cached(scope: tuple, _client: AtlanClient):
+    """Fetches all users and groups for one tenant and API token; failures raise, so they are not cached."""
+    return atlan_reads.do(
+        (scope, "get_users_and_groups"),
+        _get_users_and_groups_internal, _client
+    )
+
+
+def _get_tags_internal(client: AtlanClient):
+    """Internal function to fetch Atlan tag definitions."""
+    from pyatlan.model.enums import AtlanTypeCategory
+    record_cache_miss("tags")
+    
+    # Get all type definitions for classifications (Atlan tags)
+    response = client.typedef.get(type_category=[AtlanTypeCategory.CLASSIFICATION])
+    
+    if response and response.atlan_tag_defs:
+        # Create a dictionary mapping display names to tag definitions
+        tags = {tag.display_name: tag for tag in response.atlan_tag_defs if tag.display_name}
+        seed_identities(client, TAGS, [(name, tag.name, tag) for name, tag in tags.items()])
+        return tags
+    return {}
+
+
+def get_tags(client: AtlanClient, report_errors=True):
+    """
+    Fetches all Atlan Tags (classifications), served from the Streamlit cache when possible.
+
+    Args:
+        client: AtlanClient instance
+        report_errors: Show a failed fetch in the page and return an empty mapping;
+            otherwise the error is raised (e.g. for background warm-up)
+    """
+    record_cache_lookup("tags")
     try:
-        from pyatlan.model.enums import AtlanTypeCategory
-        
-        # Get all type definitions for classifications (Atlan tags)
-        response = _client.typedef.get(type_category=[AtlanTypeCategory.CLASSIFICATION])
-        
-        if response and response.atlan_tag_defs:
-            # Create a dictionary mapping display names to tag definitions
-            return {tag.display_name: tag for tag in response.atlan_tag_defs if tag.display_name}
-        return {}
+        return _get_tags_cached(get_cache_scope(client), client)
     except Exception as e:
+        if not report_errors:
+            raise
         st.error(f"Error fetching tags: {e}")
-        return {} 
\ No newline at end of file
+        return {}
+
+
+@st.cache_data(show_spinner="Fetching Atlan tags...")
+def _get_tags_cached(scope: tuple, _client: AtlanClient):
+    """Fetches all Atlan Tags (classifications) for one tenant and API token; failures raise, so they are not cached."""
+    return atlan_reads.do((scope, "get_tags"), _get_tags_internal, _client) 
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Paged, lazily loaded browsing of connections, applications and fields.
+
+Each level of the explorer tree is fetched one page at a time with only the
+name and qualified name of each asset, sorted by qualified name and resumed
+after the last one seen, so the hundredth page costs the same as the first.
+The number of children under each node comes from a terms aggregation in a
+request that returns no hits, so an application with thousands of fields is
+counted without fetching them. Connections are paged the same way, over the
+buckets of the applications' connection qualified names in key order.
+"""
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.assets import Application, ApplicationField, Asset, Connection
+from pyatlan.model.enums import SortOrder
+from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
+from pyatlan.model.aggregation import Aggregation
+from pyatlan.model.search import Range
+from services.atlan_client import execute_with_auto_reconnect, get_cache_scope
+from services.single_flight import atlan_reads
+from utils.compact_state import AssetRef
+from config.settings import EXPLORER_PAGE_SIZE
+
+_CONNECTION_FIELD = Asset.CONNECTION_QUALIFIED_NAME.keyword_field_name
+_EXACT_CARDINALITY = 40000  # Elasticsearch's highest precision threshold: connection totals below it are exact
+
+
+class ExplorerPage:
+    """One page of nodes at a level of the explorer tree."""
+
+    __slots__ = ("nodes", "cursor", "total")
+
+    def __init__(self, nodes, cursor, total):
+        self.nodes = nodes  # [(AssetRef, number of children or None for leaves)]
+        self.cursor = cursor  # Passed back for the next page, None on the last one
+        self.total = total  # Nodes at this level, only known on the first page (None otherwise)
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+def _bucket_counts(response, name):
+    """Turn a terms aggregation into {value: count}."""
+    result = (response.aggregations or {}).get(name)
+    return {bucket.key: bucket.doc_count for bucket in getattr(result, "buckets", None) or []}
+
+
+def _count_children(client: AtlanClient, child_type, parent_field, parent_qualified_names):
+    """Count active children per parent with one aggregation-only search."""
+    if not parent_qualified_names:
+        return {}
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(child_type))
+        .where(CompoundQuery.active_assets())
+        .where(parent_field.within(list(parent_qualified_names)))
+        .page_size(0)
+        .aggregate("children", parent_field.bucket_by(len(parent_qualified_names)))
+    ).to_request()
+    return _bucket_counts(client.asset.search(request), "children")
+
+
+def _list_connections_core(client: AtlanClient, cursor):
+    """Page through the connections holding applications, in qualified name order, with their application counts."""
+    search = (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(Application))
+        .where(CompoundQuery.active_assets())
+        .page_size(0)
+        # One bucket more than a page tells whether another page follows
+        .aggregate("connections", Aggregation(__root__={"terms": {
+            "field": _CONNECTION_FIELD, "size": EXPLORER_PAGE_SIZE + 1, "order": {"_key": "asc"},
+        }}))
+    )
+    if cursor:
+        search = search.where(Range(field=_CONNECTION_FIELD, gt=cursor))
+    else:
+        search = search.aggregate("total", Aggregation(__root__={"cardinality": {
+            "field": _CONNECTION_FIELD, "precision_threshold": _EXACT_CARDINALITY,
+        }}))
+    response = client.asset.search(search.to_request())
+    counts = _bucket_counts(response, "connections")
+    ordered = sorted(counts)
+    page = ordered[:EXPLORER_PAGE_SIZE]
+
+    connections = {}
+    if page:
+        names_request = (
+            FluentSearch()
+            .where(CompoundQuery.asset_type(Connection))
+            .where(CompoundQuery.active_assets())
+            .where(Asset.QUALIFIED_NAME.within(page))
+            .page_size(len(page))
+            .include_on_results(Asset.NAME)
+        ).to_request()
+        for connection in client.asset.search(names_request).current_page():
+            if connection is not None:
+                connections[connection.qualified_name] = connection
+
+    nodes = []
+    for qualified_name in page:
+        connection = connections.get(qualified_name)
+        name = getattr(connection, "name", None) or qualified_name
+        nodes.append((AssetRef(getattr(connection, "guid", None), qualified_name, "Connection", name), counts[qualified_name]))
+    total = None
+    if not cursor:
+        total = getattr((response.aggregations or {}).get("total"), "value", None)
+        total = int(total) if total is not None else None
+    return ExplorerPage(nodes, page[-1] if len(ordered) > len(page) else None, total)
+
+
+def _list_children_core(client: AtlanClient, child_type, parent_field, parent_qualified_name, cursor, grandchildren):
+    """Fetch one page of a node's children, sorted by qualified name, with their own child counts."""
+    search = (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(child_type))
+        .where(CompoundQuery.active_assets())
+        .where(parent_field.eq(parent_qualified_name))
+        .sort(Asset.QUALIFIED_NAME.order(SortOrder.ASCENDING))
+        .page_size(EXPLORER_PAGE_SIZE)
+        .include_on_results(Asset.NAME)
+    )
+    if cursor:
+        search = search.where(Range(field=Asset.QUALIFIED_NAME.keyword_field_name, gt=cursor))
+    response = client.asset.search(search.to_request())
+    page = [asset for asset in response.current_page() if asset is not None]
+
+    counts = {}
+    if grandchildren is not None:
+        counts = _count_children(client, *grandchildren, [asset.qualified_name for asset in page])
+    nodes = [
+        (AssetRef.from_asset(asset), counts.get(asset.qualified_name, 0) if grandchildren is not None else None)
+        for asset in page
+    ]
+    # The count covers everything after the cursor, so more remain if it exceeds this page
+    more = bool(page) and response.count > len(page)
+    return ExplorerPage(nodes, page[-1].qualified_name if more else None, response.count if not cursor else None)
+
+
+def list_connections(client: AtlanClient, cursor=None):
+    """
+    List a page of connections that hold applications, with auto-reconnect.
+
+    Args:
+        client: AtlanClient instance
+        cursor: Cursor of the previous page, or None for the first
+
+    Returns:
+        ExplorerPage of connections and their application counts, or None if the search failed
+    """
+    return atlan_reads.do(
+        (get_cache_scope(client), "explorer_connections", cursor),
+        execute_with_auto_reconnect, _list_connections_core, client, cursor
+    )
+
+
+def list_applications(client: AtlanClient, connection_qualified_name, cursor=None):
+    """
+    List a page of a connection's applications and their field counts, with auto-reconnect.
+
+    Returns:
+        ExplorerPage of applications, or None if the search failed
+    """
+    return atlan_reads.do(
+        (get_cache_scope(client), "explorer_applications", connection_qualified_name, cursor),
+        execute_with_auto_reconnect, _list_children_core, client, Application, Asset.CONNECTION_QUALIFIED_NAME,
+        connection_qualified_name, cursor, (ApplicationField, ApplicationField.APPLICATION_PARENT_QUALIFIED_NAME)
+    )
+
+
+def list_application_fields(client: AtlanClient, app_qualified_name, cursor=None):
+    """
+    List a page of an application's fields, with auto-reconnect.
+
+    Returns:
+        ExplorerPage of fields (leaves, so without counts), or None if the search failed
+    """
+    return atlan_reads.do(
+        (get_cache_scope(client), "explorer_fields", app_qualified_name, cursor),
+        execute_with_auto_reconnect, _list_children_core, client, ApplicationField,
+        ApplicationField.APPLICATION_PARENT_QUALIFIED_NAME, app_qualified_name, cursor, None
+    )
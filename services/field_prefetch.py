@@ -0,0 +1,112 @@
+"""
+Speculative prefetch of ApplicationFields in update mode.
+
+While the user is looking at application search results, the fields of the
+highlighted application and the top hits are loaded on a background thread
+into a bounded LRU keyed by tenant, API token and application qualified name.
+Clicking "Edit" then takes the fields from memory; if the prefetch is still
+running, the click joins it through the single-flight layer instead of
+searching again.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import FIELD_PREFETCH_MAX_APPLICATIONS, FIELD_PREFETCH_TTL, FIELD_PREFETCH_MAX_WORKERS
+from services.atlan_client import get_cache_scope
+from services.rate_limiter import get_tenant_limiter, BULK_LANE
+from services.metrics import record_cache_lookup, record_cache_miss
+from services.write_through import register_write_hook
+
+CACHE_NAME = "application_fields"
+
+_executor = ThreadPoolExecutor(max_workers=FIELD_PREFETCH_MAX_WORKERS, thread_name_prefix="atlan-prefetch")
+_fields = OrderedDict()  # (cache scope, qualified name) -> (fetched_at, fields), least recently used first
+_pending = set()  # (cache scope, qualified name) being prefetched
+_generations = {}  # tenant -> number of writes seen, so prefetches started before a write are discarded
+_lock = threading.Lock()
+
+
+def _is_fresh(entry):
+    return time.monotonic() - entry[0] < FIELD_PREFETCH_TTL
+
+
+def _prefetch(client, key):
+    """Load one application's fields in the bulk lane and keep them in the LRU."""
+    # Imported here because asset_service reads from this module
+    from services.asset_service import fetch_application_fields
+
+    (tenant, _), qualified_name = key
+    with _lock:
+        generation = _generations.get(tenant, 0)
+    try:
+        with get_tenant_limiter(tenant).slot(BULK_LANE):
+            fields = fetch_application_fields(client, qualified_name)
+        with _lock:
+            if fields is not None and _generations.get(tenant, 0) == generation:
+                _fields[key] = (time.monotonic(), fields)
+                _fields.move_to_end(key)
+                while len(_fields) > FIELD_PREFETCH_MAX_APPLICATIONS:
+                    _fields.popitem(last=False)
+    finally:
+        with _lock:
+            _pending.discard(key)
+
+
+def prefetch_application_fields(client, qualified_names):
+    """
+    Start loading the fields of applications in the background.
+
+    Applications that are already cached and fresh, or being prefetched, are
+    skipped, so this is cheap to call on every rerun.
+
+    Args:
+        client: A connected AtlanClient
+        qualified_names: Application qualified names, most likely to be edited first
+    """
+    scope = get_cache_scope(client)
+    for qualified_name in qualified_names:
+        key = (scope, qualified_name)
+        with _lock:
+            entry = _fields.get(key)
+            if key in _pending or (entry is not None and _is_fresh(entry)):
+                continue
+            _pending.add(key)
+        _executor.submit(_prefetch, client, key)
+
+
+def get_prefetched_fields(client, qualified_name):
+    """
+    Get an application's prefetched fields.
+
+    Returns:
+        The field dicts (shared, so copy before editing), or None if they were not prefetched or are stale
+    """
+    key = (get_cache_scope(client), qualified_name)
+    record_cache_lookup(CACHE_NAME)
+    with _lock:
+        entry = _fields.get(key)
+        if entry is not None and _is_fresh(entry):
+            _fields.move_to_end(key)
+            return entry[1]
+    record_cache_miss(CACHE_NAME)
+    return None
+
+
+def _forget_written_applications(scope, refs):
+    """Write hook: drop prefetched fields of saved applications and of applications whose fields were saved."""
+    tenant = scope[0]
+    written = [ref.qualified_name for ref in refs]
+    with _lock:
+        _generations[tenant] = _generations.get(tenant, 0) + 1
+        for key in list(_fields):
+            app_qualified_name = key[1]
+            if key[0][0] == tenant and any(
+                qn == app_qualified_name or qn.startswith(app_qualified_name + "/") for qn in written
+            ):
+                del _fields[key]
+
+
+register_write_hook(_forget_written_applications)
@@ -0,0 +1,159 @@
+"""
+Record/replay of Atlan HTTP traffic ("cassettes") for offline benchmarks.
+
+In record mode every request/response pair an AtlanClient exchanges is
+appended to a JSON-lines cassette together with its elapsed time. In replay
+mode the client never touches the network: responses are served from the
+cassette, optionally sleeping for the recorded time multiplied by a scale
+factor. The cassette wraps the HTTP transport beneath pyatlan's retry
+transport, so retried attempts are recorded and replayed individually.
+
+Request headers (including the API token) are never recorded.
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+import httpx
+
+from config.settings import CASSETTE_MODE, CASSETTE_PATH, CASSETTE_TIME_SCALE
+
+RECORD_MODE = "record"
+REPLAY_MODE = "replay"
+
+# Response headers kept in the cassette; encoding/length headers no longer apply to the decoded body
+_RECORDED_RESPONSE_HEADERS = {"content-type", "retry-after"}
+
+
+class CassetteError(Exception):
+    """Raised when a cassette cannot be used."""
+
+
+class CassetteMissError(CassetteError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def _request_key(request):
+    """Method and path (with query) of a request, without the tenant host."""
+    return f"{request.method} {request.url.raw_path.decode('ascii')}"
+
+
+def _body_digest(body):
+    return hashlib.sha1(body or b"").hexdigest()
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport that forwards requests and appends each exchange to a cassette file."""
+
+    def __init__(self, transport, path):
+        self._transport = transport
+        self.path = path
+        self._lock = threading.Lock()
+
+    def handle_request(self, request):
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        elapsed = time.perf_counter() - started
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() in _RECORDED_RESPONSE_HEADERS}
+        interaction = {
+            "request": _request_key(request),
+            "body_sha1": _body_digest(request.read()),
+            "status": response.status_code,
+            "headers": headers,
+            "body": body.decode("utf-8", errors="replace"),
+            "elapsed": round(elapsed, 6),
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    def close(self):
+        self._transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """
+    Transport that serves recorded responses instead of calling Atlan.
+
+    Requests are matched on method and path. When several interactions share
+    a path (e.g. search pages or batch flushes), an unused one with the same
+    request body is preferred, otherwise the next unused one in recorded order.
+    """
+
+    def __init__(self, path, time_scale=1.0):
+        self.path = path
+        self.time_scale = time_scale
+        self._interactions = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self._interactions.setdefault(interaction["request"], []).append(interaction)
+        except (OSError, ValueError, KeyError) as e:
+            raise CassetteError(f"Cannot replay cassette {path}: {e}") from e
+        self._lock = threading.Lock()
+        self._used = set()
+
+    def rewind(self):
+        """Make every recorded interaction available again (e.g. between benchmark iterations)."""
+        with self._lock:
+            self._used.clear()
+
+    def handle_request(self, request):
+        key = _request_key(request)
+        digest = _body_digest(request.read())
+        with self._lock:
+            candidates = [i for i in self._interactions.get(key, ()) if id(i) not in self._used]
+            if not candidates:
+                raise CassetteMissError(f"No recorded response left for {key} in {self.path}")
+            interaction = next((i for i in candidates if i["body_sha1"] == digest), candidates[0])
+            self._used.add(id(interaction))
+
+        if self.time_scale > 0:
+            time.sleep(interaction["elapsed"] * self.time_scale)
+        return httpx.Response(
+            interaction["status"],
+            headers=interaction["headers"],
+            content=interaction["body"].encode("utf-8"),
+            request=request,
+        )
+
+
+def install_cassette(http_session, mode=CASSETTE_MODE, path=CASSETTE_PATH, time_scale=CASSETTE_TIME_SCALE):
+    """
+    Put a record or replay cassette beneath an AtlanClient's HTTP session.
+
+    Args:
+        http_session: The httpx.Client used by an AtlanClient
+        mode: RECORD_MODE, REPLAY_MODE or empty to leave the session untouched
+        path: Cassette file (JSON lines)
+        time_scale: Replay only; multiplier for recorded response times (0 for no delay)
+
+    Returns:
+        The installed transport, or None if no cassette mode is set
+    """
+    if mode not in (RECORD_MODE, REPLAY_MODE):
+        return None
+
+    # pyatlan's retry transport wraps the raw HTTP transport; swap the inner one so retries still apply
+    retry_transport = http_session._transport
+    inner = getattr(retry_transport, "_transport", None)
+    if mode == RECORD_MODE:
+        cassette = RecordingTransport(inner or retry_transport, path)
+    else:
+        cassette = ReplayTransport(path, time_scale)
+
+    if inner is not None:
+        retry_transport._transport = cassette
+    else:
+        http_session._transport = cassette
+    return cassette
@@ -0,0 +1,230 @@
+"""
+Tenant- and token-scoped, bidirectional resolution of users, groups and Atlan tags.
+
+Usernames, group aliases and tag display names map to Atlan IDs (and back)
+through two dictionaries per kind, so lookups are O(1) both ways. The maps
+are seeded from the full lists fetched for the enrichment step; a key that
+is not known yet is fetched on its own (users and groups in one batched
+request per lookup, tags by ID one request each) instead of reloading every
+user or group. Tag display names can only be resolved by reloading the tag
+definitions, as Atlan can neither look a tag up by display name nor list
+the definitions changed since the last load. Keys Atlan does not know are
+remembered for IDENTITY_MISS_TTL so they are not looked up again on every call.
+"""
+
+import json
+import threading
+import time
+
+from config.settings import IDENTITY_MISS_TTL
+from services.atlan_client import get_cache_scope
+
+USERS = "users"
+GROUPS = "groups"
+TAGS = "tags"
+
+_OWNER_LABELS = {USERS: "User", GROUPS: "Group"}
+_OWNER_KINDS = {label: kind for kind, label in _OWNER_LABELS.items()}
+
+
+class BidirectionalMap:
+    """Names and IDs of one kind of identity, with O(1) lookups both ways."""
+
+    __slots__ = ("_ids", "_names", "_objects")
+
+    def __init__(self):
+        self._ids = {}  # name -> ID
+        self._names = {}  # ID -> name
+        self._objects = {}  # name -> pyatlan object it was resolved from
+
+    def put(self, name, id_, obj=None):
+        """Add or replace an identity, dropping any stale pairing of either side."""
+        stale_id = self._ids.get(name)
+        if stale_id is not None and stale_id != id_:
+            self._names.pop(stale_id, None)
+        stale_name = self._names.get(id_)
+        if stale_name is not None and stale_name != name:
+            self._ids.pop(stale_name, None)
+            self._objects.pop(stale_name, None)
+        self._ids[name] = id_
+        self._names[id_] = name
+        if obj is not None:
+            self._objects[name] = obj
+
+    def id_for(self, name):
+        return self._ids.get(name)
+
+    def name_for(self, id_):
+        return self._names.get(id_)
+
+    def object_for(self, name):
+        return self._objects.get(name)
+
+    def __len__(self):
+        return len(self._ids)
+
+
+class _TenantIdentities:
+    """Maps and remembered misses of one tenant and API token."""
+
+    __slots__ = ("maps", "misses", "lock")
+
+    def __init__(self):
+        self.maps = {kind: BidirectionalMap() for kind in (USERS, GROUPS, TAGS)}
+        self.misses = {}  # (kind, "name" or "id", key) -> when Atlan last did not know it
+        self.lock = threading.Lock()
+
+
+_tenants = {}  # Cache scope -> _TenantIdentities
+_tenants_lock = threading.Lock()
+
+
+def _identities(client):
+    scope = get_cache_scope(client)
+    with _tenants_lock:
+        identities = _tenants.get(scope)
+        if identities is None:
+            identities = _tenants[scope] = _TenantIdentities()
+        return identities
+
+
+def _fetch_users(client, field, keys):
+    """Fetch the users whose username or ID is in ``keys``, in one request."""
+    response = client.user.get(limit=len(keys), post_filter=json.dumps({field: {"$in": list(keys)}}))
+    return [(user.username, user.id, user) for user in response.records or [] if user.username and user.id]
+
+
+def _fetch_groups(client, field, keys):
+    """Fetch the groups whose alias or ID is in ``keys``, in one request."""
+    response = client.group.get(limit=len(keys), post_filter=json.dumps({field: {"$in": list(keys)}}))
+    return [(group.alias, group.id, group) for group in response.records or [] if group.alias and group.id]
+
+
+def _fetch_tags(client, field, keys):
+    """
+    Fetch the tag definitions with the given internal names (IDs) one by one, or
+    for display names all of them: Atlan has no lookup of a tag by display name,
+    and its typedef endpoint cannot return only the definitions changed since a time.
+    """
+    from pyatlan.errors import NotFoundError
+    from pyatlan.model.enums import AtlanTypeCategory
+
+    if field == "name":
+        tags = []
+        for key in keys:
+            try:
+                tags.append(client.typedef.get_by_name(key))
+            except NotFoundError:
+                continue
+    else:
+        tags = client.typedef.get(type_category=[AtlanTypeCategory.CLASSIFICATION]).atlan_tag_defs or []
+    return [
+        (tag.display_name, tag.name, tag)
+        for tag in tags if getattr(tag, "category", None) == AtlanTypeCategory.CLASSIFICATION and tag.display_name
+    ]
+
+
+_FETCHERS = {
+    USERS: (_fetch_users, {"name": "username", "id": "id"}),
+    GROUPS: (_fetch_groups, {"name": "alias", "id": "id"}),
+    TAGS: (_fetch_tags, {"name": "displayName", "id": "name"}),
+}
+
+
+def seed_identities(client, kind, entries):
+    """
+    Add identities loaded elsewhere (e.g. the full user list) to the tenant's maps.
+
+    Args:
+        client: AtlanClient of the tenant
+        kind: USERS, GROUPS or TAGS
+        entries: Iterable of (name, ID, pyatlan object)
+    """
+    identities = _identities(client)
+    with identities.lock:
+        identity_map = identities.maps[kind]
+        for name, id_, obj in entries:
+            identity_map.put(name, id_, obj)
+            identities.misses.pop((kind, "name", name), None)
+            identities.misses.pop((kind, "id", id_), None)
+
+
+def _resolve(client, kind, side, keys):
+    """Look keys up on one side of a map, fetching the unknown ones that were not recently missed."""
+    identities = _identities(client)
+    lookup = BidirectionalMap.id_for if side == "name" else BidirectionalMap.name_for
+    keys = list(dict.fromkeys(key for key in keys if key))
+    now = time.monotonic()
+    with identities.lock:
+        identity_map = identities.maps[kind]
+        missing = [
+            key for key in keys
+            if lookup(identity_map, key) is None
+            and now - identities.misses.get((kind, side, key), -IDENTITY_MISS_TTL) >= IDENTITY_MISS_TTL
+        ]
+
+    if missing:
+        fetch, fields = _FETCHERS[kind]
+        seed_identities(client, kind, fetch(client, fields[side], missing))
+        with identities.lock:
+            for key in missing:
+                if lookup(identities.maps[kind], key) is None:
+                    identities.misses[(kind, side, key)] = now
+
+    with identities.lock:
+        identity_map = identities.maps[kind]
+        resolved = {key: lookup(identity_map, key) for key in keys}
+    return {key: value for key, value in resolved.items() if value is not None}
+
+
+def resolve_ids(client, kind, names):
+    """
+    Resolve usernames, group aliases or tag display names to their Atlan IDs.
+
+    Args:
+        client: AtlanClient of the tenant
+        kind: USERS, GROUPS or TAGS
+        names: Names to resolve
+
+    Returns:
+        Mapping of each name Atlan knows to its ID (unknown names are left out)
+    """
+    return _resolve(client, kind, "name", names)
+
+
+def resolve_names(client, kind, ids):
+    """
+    Resolve Atlan user, group or tag IDs back to their usernames, aliases or display names.
+
+    Returns:
+        Mapping of each known ID to its name (unknown IDs are left out)
+    """
+    return _resolve(client, kind, "id", ids)
+
+
+def get_identity(client, kind, name):
+    """Get the pyatlan user, group or tag definition a name was resolved from, or None."""
+    identities = _identities(client)
+    with identities.lock:
+        return identities.maps[kind].object_for(name)
+
+
+def owner_label(kind, name):
+    """Label an owner is shown under in the owner picker, e.g. "User: jsmith"."""
+    return f"{_OWNER_LABELS[kind]}: {name}"
+
+
+def split_owner_labels(labels):
+    """
+    Split owner picker labels into usernames and group aliases.
+
+    Returns:
+        Tuple of (usernames, group aliases)
+    """
+    owners = {USERS: [], GROUPS: []}
+    for label in labels:
+        prefix, _, name = label.partition(": ")
+        kind = _OWNER_KINDS.get(prefix)
+        if kind is not None and name:
+            owners[kind].append(name)
+    return owners[USERS], owners[GROUPS]
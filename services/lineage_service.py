@@ -0,0 +1,195 @@
+"""
+Column-level lineage between ApplicationFields and the columns they read or feed.
+
+Mappings are grouped into one ColumnProcess per field and direction, under
+an asset-level Process linking the columns' tables or views to the
+application. Processes with identical inputs and outputs would share a
+qualified name (pyatlan hashes them), so they are de-duplicated before they
+are built, and the column processes are built and written in chunks through
+the concurrent bulk writer.
+"""
+
+import streamlit as st
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.assets import Asset, Column, ColumnProcess, Process
+from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
+from services.atlan_client import execute_with_auto_reconnect
+from services.asset_service import save_process
+from services.bulk_writer import save_concurrently, chunked
+from services.write_through import notify_assets_written
+from utils.compact_state import AssetRef
+from utils.lineage_mapping import UPSTREAM, DOWNSTREAM, group_mappings
+from config.settings import DEFAULT_PAGE_SIZE, COLUMN_LINEAGE_BATCH_SIZE, COLUMN_LINEAGE_MAX_COLUMNS
+
+
+def _fetch_columns_core(client: AtlanClient, parent_qualified_names):
+    """Page through the active columns of the given tables and views, with minimal attributes."""
+    parents = list(parent_qualified_names)
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(Column))
+        .where(CompoundQuery.active_assets())
+        .where_some(Column.TABLE_QUALIFIED_NAME.within(parents))
+        .where_some(Column.VIEW_QUALIFIED_NAME.within(parents))
+        .min_somes(1)
+        .page_size(DEFAULT_PAGE_SIZE)
+        .include_on_results(Asset.NAME)
+        .include_on_results(Column.TABLE_QUALIFIED_NAME)
+        .include_on_results(Column.VIEW_QUALIFIED_NAME)
+    ).to_request()
+
+    columns = []
+    for column in client.asset.search(request):
+        if len(columns) >= COLUMN_LINEAGE_MAX_COLUMNS:
+            st.warning(f"Only the first {COLUMN_LINEAGE_MAX_COLUMNS} columns were matched by name.")
+            break
+        parent = getattr(column, "table_qualified_name", None) or getattr(column, "view_qualified_name", None)
+        if column.name and parent:
+            columns.append((column.name, column.qualified_name, parent))
+    return columns
+
+
+def fetch_columns(client: AtlanClient, parent_qualified_names):
+    """
+    Fetch the columns of tables and views with auto-reconnect.
+
+    Returns:
+        List of (column name, column qualified name, parent qualified name)
+    """
+    if not parent_qualified_names:
+        return []
+    result = execute_with_auto_reconnect(_fetch_columns_core, client, parent_qualified_names)
+    return result if result is not None else []
+
+
+def _resolve_columns_core(client: AtlanClient, column_qualified_names):
+    """Look up active columns by qualified name in one search, returning {column qualified name: parent qualified name}."""
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(Column))
+        .where(CompoundQuery.active_assets())
+        .where(Asset.QUALIFIED_NAME.within(list(column_qualified_names)))
+        .page_size(DEFAULT_PAGE_SIZE)
+        .include_on_results(Column.TABLE_QUALIFIED_NAME)
+        .include_on_results(Column.VIEW_QUALIFIED_NAME)
+    ).to_request()
+    return {
+        column.qualified_name: getattr(column, "table_qualified_name", None) or getattr(column, "view_qualified_name", None)
+        for column in client.asset.search(request)
+    }
+
+
+def check_mapped_columns(client: AtlanClient, mappings, directions):
+    """
+    Keep the mappings whose column exists and belongs to a selected lineage asset of the mapping's direction.
+
+    Args:
+        client: AtlanClient instance
+        mappings: (field name, column qualified name, direction) tuples
+        directions: Mapping of selected lineage asset qualified name to UPSTREAM or DOWNSTREAM
+
+    Returns:
+        Tuple of (usable mappings, mappings to unknown columns, mappings to columns of
+        other assets), or None if the columns could not be looked up
+    """
+    mappings = list(mappings)
+    column_qns = {column for _, column, _ in mappings}
+    parents = execute_with_auto_reconnect(_resolve_columns_core, client, column_qns) if column_qns else {}
+    if parents is None:
+        return None
+    usable, unknown, out_of_scope = [], [], []
+    for mapping in mappings:
+        _, column, direction = mapping
+        if column not in parents:
+            unknown.append(mapping)
+        elif directions.get(parents[column]) != direction:
+            out_of_scope.append(mapping)
+        else:
+            usable.append(mapping)
+    return usable, unknown, out_of_scope
+
+
+def _column_parent(qualified_name):
+    # Column qualified names are their table's or view's followed by "/<column name>"
+    return qualified_name.rsplit("/", 1)[0]
+
+
+def create_column_lineage(client: AtlanClient, mappings, field_names, app_qualified_name, app_name, connection_qualified_name):
+    """
+    Create field-to-column lineage for an application.
+
+    Args:
+        client: AtlanClient instance
+        mappings: (field name, column qualified name, direction) tuples
+        field_names: Names of the application's fields; mappings to other names are skipped
+        app_qualified_name: Qualified name of the application
+        app_name: Name of the application, used to name the processes
+        connection_qualified_name: Connection the processes are created in
+    """
+    field_names = set(field_names)
+    groups = group_mappings(m for m in mappings if m[0] in field_names)
+    unmatched = {m[0] for m in mappings} - field_names
+    if unmatched:
+        st.warning(f"Skipping mappings for {len(unmatched)} unknown fields: {', '.join(sorted(unmatched)[:10])}")
+    if not groups:
+        return
+
+    # One asset-level process per direction is the parent of its column processes
+    parents = {}
+    for direction in (UPSTREAM, DOWNSTREAM):
+        columns = {column for (_, group_direction), group in groups.items() if group_direction == direction for column in group}
+        if not columns:
+            continue
+        sources = [Asset.ref_by_qualified_name(qn) for qn in sorted({_column_parent(c) for c in columns})]
+        application = [Asset.ref_by_qualified_name(app_qualified_name)]
+        parent = Process.creator(
+            name=f"{app_name} Field Lineage ({direction})",
+            connection_qualified_name=connection_qualified_name,
+            inputs=sources if direction == UPSTREAM else application,
+            outputs=application if direction == UPSTREAM else sources,
+        )
+        if save_process(client, parent) is None:
+            st.error(f"❌ Could not create the {direction} field lineage process; its column lineage was skipped.")
+            continue
+        parents[direction] = Process.ref_by_qualified_name(parent.qualified_name)
+
+    # Identical inputs and outputs make the same process (pyatlan hashes them into its qualified name)
+    specs = {}
+    for (field_name, direction), columns in sorted(groups.items()):
+        if direction not in parents:
+            continue
+        field = (f"{app_qualified_name}/{field_name}",)
+        inputs, outputs = (tuple(columns), field) if direction == UPSTREAM else (field, tuple(columns))
+        specs.setdefault((inputs, outputs), (f"{app_name}.{field_name} ({direction})", direction))
+    if not specs:
+        return
+
+    def build(chunk):
+        return [
+            ColumnProcess.creator(
+                name=name,
+                connection_qualified_name=connection_qualified_name,
+                inputs=[Asset.ref_by_qualified_name(qn) for qn in inputs],
+                outputs=[Asset.ref_by_qualified_name(qn) for qn in outputs],
+                parent=parents[direction],
+            )
+            for (inputs, outputs), (name, direction) in chunk
+        ]
+
+    st.write(f"🧬 **Creating {len(specs)} column-level lineage processes...**")
+    result = save_concurrently(
+        client, "create_column_lineage", chunked(list(specs.items()), COLUMN_LINEAGE_BATCH_SIZE),
+        COLUMN_LINEAGE_BATCH_SIZE, build=build,
+    )
+    # Creators carry placeholder GUIDs, so the processes are identified by qualified name
+    notify_assets_written(client, [AssetRef(None, p.qualified_name, "ColumnProcess", p.name) for p in result.written])
+    if result.written:
+        st.success(
+            f"✅ Created {len(result.written)} column-level lineage processes in {result.seconds:.1f}s "
+            f"({result.items_per_second:.0f} processes/s)"
+        )
+    if result.failures:
+        st.error(
+            f"❌ Failed to create {result.failed_items} lineage processes in {len(result.failures)} requests: "
+            f"{result.failures[0][1]}"
+        )
@@ -0,0 +1,205 @@
+"""
+In-memory performance metrics for the admin dashboard.
+
+Finished tracing spans are summarised into a fixed-size ring buffer of
+samples (category, name, duration, items), so keeping metrics on costs one
+deque append per Atlan call or step render. Cache lookups and session
+activity are tracked with plain counters. The dashboard computes rolling
+percentiles from the buffer on demand.
+
+Recording is off unless ``ATLAN_METRICS_ENABLED=1`` is set or an admin
+switches it on from the dashboard, so spans stay no-ops when nothing else
+exports them.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+
+from config.settings import (
+    METRICS_ENABLED,
+    METRICS_RING_SIZE,
+    METRICS_WINDOW_SECONDS,
+    ACTIVE_SESSION_WINDOW_SECONDS,
+)
+from services.rate_limiter import get_all_limiter_stats
+from services.single_flight import atlan_reads
+from services.tracing import register_exporter, unregister_exporter
+
+# Sample categories
+SERVICE_CATEGORY = "service"
+STEP_CATEGORY = "step"
+
+_samples = deque(maxlen=METRICS_RING_SIZE)  # (timestamp, category, name, duration_ms, items, failed)
+_cache_counters = {}  # cache name -> [lookups, misses]
+_sessions = {}  # session id -> last rerun timestamp
+_lock = threading.Lock()
+_enabled = False
+
+
+class MetricsRecorder:
+    """Tracing exporter that records Atlan call and wizard step spans in the ring buffer."""
+
+    def export(self, span_obj):
+        attributes = span_obj.attributes
+        if "wizard.step" in attributes:
+            category, name = STEP_CATEGORY, attributes["wizard.step"]
+        elif "atlan.operation" in attributes:
+            category, name = SERVICE_CATEGORY, attributes["atlan.operation"]
+        else:
+            return
+        sample = (time.time(), category, name, span_obj.duration_ms, attributes.get("batch.items"), span_obj.error is not None)
+        with _lock:
+            _samples.append(sample)
+
+
+_recorder = MetricsRecorder()
+
+
+def metrics_enabled():
+    """Check whether metrics are being recorded."""
+    return _enabled
+
+
+def set_metrics_enabled(enabled):
+    """Start or stop recording metrics for every session of this app process."""
+    global _enabled
+    _enabled = bool(enabled)
+    if _enabled:
+        register_exporter(_recorder)
+    else:
+        unregister_exporter(_recorder)
+
+
+def record_cache_lookup(cache_name):
+    """Count a lookup against a cache (users, tags, connections)."""
+    if not _enabled:
+        return
+    with _lock:
+        _cache_counters.setdefault(cache_name, [0, 0])[0] += 1
+
+
+def record_cache_miss(cache_name):
+    """Count a lookup that had to go to Atlan."""
+    if not _enabled:
+        return
+    with _lock:
+        _cache_counters.setdefault(cache_name, [0, 0])[1] += 1
+
+
+def record_session_activity(session_id):
+    """Mark a session as active (called on every rerun)."""
+    if not _enabled:
+        return
+    now = time.time()
+    with _lock:
+        _sessions[session_id] = now
+        # Forget sessions that have long gone away
+        for stale_id in [sid for sid, seen in _sessions.items() if now - seen > 10 * ACTIVE_SESSION_WINDOW_SECONDS]:
+            del _sessions[stale_id]
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _recent_samples(category, window):
+    cutoff = time.time() - window
+    with _lock:
+        samples = list(_samples)
+    return [s for s in samples if s[1] == category and s[0] >= cutoff]
+
+
+def latency_summary(category, window=METRICS_WINDOW_SECONDS):
+    """
+    Summarise rolling latency per operation or step.
+
+    Args:
+        category: SERVICE_CATEGORY or STEP_CATEGORY
+        window: Rolling window in seconds
+
+    Returns:
+        List of dicts with name, calls, errors and p50/p95/p99 in milliseconds, slowest first
+    """
+    durations = {}
+    errors = {}
+    for _, _, name, duration_ms, _, failed in _recent_samples(category, window):
+        durations.setdefault(name, []).append(duration_ms)
+        errors[name] = errors.get(name, 0) + failed
+
+    rows = [
+        {
+            "name": name,
+            "calls": len(values),
+            "errors": errors[name],
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "p99_ms": round(percentile(values, 99), 1),
+        }
+        for name, values in durations.items()
+    ]
+    return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+
+def bulk_throughput(window=METRICS_WINDOW_SECONDS):
+    """
+    Get the rolling throughput of bulk writes.
+
+    Returns:
+        Dict with items written, seconds spent writing and items per second
+    """
+    items = 0
+    seconds = 0.0
+    for _, _, _, duration_ms, batch_items, failed in _recent_samples(SERVICE_CATEGORY, window):
+        if batch_items and not failed:
+            items += batch_items
+            seconds += duration_ms / 1000
+    return {
+        "items": items,
+        "seconds": round(seconds, 2),
+        "items_per_second": round(items / seconds, 1) if seconds else 0.0,
+    }
+
+
+def cache_hit_rates():
+    """Get lookups, misses and hit rate for every tracked cache."""
+    with _lock:
+        counters = {name: tuple(values) for name, values in _cache_counters.items()}
+    return [
+        {
+            "cache": name,
+            "lookups": lookups,
+            "misses": misses,
+            "hit_rate": round(1 - misses / lookups, 3) if lookups else None,
+        }
+        for name, (lookups, misses) in sorted(counters.items())
+    ]
+
+
+def active_session_count(window=ACTIVE_SESSION_WINDOW_SECONDS):
+    """Count sessions that reran within the window."""
+    cutoff = time.time() - window
+    with _lock:
+        return sum(1 for seen in _sessions.values() if seen >= cutoff)
+
+
+def in_flight_requests():
+    """
+    Get the Atlan operations currently in flight in this process.
+
+    Returns:
+        Dict with per-lane operation counts summed over tenants and coalesced reads in flight
+    """
+    lanes = {}
+    for tenant_stats in get_all_limiter_stats():
+        for lane, lane_stats in tenant_stats["lanes"].items():
+            lanes[lane] = lanes.get(lane, 0) + lane_stats["in_flight"]
+    return {"lanes": lanes, "coalesced_reads": atlan_reads.stats()["in_flight"]}
+
+
+if METRICS_ENABLED:
+    set_metrics_enabled(True)
@@ -0,0 +1,252 @@
+"""
+Batched replay of queued drafts.
+
+Each queued draft is compiled into the writes the wizard's submission makes,
+and the writes of all drafts are sent together, stage by stage: new
+connections, then the applications (with their owners and owned assets),
+then fields, owned-asset back-references and lineage processes, and finally
+tags. Every stage is chunked into REPLAY_BATCH_SIZE assets per request
+through the concurrent bulk writer, so a queue of ten drafts costs about as
+many requests as one. Qualified names of new applications and fields are
+derived client-side, which is what lets later stages be built before earlier
+ones are written.
+
+A draft is only as far along as its least successful chunk: a draft with a
+failed chunk skips the remaining stages and is reported with the error, so
+it can stay queued. Every write is an upsert, so replaying it again is safe
+(its new connection, once created, is reported so the draft can reuse it).
+"""
+
+import logging
+import time
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.assets import Application, ApplicationField, Asset, Connection
+from pyatlan.model.enums import AtlanConnectorType
+from config.settings import REPLAY_BATCH_SIZE
+from services.asset_service import (
+    application_field_writer, tag_updater, plan_lineage_processes, lineage_process_writer, archive_assets,
+)
+from services.bulk_writer import save_concurrently, chunked
+from services.identity_cache import TAGS, resolve_ids
+from services.write_through import notify_assets_written
+from utils.compact_state import AssetRef
+
+logger = logging.getLogger(__name__)
+
+_FIELD = "field"
+_OWNED_ASSET = "owned_asset"
+_PROCESS = "process"
+
+
+class ReplayResult:
+    """Outcome of replaying queued drafts."""
+
+    __slots__ = ("submitted", "failed", "connections", "skipped_tags", "written", "requests", "seconds")
+
+    def __init__(self):
+        self.submitted = {}  # Draft ID -> qualified name of its application
+        self.failed = {}  # Draft ID -> error of the stage it stopped at
+        self.connections = {}  # Draft ID -> qualified name of the connection created for it
+        self.skipped_tags = set()  # Tag names that no longer exist
+        self.written = 0  # Assets written, across stages
+        self.requests = 0
+        self.seconds = 0.0
+
+
+def _next_qualified_name(qualified_name):
+    # Connection qualified names end with the epoch second they were built in
+    prefix, _, epoch = qualified_name.rpartition("/")
+    return f"{prefix}/{int(epoch) + 1}" if epoch.isdigit() else f"{qualified_name}-1"
+
+
+def _admin_role_ids(client: AtlanClient):
+    try:
+        guid = client.role_cache.get_id_for_name("$admin")
+    except Exception:
+        return []  # If the admin role doesn't exist, connections are created without it
+    return [guid] if guid else []
+
+
+def _application_writer(details, enrichment, connection_qualified_name, owned_assets):
+    """The Application creator or updater of a draft, with its owners and owned assets (None leaves them as they are)."""
+    if details.get("is_update"):
+        application = Application.updater(qualified_name=details["qualified_name"], name=details["name"])
+    else:
+        application = Application.creator(name=details["name"], connection_qualified_name=connection_qualified_name)
+    if details.get("app_id"):
+        application.app_id = details["app_id"]
+    if enrichment.get("description"):
+        application.description = enrichment["description"]
+    if enrichment.get("owner_users"):
+        application.owner_users = set(enrichment["owner_users"])
+    if enrichment.get("owner_groups"):
+        application.owner_groups = set(enrichment["owner_groups"])
+    if owned_assets is not None:
+        # Set (or cleared) with the application instead of in a follow-up request
+        application.application_owned_assets = [Asset.ref_by_qualified_name(ref.qualified_name) for ref in owned_assets]
+    return application
+
+
+def _related_writer(client, kind, *args):
+    """Build one asset of the fields / owned assets / lineage stage."""
+    if kind == _FIELD:
+        field_data, app_qualified_name = args
+        return application_field_writer(field_data, app_qualified_name)
+    if kind == _OWNED_ASSET:
+        ref, app_qualified_name = args
+        updater = ref.trim_to_required(client)
+        updater.application_qualified_name = app_qualified_name
+        return updater
+    return lineage_process_writer(*args)
+
+
+def replay_submissions(client: AtlanClient, submissions, admin_username, on_stage=None):
+    """
+    Submit several drafts together, one batched stage at a time.
+
+    Validation is not repeated: unknown tags are skipped, and references that
+    no longer exist fail their draft's chunk.
+
+    Args:
+        client: AtlanClient instance
+        submissions: Mapping of draft ID to its submission (see ``utils.drafts.draft_submission``)
+        admin_username: Admin of any connection created for a draft
+        on_stage: Optional callback taking a stage description and the number of assets it writes
+
+    Returns:
+        ReplayResult
+    """
+    started = time.monotonic()
+    result = ReplayResult()
+    pending = dict(submissions)
+
+    def run(operation, specs, make, **save_kwargs):
+        """Save a stage's (draft IDs, build args) specs; drafts in failed chunks drop out of the replay."""
+        if not specs:
+            return
+        stage = save_concurrently(
+            client, operation, chunked(specs, REPLAY_BATCH_SIZE), REPLAY_BATCH_SIZE,
+            build=lambda chunk: [make(*args) for _, args in chunk], **save_kwargs,
+        )
+        result.requests += stage.requests
+        result.written += len(stage.written)
+        for chunk, error in stage.failures:
+            for draft_ids, _ in chunk:
+                for draft_id in draft_ids:
+                    if pending.pop(draft_id, None) is not None:
+                        result.failed[draft_id] = f"{operation} failed: {error}"
+        # Creators and updaters carry placeholder GUIDs, so the assets are identified by qualified name
+        notify_assets_written(client, [AssetRef(None, a.qualified_name, a.type_name, a.name) for a in stage.written])
+
+    def report(description, count):
+        if on_stage is not None and count:
+            on_stage(description, count)
+
+    # Stage 1: one connection per distinct new connection name
+    new_connections = {}
+    for draft_id, submission in pending.items():
+        details = submission["asset_details"]
+        if details.get("create_new_connection") and not details.get("is_update"):
+            new_connections.setdefault(details["new_connection_name"], []).append(draft_id)
+    specs = []
+    used = set()
+    admin_roles = _admin_role_ids(client) if new_connections else []
+    for name, draft_ids in new_connections.items():
+        try:
+            connection = Connection.creator(
+                client=client, name=name, connector_type=AtlanConnectorType.API,
+                admin_users=[admin_username], admin_roles=admin_roles,
+            )
+        except Exception as e:
+            for draft_id in draft_ids:
+                pending.pop(draft_id, None)
+                result.failed[draft_id] = f"Could not create connection '{name}': {e}"
+            continue
+        # pyatlan names connections after the current second, so connections built together would collide
+        while connection.qualified_name in used:
+            connection.qualified_name = _next_qualified_name(connection.qualified_name)
+        used.add(connection.qualified_name)
+        specs.append((tuple(draft_ids), (connection,)))
+    report("Creating connections", len(specs))
+    run("replay_connections", specs, lambda connection: connection)
+    for draft_ids, (connection,) in specs:
+        for draft_id in draft_ids:
+            if draft_id in pending:
+                result.connections[draft_id] = connection.qualified_name
+
+    # Stage 2: the applications
+    applications = {}
+    for draft_id, submission in list(pending.items()):
+        details = submission["asset_details"]
+        connection_qn = result.connections.get(draft_id) or details.get("connection_qualified_name")
+        try:
+            applications[draft_id] = _application_writer(
+                details, submission["enrichment_details"], connection_qn, submission["owned_assets"]
+            )
+        except Exception as e:
+            pending.pop(draft_id)
+            result.failed[draft_id] = f"Invalid application: {e}"
+    report("Saving applications", len(applications))
+    run("replay_applications", [((draft_id,), (app,)) for draft_id, app in applications.items()], lambda app: app)
+
+    # Stage 3: fields, owned-asset back-references and lineage processes (emptied ones archived after)
+    specs = []
+    archived = {}
+    for draft_id, submission in pending.items():
+        details = submission["asset_details"]
+        app_qn = applications[draft_id].qualified_name
+        connection_qn = result.connections.get(draft_id) or details.get("connection_qualified_name")
+        for field in details["fields"]:
+            if field.get("name") and not field.get("mark_for_deletion"):
+                if field.get("is_existing") and not field.get("qualified_name"):
+                    continue
+                specs.append(((draft_id,), (client, _FIELD, field.to_dict(), app_qn)))
+        for ref in submission["owned_assets"] or ():
+            specs.append(((draft_id,), (client, _OWNED_ASSET, ref, app_qn)))
+        writes, archived[draft_id], _ = plan_lineage_processes(
+            details["name"], app_qn,
+            [ref.qualified_name for ref in submission["lineage_inputs"]],
+            [ref.qualified_name for ref in submission["lineage_outputs"]],
+            submission.get("lineage_processes") or (),
+        )
+        for name, qualified_name, inputs, outputs in writes:
+            specs.append(((draft_id,), (client, _PROCESS, name, qualified_name, connection_qn, inputs, outputs)))
+    report("Saving fields, owned assets and lineage", len(specs))
+    run("replay_related_assets", specs, _related_writer)
+    for draft_id, guids in archived.items():
+        if guids and draft_id in pending:
+            try:
+                archive_assets(client, guids)
+                result.requests += 1
+            except Exception as e:
+                pending.pop(draft_id)
+                result.failed[draft_id] = f"Archiving emptied lineage processes failed: {e}"
+
+    # Stage 4: application and field tags, appended to any tags already there
+    tagged = []
+    for draft_id, submission in pending.items():
+        app = applications[draft_id]
+        tags = tuple(submission["enrichment_details"].get("tag_names") or ())
+        if tags:
+            tagged.append((draft_id, Application, app.qualified_name, app.name, tags))
+        for field in submission["asset_details"]["fields"]:
+            tags = tuple(field.get("tags") or ())
+            if tags and field.get("name") and not field.get("mark_for_deletion"):
+                qualified_name = field.get("qualified_name") or f"{app.qualified_name}/{field['name']}"
+                tagged.append((draft_id, ApplicationField, qualified_name, field["name"], tags))
+    if tagged:
+        known = resolve_ids(client, TAGS, {tag for *_, tags in tagged for tag in tags})
+        result.skipped_tags = {tag for *_, tags in tagged for tag in tags if tag not in known}
+        specs = [
+            ((draft_id,), (asset_type, qualified_name, name, [tag for tag in tags if tag in known]))
+            for draft_id, asset_type, qualified_name, name, tags in tagged
+            if any(tag in known for tag in tags)
+        ]
+        report("Tagging applications and fields", len(specs))
+        run("replay_tags", specs, tag_updater, append_atlan_tags=True)
+
+    for draft_id in pending:
+        result.submitted[draft_id] = applications[draft_id].qualified_name
+    result.seconds = time.monotonic() - started
+    return result
@@ -0,0 +1,318 @@
+"""
+Per-tenant concurrency limiting and adaptive rate control for Atlan calls.
+
+Each tenant gets a process-wide bulkhead with separate lanes for interactive
+reads and bulk writes. Every lane has its own token bucket (requests per
+second) and concurrency semaphore, so long-running imports cannot starve
+searches. When Atlan answers 429, the tenant's rate is cut multiplicatively and
+requests pause for the ``Retry-After`` period; successful responses slowly
+restore the full rate.
+
+The limiter sits beneath pyatlan's retry transport, which is configured not
+to retry 429s: every attempt is throttled here, and a rate-limited attempt is
+retried here after the backoff, with the operation's concurrency slot given
+up while it waits.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from config.settings import (
+    RATE_LIMIT_LANES,
+    RATE_LIMIT_MIN_FACTOR,
+    RATE_LIMIT_RECOVERY_STEP,
+    RATE_LIMIT_DEFAULT_BACKOFF,
+    RATE_LIMIT_MAX_RETRIES,
+)
+from services.tracing import current_span
+
+INTERACTIVE_LANE = "interactive"
+BULK_LANE = "bulk"
+
+# Lane of the operation running in the current thread, if any, and the limiter it holds a slot of
+_current_lane = contextvars.ContextVar("atlan_rate_limit_lane", default=None)
+_slot_holder = contextvars.ContextVar("atlan_rate_limit_slot_holder", default=None)
+
+
+def current_lane():
+    """Get the lane of the operation running in the current thread (interactive by default)."""
+    return _current_lane.get() or INTERACTIVE_LANE
+
+
+def parse_retry_after(value):
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket where callers reserve a token and wait for it if needed."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, rate_factor=1.0):
+        """
+        Take one token, going into debt if none is available.
+
+        Args:
+            rate_factor: Multiplier applied to the refill rate (adaptive backoff)
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        rate = self.rate * rate_factor
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / rate
+
+
+class _Lane:
+    """Token bucket, concurrency semaphore and counters for one lane of a tenant."""
+
+    __slots__ = ("bucket", "semaphore", "in_flight", "requests", "throttled_seconds")
+
+    def __init__(self, rate, burst, concurrency):
+        self.bucket = TokenBucket(rate, burst)
+        self.semaphore = threading.BoundedSemaphore(concurrency)
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled_seconds = 0.0
+
+
+class TenantLimiter:
+    """Bulkhead for a single Atlan tenant."""
+
+    def __init__(self, tenant, lanes=RATE_LIMIT_LANES):
+        self.tenant = tenant
+        self._lanes = {name: _Lane(**config) for name, config in lanes.items()}
+        self._lock = threading.Lock()
+        self._rate_factor = 1.0
+        self._blocked_until = 0.0
+        self._rate_limited = 0
+
+    @contextmanager
+    def slot(self, lane=None):
+        """
+        Hold a concurrency slot in a lane for the duration of an operation.
+
+        Nested use within the same thread re-uses the outer slot.
+
+        Args:
+            lane: INTERACTIVE_LANE or BULK_LANE; defaults to the current lane
+        """
+        if _current_lane.get() is not None:
+            yield
+            return
+
+        lane = lane or INTERACTIVE_LANE
+        state = self._lanes[lane]
+        state.semaphore.acquire()
+        token = _current_lane.set(lane)
+        holder_token = _slot_holder.set(self)
+        with self._lock:
+            state.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                state.in_flight -= 1
+            _slot_holder.reset(holder_token)
+            _current_lane.reset(token)
+            state.semaphore.release()
+
+    @contextmanager
+    def released(self):
+        """Give up the current thread's slot in this limiter (if it holds one) for a while, e.g. to back off."""
+        if _slot_holder.get() is not self:
+            yield
+            return
+
+        state = self._lanes[current_lane()]
+        with self._lock:
+            state.in_flight -= 1
+        state.semaphore.release()
+        try:
+            yield
+        finally:
+            state.semaphore.acquire()
+            with self._lock:
+                state.in_flight += 1
+
+    def throttle(self, lane=None):
+        """Block until the lane's token bucket and any Retry-After pause allow another request."""
+        state = self._lanes[lane or current_lane()]
+        wait = state.bucket.reserve(self._rate_factor)
+        wait = max(wait, self._blocked_until - time.monotonic())
+        with self._lock:
+            state.requests += 1
+            state.throttled_seconds += max(wait, 0.0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def record_rate_limited(self, retry_after=None):
+        """
+        Feed back a 429 response: halve the rate and pause all lanes.
+
+        Args:
+            retry_after: Seconds from the ``Retry-After`` header, if present
+        """
+        delay = retry_after if retry_after is not None else RATE_LIMIT_DEFAULT_BACKOFF / self._rate_factor
+        with self._lock:
+            self._rate_limited += 1
+            self._rate_factor = max(RATE_LIMIT_MIN_FACTOR, self._rate_factor / 2)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+    def record_success(self):
+        """Feed back a successful response: restore the rate additively."""
+        if self._rate_factor < 1.0:
+            with self._lock:
+                self._rate_factor = min(1.0, self._rate_factor + RATE_LIMIT_RECOVERY_STEP)
+
+    def backoff_delay(self):
+        """Seconds to wait before retrying an operation that was rate limited."""
+        return max(self._blocked_until - time.monotonic(), RATE_LIMIT_DEFAULT_BACKOFF * (1 - self._rate_factor))
+
+    def stats(self):
+        """Return the current rate factor, 429 count and per-lane counters."""
+        with self._lock:
+            return {
+                "tenant": self.tenant,
+                "rate_factor": round(self._rate_factor, 3),
+                "rate_limited": self._rate_limited,
+                "paused_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+                "lanes": {
+                    name: {
+                        "in_flight": state.in_flight,
+                        "requests": state.requests,
+                        "throttled_seconds": round(state.throttled_seconds, 3),
+                    }
+                    for name, state in self._lanes.items()
+                },
+            }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_tenant_limiter(tenant):
+    """Get (or create) the process-wide limiter for a tenant."""
+    with _limiters_lock:
+        limiter = _limiters.get(tenant)
+        if limiter is None:
+            limiter = _limiters[tenant] = TenantLimiter(tenant)
+        return limiter
+
+
+def configure_tenant_limiter(tenant, lanes):
+    """
+    Replace a tenant's limiter with one using custom lane settings.
+
+    Args:
+        tenant: Tenant key (see get_tenant_key)
+        lanes: Mapping of lane name to ``rate``, ``burst`` and ``concurrency``
+
+    Returns:
+        The new TenantLimiter
+    """
+    with _limiters_lock:
+        limiter = _limiters[tenant] = TenantLimiter(tenant, lanes)
+        return limiter
+
+
+def get_all_limiter_stats():
+    """Return stats for every tenant limiter in this process."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    HTTP transport throttling every attempt through a tenant's limiter and retrying 429s.
+
+    The limiter is looked up per request, so reconfiguring a tenant takes
+    effect for existing clients too.
+    """
+
+    def __init__(self, transport, tenant):
+        self._transport = transport
+        self._tenant = tenant
+
+    def handle_request(self, request):
+        limiter = get_tenant_limiter(self._tenant)
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            limiter.throttle()
+            response = self._transport.handle_request(request)
+            if response.status_code != 429:
+                if response.status_code < 400:
+                    limiter.record_success()
+                return response
+            limiter.record_rate_limited(parse_retry_after(response.headers.get("Retry-After")))
+            if attempt == RATE_LIMIT_MAX_RETRIES:
+                break
+            response.close()
+            current_span().add("rate_limit.retries")
+            # Other operations of the lane can run while this one waits
+            with limiter.released():
+                time.sleep(limiter.backoff_delay())
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+def install_rate_limiter(http_session, tenant):
+    """
+    Put a tenant's limiter beneath an AtlanClient's retry transport so every HTTP attempt is rate controlled.
+
+    pyatlan's retry transport must not retry 429s itself (see ``create_client``),
+    or its retries would sleep without the limiter knowing and multiply with these.
+
+    Args:
+        http_session: The httpx.Client used by an AtlanClient
+        tenant: Tenant key (see get_tenant_key)
+
+    Returns:
+        The installed RateLimitedTransport
+    """
+    retry_transport = http_session._transport
+    inner = getattr(retry_transport, "_transport", None)
+    if inner is not None:
+        transport = retry_transport._transport = RateLimitedTransport(inner, tenant)
+    else:
+        transport = http_session._transport = RateLimitedTransport(retry_transport, tenant)
+    return transport
@@ -0,0 +1,126 @@
+"""
+Request coalescing (single-flight) for identical concurrent Atlan reads.
+
+When several sessions issue the same read for the same tenant and API token
+at the same time, only the first caller hits Atlan; the others wait for and share its
+result. Successful results are also reused for a short window afterwards.
+"""
+
+import threading
+import time
+
+from config.settings import SINGLE_FLIGHT_RESULT_TTL, SINGLE_FLIGHT_MAX_ENTRIES
+
+
+class _Call:
+    """A single in-flight or recently completed call."""
+
+    __slots__ = ("done", "result", "error", "completed_at")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.completed_at = None
+
+
+class SingleFlight:
+    """
+    Merge concurrent calls with the same key into one execution.
+
+    Results are shared between callers as-is, so they must not be mutated.
+    Failed calls (exceptions or ``None`` results) are never reused.
+    """
+
+    def __init__(self, result_ttl=SINGLE_FLIGHT_RESULT_TTL, max_entries=SINGLE_FLIGHT_MAX_ENTRIES):
+        self._result_ttl = result_ttl
+        self._max_entries = max_entries
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Execute ``func(*args, **kwargs)`` unless an identical call is in flight.
+
+        Args:
+            key: Hashable key identifying the call, starting with its cache scope (see ``get_cache_scope``)
+            func: Function to execute
+            *args, **kwargs: Arguments to pass to the function
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and call.done.is_set():
+                if time.monotonic() - call.completed_at < self._result_ttl:
+                    self._hits += 1
+                    return call.result
+                call = None
+
+            if call is not None:
+                self._coalesced += 1
+                is_leader = False
+            else:
+                if len(self._calls) >= self._max_entries:
+                    self._purge_expired()
+                call = self._calls[key] = _Call()
+                self._misses += 1
+                is_leader = True
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            call.completed_at = time.monotonic()
+            with self._lock:
+                if call.error is not None or call.result is None or self._result_ttl <= 0:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+            call.done.set()
+
+    def forget(self, key_filter=None):
+        """
+        Drop completed results so the next call goes to Atlan.
+
+        Args:
+            key_filter: Optional predicate selecting the keys to drop; all when omitted
+        """
+        with self._lock:
+            for key in list(self._calls):
+                if self._calls[key].done.is_set() and (key_filter is None or key_filter(key)):
+                    del self._calls[key]
+
+    def _purge_expired(self):
+        """Remove completed results older than the TTL. Must hold the lock."""
+        now = time.monotonic()
+        for key in list(self._calls):
+            call = self._calls[key]
+            if call.done.is_set() and now - call.completed_at >= self._result_ttl:
+                del self._calls[key]
+
+    def stats(self):
+        """Return hit, miss and coalesced counters plus the number of calls in flight."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "in_flight": sum(1 for call in self._calls.values() if not call.done.is_set()),
+            }
+
+
+# Process-wide coalescing layer shared by all sessions for Atlan read functions
+atlan_reads = SingleFlight()
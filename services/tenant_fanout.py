@@ -0,0 +1,120 @@
+"""
+Publishing one application definition to several Atlan tenants concurrently.
+
+Each target tenant is written with its own AtlanClient (and so its own HTTP
+connection pool), its own rate limiter and its own bulk-write workers, all
+keyed by the tenant's URL. The definition is re-targeted per tenant: it is
+written as an upsert of ``<connection>/<application name>`` under the
+connection chosen for that tenant, with every field upserted by name, since
+the qualified names of the assets it was loaded from belong to the source
+tenant. Each tenant is replayed through the mutation queue's batched stages
+and reports its own result.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import FANOUT_MAX_WORKERS
+from services.atlan_client import get_tenant_key
+from services.mutation_queue import replay_submissions
+from services.tracing import span
+from utils.compact_state import FieldStore
+
+logger = logging.getLogger(__name__)
+
+_SUBMISSION_KEY = "fanout"
+
+_executor = ThreadPoolExecutor(max_workers=FANOUT_MAX_WORKERS, thread_name_prefix="atlan-fanout")
+
+
+class TenantPublishResult:
+    """Outcome of publishing an application to one tenant."""
+
+    __slots__ = ("tenant", "app_qualified_name", "written", "requests", "skipped_tags", "error", "seconds")
+
+    def __init__(self, tenant, app_qualified_name, written, requests, skipped_tags, error, seconds):
+        self.tenant = tenant
+        self.app_qualified_name = app_qualified_name  # None if the application was not written
+        self.written = written  # Assets written
+        self.requests = requests
+        self.skipped_tags = skipped_tags  # Tag names the tenant does not have
+        self.error = error  # Why publishing stopped, or None
+        self.seconds = seconds
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+
+def retarget_submission(submission, connection_qualified_name=None, new_connection_name=None, include_relationships=False):
+    """
+    Copy a submission for another tenant.
+
+    Args:
+        submission: Submission dict (see ``utils.drafts.draft_submission``)
+        connection_qualified_name: Existing connection in the target tenant
+        new_connection_name: Name of a connection to create in the target tenant instead
+        include_relationships: Keep owned assets and lineage, which then must
+            exist under the same qualified names in the target tenant. Otherwise no
+            lineage is created and an existing application keeps its owned assets.
+
+    Returns:
+        Submission dict creating or updating the application under the target connection
+    """
+    details = dict(submission["asset_details"])
+    details.update(
+        is_update=False,
+        qualified_name=None,
+        connection_qualified_name=connection_qualified_name,
+        create_new_connection=new_connection_name is not None,
+        new_connection_name=new_connection_name,
+        # Upserted by name under the target application, whatever they were in the source tenant
+        fields=FieldStore(
+            {key: value for key, value in field.to_dict().items() if key not in ("qualified_name", "is_existing")}
+            for field in details["fields"] if not field.get("mark_for_deletion")
+        ),
+    )
+    retargeted = {"asset_details": details, "enrichment_details": dict(submission["enrichment_details"])}
+    for group in ("owned_assets", "lineage_inputs", "lineage_outputs"):
+        retargeted[group] = list(submission[group]) if include_relationships else []
+    if not include_relationships:
+        retargeted["owned_assets"] = None  # Left unset, rather than cleared, on the target application
+    return retargeted
+
+
+def _publish(client, username, submission):
+    """Write a submission to one tenant, turning any failure into the tenant's result."""
+    tenant = get_tenant_key(client)
+    started = time.monotonic()
+    with span("atlan.publish_tenant", **{"atlan.operation": "publish_tenant", "atlan.tenant": tenant}):
+        try:
+            result = replay_submissions(client, {_SUBMISSION_KEY: submission}, username)
+        except Exception as e:
+            logger.exception("Publishing to %s failed", tenant)
+            return TenantPublishResult(tenant, None, 0, 0, set(), str(e), time.monotonic() - started)
+    return TenantPublishResult(
+        tenant,
+        result.submitted.get(_SUBMISSION_KEY),
+        result.written,
+        result.requests,
+        result.skipped_tags,
+        result.failed.get(_SUBMISSION_KEY),
+        time.monotonic() - started,
+    )
+
+
+def publish_to_tenants(targets):
+    """
+    Start publishing to several tenants at once.
+
+    Args:
+        targets: List of (AtlanClient, username of its connection admin, submission for that tenant)
+
+    Returns:
+        Mapping of tenant key to a Future of its TenantPublishResult
+    """
+    return {
+        get_tenant_key(client): _executor.submit(_publish, client, username, submission)
+        for client, username, submission in targets
+    }
@@ -0,0 +1,272 @@
+"""
+Lightweight tracing of Atlan calls and wizard steps.
+
+Spans record the operation, tenant, duration, HTTP requests (pages) made,
+result counts, batch sizes and errors. Finished spans are handed to the
+registered exporters: a console exporter and a file exporter writing
+OTLP/JSON (one ``ExportTraceServiceRequest`` per line, the format of the
+OpenTelemetry collector's file exporter). With no exporter registered,
+``span()`` returns a shared no-op span and costs a single list check.
+"""
+
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from config.settings import TRACING_EXPORTER, TRACING_FILE_PATH, TRACING_SERVICE_NAME
+
+# Innermost active span of the current thread
+_current_span = contextvars.ContextVar("atlan_current_span", default=None)
+
+# Exporters receiving finished spans; tracing is disabled while empty
+_exporters = []
+
+# OTLP status codes
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+# Counters added to the parent span when a child span ends
+_ROLLUP_ATTRIBUTES = ("http.requests",)
+
+
+class Span:
+    """A timed operation with attributes."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name, parent=None, attributes=None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = dict(attributes) if attributes else {}
+        self.error = None
+
+    def set_attribute(self, key, value):
+        """Set an attribute on the span."""
+        self.attributes[key] = value
+
+    def add(self, key, amount=1):
+        """Increment a numeric attribute on the span."""
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def record_error(self, error):
+        """Mark the span as failed with the given exception."""
+        self.error = error
+        self.attributes["error.type"] = type(error).__name__
+
+    @property
+    def duration_ms(self):
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+
+class _NoopSpan:
+    """Span stand-in used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key, value):
+        pass
+
+    def add(self, key, amount=1):
+        pass
+
+    def record_error(self, error):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@contextmanager
+def _noop_context():
+    yield _NOOP_SPAN
+
+
+def is_enabled():
+    """Check whether any exporter is registered."""
+    return bool(_exporters)
+
+
+def current_span():
+    """Get the innermost active span, or a no-op span when there is none."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+def span(name, **attributes):
+    """
+    Time a block of code as a span.
+
+    Exceptions are recorded on the span and re-raised. Streamlit's rerun and
+    stop signals are not exceptions, so they do not mark the span as failed.
+
+    Args:
+        name: Span name, e.g. ``atlan.search_applications`` or ``wizard.step2_enrich_asset``
+        **attributes: Initial span attributes
+
+    Returns:
+        Context manager yielding the span
+    """
+    if not _exporters:
+        return _noop_context()
+    return _span_context(name, attributes)
+
+
+@contextmanager
+def _span_context(name, attributes):
+    parent = _current_span.get()
+    current = Span(name, parent, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.record_error(e)
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        if parent is not None:
+            for key in _ROLLUP_ATTRIBUTES:
+                if key in current.attributes:
+                    parent.add(key, current.attributes[key])
+        for exporter in list(_exporters):
+            exporter.export(current)
+
+
+def result_count(result):
+    """Count the items in an operation result, or None if it is not a collection."""
+    if result is None or isinstance(result, (str, bytes)):
+        return None
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def install_tracing_hooks(http_session):
+    """
+    Count the HTTP requests (search pages, batch flushes) made within each span.
+
+    Args:
+        http_session: The httpx.Client used by an AtlanClient
+    """
+    def on_request(request):
+        active = _current_span.get()
+        if active is not None:
+            active.add("http.requests")
+
+    http_session.event_hooks["request"].append(on_request)
+
+
+def _otlp_value(value):
+    """Convert an attribute value to an OTLP ``AnyValue``."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(span_obj):
+    """Convert a finished span to an OTLP/JSON span."""
+    otlp_span = {
+        "traceId": span_obj.trace_id,
+        "spanId": span_obj.span_id,
+        "name": span_obj.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span_obj.start_ns),
+        "endTimeUnixNano": str(span_obj.end_ns),
+        "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span_obj.attributes.items()],
+        "status": {"code": _STATUS_ERROR, "message": str(span_obj.error)} if span_obj.error else {"code": _STATUS_OK},
+    }
+    if span_obj.parent_id:
+        otlp_span["parentSpanId"] = span_obj.parent_id
+    return otlp_span
+
+
+class ConsoleExporter:
+    """Print one line per finished span to stderr."""
+
+    def __init__(self, stream=None):
+        self._stream = stream or sys.stderr
+        self._lock = threading.Lock()
+
+    def export(self, span_obj):
+        attributes = " ".join(f"{k}={v}" for k, v in span_obj.attributes.items())
+        status = " ERROR" if span_obj.error else ""
+        with self._lock:
+            print(f"[trace] {span_obj.name} {span_obj.duration_ms:.1f}ms{status} {attributes}", file=self._stream)
+
+
+class OtlpFileExporter:
+    """
+    Append finished spans to a file as OTLP/JSON lines.
+
+    Spans are buffered per trace and written when the root span ends, so each
+    line holds one complete trace.
+    """
+
+    def __init__(self, path, service_name=TRACING_SERVICE_NAME):
+        self.path = path
+        self._resource = {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def export(self, span_obj):
+        with self._lock:
+            spans = self._pending.setdefault(span_obj.trace_id, [])
+            spans.append(to_otlp(span_obj))
+            if span_obj.parent_id is not None:
+                return
+            del self._pending[span_obj.trace_id]
+
+        request = {
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }]
+        }
+        line = json.dumps(request, separators=(",", ":"))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def register_exporter(exporter):
+    """Start sending finished spans to an exporter (anything with an ``export(span)`` method)."""
+    if exporter not in _exporters:
+        _exporters.append(exporter)
+
+
+def unregister_exporter(exporter):
+    """Stop sending finished spans to an exporter."""
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+def configure_tracing(exporter=TRACING_EXPORTER, path=TRACING_FILE_PATH):
+    """
+    Register the exporter selected in the settings.
+
+    Args:
+        exporter: ``"console"``, ``"file"`` or empty to leave tracing disabled
+        path: Output file for the ``"file"`` exporter
+    """
+    if exporter == "console":
+        register_exporter(ConsoleExporter())
+    elif exporter == "file":
+        register_exporter(OtlpFileExporter(path))
+
+
+configure_tracing()
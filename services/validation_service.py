@@ -0,0 +1,135 @@
+"""
+Validation service module for pre-submission checks.
+
+All checks run before any mutation is sent to Atlan, so problems are reported
+up front instead of surfacing mid-submission after partial writes.
+"""
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.assets import Application, Asset
+from pyatlan.model.fluent_search import FluentSearch, CompoundQuery
+from services.atlan_client import execute_with_auto_reconnect
+from config.settings import VALIDATION_TERMS_BATCH_SIZE
+
+
+def find_duplicate_field_names(fields):
+    """
+    Find field names that occur more than once (case-insensitive).
+
+    Args:
+        fields: List of field dictionaries from the field editor
+
+    Returns:
+        Dictionary mapping each duplicated name to its number of occurrences
+    """
+    counts = {}
+    display_names = {}
+    for field in fields:
+        name = (field.get("name") or "").strip()
+        if not name:
+            continue
+        key = name.lower()
+        counts[key] = counts.get(key, 0) + 1
+        display_names.setdefault(key, name)
+    return {display_names[key]: count for key, count in counts.items() if count > 1}
+
+
+def _find_existing_qualified_names_core(client: AtlanClient, qualified_names):
+    """Core logic for resolving qualified names with batched terms queries."""
+    existing = set()
+    unique_names = sorted(set(qualified_names))
+
+    for start in range(0, len(unique_names), VALIDATION_TERMS_BATCH_SIZE):
+        batch = unique_names[start:start + VALIDATION_TERMS_BATCH_SIZE]
+        request = (
+            FluentSearch()
+            .where(CompoundQuery.active_assets())
+            .where(Asset.QUALIFIED_NAME.within(batch))
+            .page_size(len(batch))
+            .include_on_results(Asset.QUALIFIED_NAME)
+        ).to_request()
+
+        for asset in client.asset.search(request):
+            existing.add(asset.qualified_name)
+
+    return existing
+
+
+def find_existing_qualified_names(client: AtlanClient, qualified_names):
+    """Resolve which of the given qualified names exist as active assets, with auto-reconnect."""
+    if not qualified_names:
+        return set()
+    return execute_with_auto_reconnect(_find_existing_qualified_names_core, client, qualified_names)
+
+
+def _find_applications_by_name_core(client: AtlanClient, connection_qn: str, name: str):
+    """Core logic for finding applications with a given name under a connection."""
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.asset_type(Application))
+        .where(CompoundQuery.active_assets())
+        .where(Asset.CONNECTION_QUALIFIED_NAME.eq(connection_qn))
+        .where(Asset.NAME.eq(name))
+        .page_size(10)
+        .include_on_results(Asset.NAME)
+        .include_on_results(Asset.QUALIFIED_NAME)
+    ).to_request()
+
+    return [app.qualified_name for app in client.asset.search(request)]
+
+
+def find_applications_by_name(client: AtlanClient, connection_qn: str, name: str):
+    """Find qualified names of active applications with the given name, with auto-reconnect."""
+    return execute_with_auto_reconnect(_find_applications_by_name_core, client, connection_qn, name)
+
+
+def validate_submission(client: AtlanClient, asset_details, referenced_qualified_names):
+    """
+    Validate a submission before anything is written to Atlan.
+
+    Checks that no other application with the same name exists under the
+    connection, that every referenced asset still exists, and that field
+    names are unique.
+
+    Args:
+        client: The AtlanClient instance
+        asset_details: Asset details from session state
+        referenced_qualified_names: Qualified names of owned assets and lineage inputs/outputs
+
+    Returns:
+        Report dictionary with ``is_valid``, ``errors``, ``missing_qualified_names``,
+        ``conflicting_applications`` and ``duplicate_fields``
+    """
+    errors = []
+    report = {
+        "errors": errors,
+        "missing_qualified_names": [],
+        "conflicting_applications": [],
+        "duplicate_fields": find_duplicate_field_names(asset_details.get("fields", [])),
+    }
+
+    for name, count in report["duplicate_fields"].items():
+        errors.append(f"Field name '{name}' is used {count} times.")
+
+    # A brand-new connection cannot contain any applications yet
+    connection_qn = asset_details.get("connection_qualified_name")
+    if connection_qn and not asset_details.get("create_new_connection"):
+        matches = find_applications_by_name(client, connection_qn, asset_details["name"])
+        if matches is None:
+            errors.append("Could not check for existing applications with the same name.")
+        else:
+            own_qn = asset_details.get("qualified_name") if asset_details.get("is_update") else None
+            report["conflicting_applications"] = [qn for qn in matches if qn != own_qn]
+            for qn in report["conflicting_applications"]:
+                errors.append(f"An application named '{asset_details['name']}' already exists: {qn}")
+
+    existing = find_existing_qualified_names(client, referenced_qualified_names)
+    if existing is None:
+        errors.append("Could not verify that the referenced assets still exist.")
+    else:
+        report["missing_qualified_names"] = sorted(set(referenced_qualified_names) - existing)
+        for qn in report["missing_qualified_names"]:
+            errors.append(f"Referenced asset no longer exists: {qn}")
+
+    report["is_valid"] = not errors
+    return report
@@ -0,0 +1,81 @@
+"""
+Background warm-up of tenant metadata after connecting.
+
+As soon as a connection is validated, the lookups the wizard needs later
+(connections for step 1, users/groups and tags for the enrichment step, and
+optionally the asset-name index) are started concurrently on a shared thread
+pool. They fill the same caches the steps read from, so by the time the user
+gets there the data is usually ready; a step that arrives while a lookup is
+still running joins it through the single-flight layer instead of repeating it.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from config.settings import WARMUP_MAX_WORKERS, WARMUP_MIN_INTERVAL, ASSET_NAME_INDEX_ENABLED
+from services.atlan_client import get_cache_scope
+from services.connection_service import get_connections, get_users_and_groups, get_tags
+from services.asset_index import build_asset_name_index
+
+_executor = ThreadPoolExecutor(max_workers=WARMUP_MAX_WORKERS, thread_name_prefix="atlan-warmup")
+_warmups = {}  # cache scope -> (started_at, {task name: future})
+_warmups_lock = threading.Lock()
+
+
+def _warmup_tasks():
+    """Lookups to run on connect, by name."""
+    tasks = {
+        "connections": get_connections,
+        # Failures are raised (and shown as "failed") instead of reported in a page nobody sees
+        "users_and_groups": partial(get_users_and_groups, report_errors=False),
+        "tags": partial(get_tags, report_errors=False),
+    }
+    if ASSET_NAME_INDEX_ENABLED:
+        tasks["asset_name_index"] = build_asset_name_index
+    return tasks
+
+
+def start_warmup(client):
+    """
+    Start fetching the tenant's metadata in the background.
+
+    Repeated calls for the same tenant and API token within WARMUP_MIN_INTERVAL
+    are ignored, so several sessions connecting at once share one warm-up.
+
+    Args:
+        client: A connected AtlanClient
+
+    Returns:
+        Mapping of task name to its Future
+    """
+    scope = get_cache_scope(client)
+    now = time.monotonic()
+    with _warmups_lock:
+        existing = _warmups.get(scope)
+        if existing is not None and now - existing[0] < WARMUP_MIN_INTERVAL:
+            return existing[1]
+        futures = {name: _executor.submit(task, client) for name, task in _warmup_tasks().items()}
+        _warmups[scope] = (now, futures)
+    return futures
+
+
+def get_warmup_status(client):
+    """
+    Get the state of the tenant's latest warm-up.
+
+    Returns:
+        Mapping of task name to "running", "ready" or "failed" (empty if none was started)
+    """
+    with _warmups_lock:
+        existing = _warmups.get(get_cache_scope(client))
+    if existing is None:
+        return {}
+    status = {}
+    for name, future in existing[1].items():
+        if not future.done():
+            status[name] = "running"
+        else:
+            status[name] = "failed" if future.exception() is not None else "ready"
+    return status
@@ -0,0 +1,88 @@
+"""
+Write-through invalidation of read caches after assets are saved.
+
+Every write helper in ``asset_service`` reports the assets it created or
+updated here. Registered hooks then update or drop the matching entries in
+each read cache (the asset-name index, prefetched fields, the connection
+list and coalesced reads), so those caches can keep long TTLs without
+serving results that predate the user's own submission. Hooks receive the
+writer's cache scope (see ``get_cache_scope``): caches that drop entries
+drop them for every user of the tenant, while caches that add the written
+assets only add them to the writer's own entries.
+"""
+
+import logging
+
+from services.atlan_client import get_cache_scope
+from services.single_flight import atlan_reads
+from utils.compact_state import AssetRef
+
+logger = logging.getLogger(__name__)
+
+_hooks = []
+
+
+def register_write_hook(hook):
+    """
+    Register a hook called with ``(scope, refs)`` after assets are written.
+
+    Args:
+        hook: Callable taking the writer's cache scope and a list of AssetRef
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def unregister_write_hook(hook):
+    """Stop calling a previously registered hook."""
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def mutated_assets(response):
+    """
+    List the assets created or updated by a save, from its mutation response.
+
+    Args:
+        response: AssetMutationResponse (or None if the save failed)
+
+    Returns:
+        List of assets, empty when nothing was mutated
+    """
+    entities = getattr(response, "mutated_entities", None)
+    if entities is None:
+        return []
+    return [
+        asset
+        for assets in (entities.CREATE, entities.UPDATE, entities.PARTIAL_UPDATE)
+        for asset in (assets or [])
+    ]
+
+
+def notify_assets_written(client, assets):
+    """
+    Run the write hooks for assets that were just saved.
+
+    A failing hook is logged and skipped, as the write itself has succeeded.
+
+    Args:
+        client: AtlanClient the assets were written with
+        assets: pyatlan assets or AssetRef, each with at least a qualified name
+    """
+    refs = [AssetRef.from_asset(asset) for asset in assets if getattr(asset, "qualified_name", None)]
+    if not refs:
+        return
+    scope = get_cache_scope(client)
+    for hook in list(_hooks):
+        try:
+            hook(scope, refs)
+        except Exception:
+            logger.exception("Write hook %r failed", hook)
+
+
+def _forget_coalesced_reads(scope, refs):
+    """Drop the tenant's completed reads (of every user) so searches right after a save go to Atlan."""
+    atlan_reads.forget(lambda key: key[0][0] == scope[0])
+
+
+register_write_hook(_forget_coalesced_reads)
@@ -11,7 +11,7 @@ def test_imports():
         print("✅ Config imports successful")
         
         print("Testing service imports...")
-        from services import atlan_client, asset_service, connection_service
+        from services import atlan_client, asset_service, connection_service, validation_service, single_flight, rate_limiter, tracing, metrics, http_cassette, warmup, asset_index, field_prefetch, write_through, explorer_service, identity_cache, bulk_writer, lineage_service, impact_service, application_state, mutation_queue, tenant_fanout
         print("✅ Service imports successful")
         
         print("Testing UI component imports...")
@@ -19,13 +19,17 @@ def test_imports():
         print("✅ UI component imports successful")
         
         print("Testing UI page imports...")
-        from ui.pages import operation_selection, application_selection, asset_definition, enrichment, relationships
+        from ui.pages import operation_selection, application_selection, asset_definition, enrichment, relationships, performance_dashboard, explorer, drafts
         print("✅ UI page imports successful")
         
         print("Testing utility imports...")
-        from utils import session_state
+        from utils import session_state, schema_import, compact_state, profiler, lazy_imports, name_matching, lineage_mapping, drafts
         print("✅ Utility imports successful")
         
+        print("Testing benchmark imports...")
+        from benchmarks import mock_atlan
+        print("✅ Benchmark imports successful")
+        
         print("\n🎉 All imports successful! The refactored application structure is working correctly.")
         return True
         
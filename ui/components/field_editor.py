@@ -2,7 +2,10 @@
 Field editor component for managing ApplicationField assets.
 """
 
+import fnmatch
+
 import streamlit as st
+from utils.schema_import import iter_schema_fields, merge_imported_fields
 
 
 def add_field():
@@ -10,19 +13,84 @@ def add_field():
     st.session_state.application_fields.append({
         "name": "", 
         "type": "", 
-        "description": ""
+        "description": "",
+        "tags": (),
     })
 
 
+# Per-row widget keys, suffixed with the row index
+_ROW_WIDGET_KEYS = ("field_name_", "field_type_", "field_desc_", "field_tags_")
+
+
 def remove_field(index):
     """Callback to remove a field from the session state at a given index."""
-    if 0 <= index < len(st.session_state.application_fields):
-        st.session_state.application_fields.pop(index)
+    fields = st.session_state.application_fields
+    if not 0 <= index < len(fields):
+        return
+    fields.pop(index)
+    # Shift the rows' widget state up with them, or the next row would show (and keep) the removed row's values
+    for prefix in _ROW_WIDGET_KEYS:
+        for i in range(index, len(fields) + 1):
+            following = st.session_state.get(f"{prefix}{i + 1}")
+            if following is None:
+                st.session_state.pop(f"{prefix}{i}", None)
+            else:
+                st.session_state[f"{prefix}{i}"] = following
 
 
-def render_field_editor():
+def bulk_tag_fields(fields, tag_names, pattern="", selected_names=(), remove=False):
+    """
+    Add (or remove) tags on every field matching a name pattern or selection.
+
+    Args:
+        fields: Field rows to update in place
+        tag_names: Atlan tag display names to add or remove
+        pattern: Case-insensitive glob on field names, e.g. ``*email*`` (ignored when empty)
+        selected_names: Field names picked explicitly
+        remove: Remove the tags instead of adding them
+
+    Returns:
+        Indexes of the fields whose tags changed
+    """
+    tag_names = set(tag_names)
+    selected_names = set(selected_names)
+    pattern = pattern.strip().lower()
+    changed = []
+    for i, field in enumerate(fields):
+        name = field.get("name") or ""
+        if not name or not (name in selected_names or (pattern and fnmatch.fnmatchcase(name.lower(), pattern))):
+            continue
+        current = set(field.get("tags") or ())
+        updated = current - tag_names if remove else current | tag_names
+        if updated != current:
+            field["tags"] = updated
+            changed.append(i)
+    return changed
+
+
+def _apply_bulk_tags(remove):
+    """Callback applying the bulk-tagging form to the fields in session state."""
+    fields = st.session_state.application_fields
+    changed = bulk_tag_fields(
+        fields,
+        st.session_state.get("bulk_tag_names", []),
+        st.session_state.get("bulk_tag_pattern", ""),
+        st.session_state.get("bulk_tag_selection", []),
+        remove=remove,
+    )
+    # Keep the per-field pickers in step with the new tags
+    for i in changed:
+        st.session_state[f"field_tags_{i}"] = list(fields[i].get("tags") or ())
+    st.toast(f"🏷️ {'Removed tags from' if remove else 'Tagged'} {len(changed)} fields")
+
+
+def render_field_editor(tag_options=(), allow_new_tags=False):
     """
     Render the field editor interface for ApplicationField assets.
+
+    Args:
+        tag_options: Atlan tag display names that can be applied to fields
+        allow_new_tags: Let tag names outside ``tag_options`` be typed in (offline drafts)
     """
     st.subheader("Application Fields")
     st.write(
@@ -38,7 +106,7 @@ def render_field_editor():
             field_header += " *(Existing)*"
         
         st.markdown(field_header)
-        cols = st.columns([3, 3, 4, 1])
+        cols = st.columns([3, 3, 4, 3, 1])
         
         # Field inputs
         field["name"] = cols[0].text_input(
@@ -56,18 +124,29 @@ def render_field_editor():
             value=field.get("description", ""), 
             key=f"field_desc_{i}"
         )
+        tags_key = f"field_tags_{i}"
+        field["tags"] = cols[3].multiselect(
+            "Atlan Tags",
+            options=tag_options,
+            accept_new_options=allow_new_tags,
+            # Bulk tagging sets the picker's state directly, which then takes precedence
+            default=None if tags_key in st.session_state else [
+                tag for tag in field.get("tags") or () if tag in tag_options
+            ],
+            key=tags_key,
+        )
         
-        # Remove button (different behavior for existing vs new fields)
+        # Remove button (removed in a callback, before the rows are rendered again)
         if field.get("is_existing"):
-            if cols[3].button(
+            cols[4].button(
                 "❌",
                 key=f"remove_field_{i}",
+                on_click=remove_field,
+                args=(i,),
                 help="Remove this existing field (will be deleted from Atlan).",
-            ):
-                field["mark_for_deletion"] = True
-                remove_field(i)
+            )
         else:
-            cols[3].button(
+            cols[4].button(
                 "🗑️",
                 key=f"remove_field_{i}",
                 on_click=remove_field,
@@ -81,5 +160,64 @@ def render_field_editor():
         on_click=add_field, 
         help="Add a new field to this application."
     )
+
+    if tag_options or allow_new_tags:
+        render_bulk_tagging(tag_options, allow_new_tags)
+    render_schema_import()
     
-    st.markdown("---") 
\ No newline at end of file
+    st.markdown("---")
+
+
+def render_bulk_tagging(tag_options, allow_new_tags=False):
+    """
+    Render the form for tagging many fields at once, by name pattern or selection.
+
+    Args:
+        tag_options: Atlan tag display names that can be applied to fields
+        allow_new_tags: Let tag names outside ``tag_options`` be typed in
+    """
+    with st.expander("🏷️ Bulk-Tag Fields"):
+        st.multiselect("Atlan Tags", options=tag_options, key="bulk_tag_names", accept_new_options=allow_new_tags)
+        st.text_input(
+            "Field name pattern",
+            placeholder="*email*",
+            key="bulk_tag_pattern",
+            help="Case-insensitive wildcard pattern; `*` matches anything, `?` a single character.",
+        )
+        st.multiselect(
+            "Or pick fields",
+            options=sorted({f.get("name") for f in st.session_state.application_fields if f.get("name")}),
+            key="bulk_tag_selection",
+        )
+        cols = st.columns(2)
+        cols[0].button("Add Tags", on_click=_apply_bulk_tags, args=(False,), use_container_width=True)
+        cols[1].button("Remove Tags", on_click=_apply_bulk_tags, args=(True,), use_container_width=True)
+
+
+def render_schema_import():
+    """
+    Render the importer for bulk-adding fields from an OpenAPI / JSON Schema document.
+    """
+    with st.expander("📥 Import Fields from OpenAPI / JSON Schema"):
+        uploaded_spec = st.file_uploader(
+            "Spec file (JSON)",
+            type=["json"],
+            help="Schema properties are flattened into fields, e.g. `Order.customer.id`.",
+        )
+        include_schema_name = st.checkbox(
+            "Prefix field names with schema name",
+            value=True,
+            help="Keeps properties with the same name in different schemas apart.",
+        )
+
+        if uploaded_spec is not None and st.button("Import Fields"):
+            try:
+                # Parsed in full first, so a truncated spec adds nothing rather than its first schemas
+                imported = list(iter_schema_fields(uploaded_spec, include_schema_name=include_schema_name))
+            except ValueError as e:
+                st.error(f"Could not parse spec: {e}")
+                return
+            added, skipped = merge_imported_fields(st.session_state.application_fields, imported)
+
+            st.toast(f"✅ Imported {added} fields ({skipped} duplicates skipped)")
+            st.rerun() 
\ No newline at end of file
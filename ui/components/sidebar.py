@@ -3,7 +3,8 @@ Sidebar component for Atlan connection management.
 """
 
 import streamlit as st
-from services.atlan_client import connect_to_atlan
+from services.atlan_client import connect_to_atlan, get_tenant_key
+from utils.session_state import get_session_memory_usage, get_tenant_clients, add_tenant_client, remove_tenant_client
 
 
 def render_sidebar():
@@ -40,9 +41,69 @@ def render_sidebar():
                 st.session_state["client"] = client
                 st.session_state["user"] = user
                 st.sidebar.success(f"Connected as {user.username}")
+
+                # Prefetch what the later steps need while the user chooses an operation
+                # (imported here as it loads pyatlan's asset models, which exist by now)
+                from services.warmup import start_warmup
+                start_warmup(client)
             # Error handling is done in the connect_to_atlan function
         else:
             st.sidebar.warning("Please enter both Atlan URL and API Token.")
 
+    if st.session_state.get("client"):
+        render_warmup_status(st.session_state["client"])
+        render_tenant_registry(st.session_state["client"])
+        render_session_memory()
+
     # Return the current client if available
-    return st.session_state.get("client") 
\ No newline at end of file
+    return st.session_state.get("client")
+
+
+def render_tenant_registry(client):
+    """Render the additional tenants (e.g. staging and prod) applications can also be published to."""
+    tenants = get_tenant_clients()
+    with st.sidebar.expander(f"🌐 Additional tenants ({len(tenants)})"):
+        st.caption("Applications can be published to these tenants together with the one above.")
+        for tenant, (_, user) in tenants.items():
+            cols = st.columns([4, 1])
+            cols[0].caption(f"{tenant} ({user.username})")
+            cols[1].button("✖", key=f"remove_tenant_{tenant}", on_click=remove_tenant_client, args=(tenant,),
+                           help="Stop publishing to this tenant.")
+
+        url = st.text_input("Tenant URL", key="extra_tenant_url")
+        token = st.text_input("Tenant API Token", type="password", key="extra_tenant_token")
+        if st.button("Add Tenant"):
+            if not url or not token:
+                st.warning("Please enter both the tenant URL and API token.")
+                return
+            tenant_client, user = connect_to_atlan(url, token)
+            if tenant_client and user:
+                tenant = get_tenant_key(tenant_client)
+                if tenant == get_tenant_key(client):
+                    st.warning("This is the tenant you are connected to.")
+                    return
+                add_tenant_client(tenant, tenant_client, user)
+
+                from services.warmup import start_warmup
+                start_warmup(tenant_client)
+                st.rerun()
+
+
+def render_session_memory():
+    """Render the estimated memory held by this session's workflow state."""
+    usage = get_session_memory_usage()
+    with st.sidebar.expander(f"🧠 Session memory: {sum(usage.values()) / 1024:.1f} KB"):
+        for key, size in sorted(usage.items(), key=lambda item: item[1], reverse=True):
+            st.write(f"`{key}`: {size / 1024:.1f} KB") 
+
+
+def render_warmup_status(client):
+    """Render the progress of the background metadata warm-up."""
+    from services.warmup import get_warmup_status
+
+    status = get_warmup_status(client)
+    if status:
+        icons = {"running": "⏳", "ready": "✅", "failed": "⚠️"}
+        st.sidebar.caption("Prefetch: " + "  ".join(
+            f"{icons[state]} {name.replace('_', ' ')}" for name, state in status.items()
+        ))
@@ -6,6 +6,10 @@ Allows users to search for and select an existing application to update.
 
 import streamlit as st
 from services.asset_service import search_applications, load_existing_application_fields
+from services.application_state import load_application_state
+from services.field_prefetch import prefetch_application_fields
+from utils.session_state import set_existing_application_state
+from config.settings import FIELD_PREFETCH_TOP_HITS
 
 
 def step1_select_existing_application(client):
@@ -37,6 +41,10 @@ def step1_select_existing_application(client):
             if selected_app_display:
                 selected_app = applications[selected_app_display]
                 
+                # Load fields for the highlighted application and the top hits before "Edit" is clicked
+                top_hits = [app.qualified_name for app in list(applications.values())[:FIELD_PREFETCH_TOP_HITS]]
+                prefetch_application_fields(client, [selected_app.qualified_name] + top_hits)
+                
                 # Show application details
                 with st.expander("📋 Application Details", expanded=True):
                     col1, col2 = st.columns(2)
@@ -51,8 +59,16 @@ def step1_select_existing_application(client):
                 
                 if st.button("✏️ Edit This Application", type="primary"):
                     with st.spinner("Loading application details..."):
-                        # Load existing fields
-                        existing_fields = load_existing_application_fields(client, selected_app.qualified_name)
+                        # Load the application with its owners, tags, relationships and fields in one round trip
+                        state = load_application_state(client, selected_app.qualified_name)
+                        if state is not None:
+                            selected_app = state["application"]
+                            existing_fields = state["fields"]
+                            st.success(f"✅ Loaded {len(existing_fields)} existing fields, owners, tags and relationships")
+                        else:
+                            st.warning("⚠️ Could not load the application's owners, tags and relationships.")
+                            existing_fields = load_existing_application_fields(client, selected_app.qualified_name)
+                        set_existing_application_state(state)
                         
                         # Store the selected application and extract current details
                         st.session_state["selected_application"] = selected_app
@@ -6,7 +6,7 @@ Allows users to define application details and manage ApplicationField assets.
 
 import streamlit as st
 from pyatlan.model.enums import AtlanConnectorType
-from services.connection_service import get_connections, get_api_connections
+from services.connection_service import get_connections, get_api_connections, get_tags
 from ui.components.field_editor import render_field_editor
 from utils.session_state import initialize_application_fields, is_update_mode, get_selected_application
 
@@ -34,8 +34,12 @@ def step1_define_asset(client):
             "Define the core details of the Application asset you want to create below."
         )
 
-    # Render field editor
-    render_field_editor()
+    # Render field editor; offline, tags are typed in and checked when the draft is submitted
+    if client is not None:
+        render_field_editor(tag_options=list(get_tags(client)))
+    else:
+        drafted_tags = {tag for field in st.session_state.application_fields for tag in field.get("tags") or ()}
+        render_field_editor(tag_options=sorted(drafted_tags), allow_new_tags=True)
     
     # Main form for asset details
     with st.form("asset_form"):
@@ -43,8 +47,7 @@ def step1_define_asset(client):
         
         # Handle connection setup (only for create mode)
         if not is_update:
-            connections = get_connections(client)
-            api_connections = get_api_connections(connections)
+            api_connections = get_api_connections(get_connections(client)) if client is not None else []
             
             connection_choice = st.radio(
                 "Connection Setup",
@@ -57,7 +60,13 @@ def step1_define_asset(client):
             new_connection_name = None
 
             if connection_choice == "Use an existing connection":
-                if not api_connections:
+                if client is None:
+                    connection_qn = st.text_input(
+                        "Connection Qualified Name",
+                        value=st.session_state.get("asset_details", {}).get("connection_qualified_name") or "",
+                        help="Offline, enter the qualified name of the API connection (e.g. default/api/1700000000).",
+                    ).strip() or None
+                elif not api_connections:
                     st.warning("No existing API connections found. Please create one.")
                 else:
                     connection_options = {
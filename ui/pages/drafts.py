@@ -0,0 +1,170 @@
+"""
+Drafts Page
+
+Lists the builder drafts the current user saved on this server for the
+current tenant. Drafts can be resumed in the builder, deleted, or queued;
+queued drafts are submitted together in one batched replay once connected to
+Atlan.
+"""
+
+import time
+
+import streamlit as st
+from services.mutation_queue import replay_submissions
+from utils.drafts import (
+    list_drafts, load_draft, save_draft, delete_draft, restore_session_draft, draft_submission, is_session_draft,
+    is_claimable_draft, claim_draft,
+)
+from utils.session_state import clear_workflow_state
+
+
+def _step_label(draft):
+    if draft.is_complete:
+        return "Relationships"
+    if "asset_details" in draft.state:
+        return "Enrichment"
+    return "Definition"
+
+
+def _age(seconds_since_epoch):
+    minutes = int((time.time() - (seconds_since_epoch or 0)) // 60)
+    if minutes < 1:
+        return "just now"
+    if minutes < 60:
+        return f"{minutes} min ago"
+    return f"{minutes // 60} h ago" if minutes < 24 * 60 else f"{minutes // (24 * 60)} days ago"
+
+
+def _load_session_draft(draft_id):
+    """Load a draft the session may act on; None if it is gone or belongs to someone else."""
+    draft = load_draft(draft_id)
+    return draft if draft is not None and is_session_draft(draft) else None
+
+
+def _resume(draft_id, builder_page):
+    draft = _load_session_draft(draft_id)
+    if draft is not None:
+        restore_session_draft(draft)
+        st.session_state["page"] = builder_page
+
+
+def _set_queued(draft_id, queued):
+    draft = _load_session_draft(draft_id)
+    if draft is not None:
+        save_draft(draft_id, draft.state, queued=queued)
+
+
+def _delete(draft_id):
+    if _load_session_draft(draft_id) is None:
+        return
+    delete_draft(draft_id)
+    if st.session_state.get("draft_id") == draft_id:
+        clear_workflow_state()  # Otherwise the builder would save the deleted draft again
+
+
+def _render_claimable_drafts():
+    """Offer drafts saved before drafts recorded who saved them to the connected user."""
+    claimable = list_drafts(include=is_claimable_draft)
+    if not claimable:
+        return
+    with st.expander(f"📂 {len(claimable)} drafts saved before drafts had owners"):
+        st.caption("Claim the ones you started: they then appear with your drafts for this tenant.")
+        for draft in claimable:
+            cols = st.columns([5, 1])
+            cols[0].markdown(f"**{draft.title}** · saved {_age(draft.saved_at)}")
+            cols[1].button(
+                "Claim", key=f"claim_{draft.draft_id}", on_click=claim_draft, args=(draft.draft_id,),
+                use_container_width=True,
+            )
+
+
+def _submit_queued(client, queued):
+    """Replay the session's queued drafts in one batched submission and update the drafts with the outcome."""
+    # Never replay drafts of another user or tenant
+    queued = [draft for draft in queued if is_session_draft(draft)]
+    submissions = {draft.draft_id: draft_submission(draft) for draft in queued}
+    with st.status(f"Submitting {len(queued)} queued drafts...", expanded=True) as status:
+        result = replay_submissions(
+            client, submissions, st.session_state["user"].username,
+            on_stage=lambda stage, count: status.write(f"{stage} ({count} assets)..."),
+        )
+        status.update(
+            label=f"Submitted {len(result.submitted)} of {len(queued)} drafts",
+            state="complete" if not result.failed else "error",
+        )
+
+    for draft in queued:
+        if draft.draft_id in result.submitted:
+            delete_draft(draft.draft_id)
+            if st.session_state.get("draft_id") == draft.draft_id:
+                clear_workflow_state()  # The builder was still editing the submitted draft
+        elif draft.draft_id in result.failed:
+            connection_qn = result.connections.get(draft.draft_id)
+            if connection_qn:
+                # The connection exists now; retrying must not create it again
+                draft.state["asset_details"].update(create_new_connection=False, connection_qualified_name=connection_qn)
+            save_draft(draft.draft_id, draft.state, error=result.failed[draft.draft_id])
+
+    if result.submitted:
+        st.success(
+            f"🎉 Submitted {len(result.submitted)} applications: {result.written} assets in "
+            f"{result.requests} requests, {result.seconds:.1f}s"
+        )
+    if result.skipped_tags:
+        st.warning(f"Skipped unknown Atlan tags: {', '.join(sorted(result.skipped_tags))}")
+    if result.failed:
+        st.error(f"❌ {len(result.failed)} drafts could not be submitted and stay queued.")
+
+
+def render_drafts(client, builder_page):
+    """Render the drafts page. Works without a client, except for submitting the queue."""
+    st.header("📝 Drafts")
+    st.caption(
+        "Your builder progress on this tenant is saved here automatically. "
+        "Queue finished drafts to submit them together."
+    )
+
+    if client is not None:
+        _render_claimable_drafts()
+
+    drafts = list_drafts()
+    queued = [draft for draft in drafts if draft.queued_at and draft.is_complete]
+    if queued:
+        if client is None:
+            st.info(f"{len(queued)} drafts are queued. Connect to Atlan using the sidebar to submit them.")
+        elif st.button(f"🚀 Submit {len(queued)} Queued Drafts", type="primary"):
+            _submit_queued(client, queued)
+            drafts = list_drafts()
+
+    if not drafts:
+        st.info("No drafts yet. Start an application in the builder and it is saved here as you go.")
+        return
+
+    for draft in drafts:
+        with st.container(border=True):
+            cols = st.columns([5, 1, 1, 1])
+            mode = "Update" if draft.is_update else "Create"
+            status = "⏳ Queued" if draft.queued_at else "✏️ Draft"
+            cols[0].markdown(f"**{draft.title}** · {status}")
+            cols[0].caption(f"{mode} · {_step_label(draft)} step · saved {_age(draft.saved_at)}")
+            if draft.error:
+                cols[0].error(draft.error)
+            cols[1].button(
+                "Resume", key=f"resume_{draft.draft_id}", on_click=_resume, args=(draft.draft_id, builder_page),
+                use_container_width=True,
+            )
+            if draft.queued_at:
+                cols[2].button(
+                    "Unqueue", key=f"unqueue_{draft.draft_id}", on_click=_set_queued, args=(draft.draft_id, False),
+                    use_container_width=True,
+                )
+            else:
+                cols[2].button(
+                    "Queue", key=f"queue_{draft.draft_id}", on_click=_set_queued, args=(draft.draft_id, True),
+                    disabled=not draft.is_complete, use_container_width=True,
+                    help="Drafts can be queued once they reach the relationships step.",
+                )
+            cols[3].button(
+                "Delete", key=f"delete_{draft.draft_id}", on_click=_delete, args=(draft.draft_id,),
+                use_container_width=True,
+            )
@@ -6,7 +6,8 @@ Allows users to add enrichment details like descriptions, owners, and Atlan tags
 
 import streamlit as st
 from services.connection_service import get_users_and_groups, get_tags
-from utils.session_state import is_update_mode, get_selected_application
+from services.identity_cache import USERS, GROUPS, owner_label, split_owner_labels
+from utils.session_state import is_update_mode, get_selected_application, get_existing_application_state
 
 
 def step2_enrich_asset(client):
@@ -24,17 +25,24 @@ def step2_enrich_asset(client):
         st.header("Step 2: Add Enrichment Details")
         st.write("Add optional details to enrich your new asset with more context.")
 
-    owners = get_users_and_groups(client)
-    tags = get_tags(client)
+    # Offline, owners and tags are typed in and checked when the draft is submitted
+    offline = client is None
+    owners = get_users_and_groups(client) if not offline else {}
+    tags = get_tags(client) if not offline else {}
     
     # Load existing enrichment data for updates
     if is_update:
         selected_app = get_selected_application()
-        default_description = getattr(selected_app, 'description', '') if selected_app else ''
-        # Note: Loading existing owners and tags would require additional API calls
-        # For now, start with empty and let user add what they want
-        default_owners = []
-        default_tags = []
+        default_description = (getattr(selected_app, 'description', '') or '') if selected_app else ''
+        # Owners and tags were loaded with the application; keep those the pickers offer
+        existing = get_existing_application_state() or {}
+        default_owners = [
+            label for label in
+            [owner_label(USERS, name) for name in existing.get("owner_users", ())]
+            + [owner_label(GROUPS, name) for name in existing.get("owner_groups", ())]
+            if label in owners or offline
+        ]
+        default_tags = [name for name in existing.get("tag_names", ()) if name in tags or offline]
     else:
         default_description = ''
         default_owners = []
@@ -48,14 +56,17 @@ def step2_enrich_asset(client):
         )
         selected_owners = st.multiselect(
             "Select Owners",
-            options=list(owners.keys()),
+            options=list(owners.keys()) if not offline else default_owners,
             default=default_owners,
-            help="Select the users or groups that own this asset.",
+            accept_new_options=offline,
+            help="Select the users or groups that own this asset."
+            + (" Offline, type a username, or `Group: <alias>` for a group." if offline else ""),
         )
         selected_tags = st.multiselect(
             "Select Atlan Tags",
-            options=list(tags.keys()),
+            options=list(tags.keys()) if not offline else default_tags,
             default=default_tags,
+            accept_new_options=offline,
             help="Select the Atlan tags (classifications) to apply to this asset.",
         )
 
@@ -74,14 +85,14 @@ def step2_enrich_asset(client):
             st.rerun()
 
         elif proceed:
+            # Owners typed in offline without a "User: " or "Group: " prefix are usernames
+            owner_users, owner_groups = split_owner_labels(
+                label if ": " in label else owner_label(USERS, label) for label in selected_owners
+            )
             st.session_state.enrichment_details = {
                 "description": description,
-                "owner_users": [
-                    owners[o].username for o in selected_owners if "User" in o
-                ],
-                "owner_groups": [
-                    owners[o].alias for o in selected_owners if "Group" in o
-                ],
+                "owner_users": owner_users,
+                "owner_groups": owner_groups,
                 "tag_names": selected_tags,
             }
             st.rerun() 
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Explorer Page
+
+Browse the tenant as a tree of connections, applications and fields. A level
+is only fetched when its parent is expanded, one page at a time, with child
+counts shown before anything below them is loaded.
+"""
+
+import streamlit as st
+from services.explorer_service import list_connections, list_applications, list_application_fields
+from utils.session_state import get_explorer_levels, clear_explorer_levels
+from config.settings import EXPLORER_PAGE_SIZE
+
+# Level shown under each expandable type, with the icon and noun used for its counts
+_CHILD_LEVELS = {
+    "Connection": ("applications", "🔌", "applications"),
+    "Application": ("fields", "📦", "fields"),
+}
+_INDENT_COLUMNS = 24
+
+
+def _load_page(client, level, parent, cursor):
+    """Fetch one page of a level of the tree."""
+    if level == "connections":
+        return list_connections(client, cursor)
+    if level == "applications":
+        return list_applications(client, parent, cursor)
+    return list_application_fields(client, parent, cursor)
+
+
+def _row(depth):
+    """A container indented for the given tree depth."""
+    if depth == 0:
+        return st.container()
+    _, body = st.columns([depth, _INDENT_COLUMNS - depth])
+    return body
+
+
+def _render_level(client, level, parent, depth):
+    """Render a loaded (or first-page-loaded) level, expanding children on demand."""
+    levels = get_explorer_levels()
+    key = (level, parent)
+    loaded = levels.get(key)
+    if loaded is None:
+        with st.spinner(f"Loading {level}..."):
+            page = _load_page(client, level, parent, None)
+        if page is None:
+            _row(depth).error(f"Could not load {level}.")
+            return
+        loaded = levels[key] = {"nodes": list(page.nodes), "cursor": page.cursor, "total": page.total}
+
+    if not loaded["nodes"]:
+        _row(depth).caption(f"No {level} found.")
+        return
+
+    for ref, child_count in loaded["nodes"]:
+        child_level = _CHILD_LEVELS.get(ref.type_name)
+        if child_level is None:
+            _row(depth).markdown(f"🏷️ {ref.name}")
+            continue
+        child_name, icon, noun = child_level
+        expanded = _row(depth).toggle(
+            f"{icon} {ref.name} ({child_count:,} {noun})",
+            key=f"explorer_open_{ref.qualified_name}",
+            disabled=not child_count,
+            help=ref.qualified_name,
+        )
+        if expanded:
+            _render_level(client, child_name, ref.qualified_name, depth + 1)
+
+    if loaded["cursor"] is not None:
+        shown = len(loaded["nodes"])
+        label = f"Load more {level} ({shown:,} of {loaded['total']:,} shown)" if loaded["total"] else f"Load more {level}"
+        if _row(depth).button(label, key=f"explorer_more_{level}_{parent}"):
+            with st.spinner(f"Loading more {level}..."):
+                page = _load_page(client, level, parent, loaded["cursor"])
+            if page is None:
+                st.error(f"Could not load more {level}.")
+            else:
+                loaded["nodes"].extend(page.nodes)
+                loaded["cursor"] = page.cursor
+                st.rerun()
+
+
+def render_explorer(client):
+    """Render the connection → application → field explorer."""
+    st.header("🗂️ Explorer")
+    st.caption(
+        f"Expand a connection or application to load its children, {EXPLORER_PAGE_SIZE} at a time. "
+        "Counts are fetched without loading the children themselves."
+    )
+    if st.button("🔄 Refresh"):
+        clear_explorer_levels()
+        st.rerun()
+
+    _render_level(client, "connections", None, 0)
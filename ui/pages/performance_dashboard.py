@@ -0,0 +1,81 @@
+"""
+Admin: Performance Dashboard Page
+
+Shows rolling latency per service function and wizard step, cache hit rates,
+active sessions, in-flight Atlan requests and bulk-write throughput for this
+app process.
+"""
+
+import streamlit as st
+from config.settings import METRICS_WINDOW_SECONDS, ACTIVE_SESSION_WINDOW_SECONDS
+from services.metrics import (
+    metrics_enabled,
+    set_metrics_enabled,
+    SERVICE_CATEGORY,
+    STEP_CATEGORY,
+    latency_summary,
+    cache_hit_rates,
+    bulk_throughput,
+    active_session_count,
+    in_flight_requests,
+)
+
+
+def render_performance_dashboard():
+    """Render the admin performance dashboard."""
+    st.header("📈 Performance Dashboard")
+    # Shared by every session of the process, so the toggle follows it rather than its own state
+    st.session_state["record_metrics"] = metrics_enabled()
+    st.toggle(
+        "Record metrics", key="record_metrics",
+        on_change=lambda: set_metrics_enabled(st.session_state["record_metrics"]),
+        help="Times every Atlan call and wizard step for all sessions of this app process. "
+             "Set `ATLAN_METRICS_ENABLED=1` to record from startup.",
+    )
+    if not metrics_enabled():
+        st.info("Metrics are not being recorded. Switch on recording to collect them from now on.")
+        return
+
+    st.caption(f"Rolling window: last {METRICS_WINDOW_SECONDS // 60} minutes, all sessions in this process.")
+    if st.button("🔄 Refresh"):
+        st.rerun()
+
+    in_flight = in_flight_requests()
+    throughput = bulk_throughput()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(
+        "Active sessions", active_session_count(),
+        help=f"Sessions that reran in the last {ACTIVE_SESSION_WINDOW_SECONDS // 60} minutes"
+    )
+    col2.metric("In-flight Atlan operations", sum(in_flight["lanes"].values()))
+    col3.metric("Coalesced reads in flight", in_flight["coalesced_reads"])
+    col4.metric(
+        "Bulk-write throughput", f"{throughput['items_per_second']} items/s",
+        help=f"{throughput['items']} items written in {throughput['seconds']}s of batch writes"
+    )
+
+    st.subheader("Service functions")
+    _render_latency_table(latency_summary(SERVICE_CATEGORY), "No Atlan calls recorded yet.")
+
+    st.subheader("Wizard step render times")
+    _render_latency_table(latency_summary(STEP_CATEGORY), "No wizard steps rendered yet.")
+
+    st.subheader("Cache hit rates")
+    caches = cache_hit_rates()
+    if caches:
+        st.dataframe(caches, hide_index=True)
+    else:
+        st.info("No cache lookups recorded yet.")
+
+    if in_flight["lanes"]:
+        st.caption("In-flight operations per lane: " + ", ".join(
+            f"{lane}: {count}" for lane, count in in_flight["lanes"].items()
+        ))
+
+
+def _render_latency_table(rows, empty_message):
+    """Render a latency summary table, or a message when there is no data."""
+    if rows:
+        st.dataframe(rows, hide_index=True)
+    else:
+        st.info(empty_message)
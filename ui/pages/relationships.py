@@ -7,17 +7,38 @@ Allows users to define relationships, lineage, and submit assets to Atlan.
 import streamlit as st
 from pyatlan.client.asset import Batch
 from pyatlan.errors import AtlanError
-from pyatlan.model.assets import Application, ApplicationField, Asset, Process, Connection
+from pyatlan.model.assets import Application, ApplicationField, Asset, Connection
 from pyatlan.model.enums import AtlanConnectorType
 from services.asset_service import (
     search_assets_direct, save_application, add_atlan_tags, 
-    create_application_fields, update_application_fields, save_process
+    create_application_fields, update_application_fields, append_field_tags, save_process,
+    plan_lineage_processes, lineage_process_writer, archive_assets,
 )
+from services.validation_service import validate_submission
+from services.lineage_service import fetch_columns, check_mapped_columns, create_column_lineage
+from services.impact_service import preview_impact
+from services.connection_service import get_connections, get_api_connections
+from services.tenant_fanout import retarget_submission, publish_to_tenants
+from services.atlan_client import get_tenant_key
+from services.rate_limiter import get_tenant_limiter, BULK_LANE
+from services.tracing import span
+from services.write_through import notify_assets_written
+from config.settings import SEARCH_FACETS, IMPACT_DEFAULT_DEPTH, IMPACT_MAX_DEPTH, IMPACT_MAX_NODES
 from utils.session_state import (
     is_update_mode, get_selected_application, get_asset_details, 
     get_enrichment_details, get_search_results, set_search_results,
+    add_search_results, get_search_cursor, set_search_cursor,
+    get_search_facets, set_search_facets, get_search_filters, set_search_filters,
+    get_column_lineage_import, set_column_lineage_import, clear_column_lineage_import, get_impact_preview, set_impact_preview,
+    get_existing_application_state, get_tenant_clients,
     initialize_search_results, clear_workflow_state
 )
+from utils.lineage_mapping import UPSTREAM, DOWNSTREAM, MappingImportError, read_mapping_csv, match_by_name
+from utils.drafts import RELATIONSHIP_KEYS, autosave_session_draft, discard_session_draft
+
+COLUMN_LINEAGE_OFF = "None"
+COLUMN_LINEAGE_BY_NAME = "Match fields to columns by name"
+COLUMN_LINEAGE_CSV = "Import mappings from CSV"
 
 
 def step3_relationships_and_submit(client):
@@ -41,18 +62,23 @@ def step3_relationships_and_submit(client):
 
     # Initialize search results
     initialize_search_results()
+    existing = get_existing_application_state() if is_update else None
 
-    # Asset Search UI
-    st.subheader("Asset Search")
-    search_query = st.text_input(
-        "Search for assets to link",
-        help="Enter a search term (e.g., 'orders') and click Search.",
-    )
-    if st.button("Search Assets"):
-        with st.spinner("Searching..."):
-            results = search_assets_direct(client, search_query)
-            set_search_results(results)
-            st.success(f"Found {len(results)} assets.")
+    offline = client is None
+    if offline:
+        st.info("Offline: connect to Atlan to search for assets to link. Assets found before going offline can still be picked.")
+    else:
+        _render_asset_search(client)
+        _render_column_lineage_options()
+
+    if existing:
+        # Keep the application's current relationships selectable, whatever was searched since
+        search_results = get_search_results()
+        add_search_results({
+            name: asset
+            for group in ("owned_assets", "lineage_inputs", "lineage_outputs")
+            for name, asset in existing[group].items() if name not in search_results
+        })
 
     # Main Form
     with st.form("relationships_form"):
@@ -61,54 +87,366 @@ def step3_relationships_and_submit(client):
         search_results = get_search_results()
         available_assets = list(search_results.keys())
 
-        owned_assets_selection = st.multiselect(
-            "Owned Assets",
-            options=available_assets,
-            help="Assets that are owned by this application.",
+        owned_assets_selection = _relationship_picker(
+            "Owned Assets", "owned_assets", available_assets, existing,
+            "Assets that are owned by this application.",
         )
 
         st.subheader("Define Lineage")
-        lineage_inputs = st.multiselect(
-            "Upstream Assets (Inputs)",
-            options=available_assets,
-            help="Assets that are inputs to this application.",
+        lineage_inputs = _relationship_picker(
+            "Upstream Assets (Inputs)", "lineage_inputs", available_assets, existing,
+            "Assets that are inputs to this application.",
         )
-        lineage_outputs = st.multiselect(
-            "Downstream Assets (Outputs)",
-            options=available_assets,
-            help="Assets that this application produces as output.",
+        lineage_outputs = _relationship_picker(
+            "Downstream Assets (Outputs)", "lineage_outputs", available_assets, existing,
+            "Assets that this application produces as output.",
         )
 
+        preview = False
+        if not offline:
+            with st.expander("🔭 Preview Lineage Impact"):
+                impact_depth = st.slider(
+                    "Hops downstream",
+                    min_value=1,
+                    max_value=IMPACT_MAX_DEPTH,
+                    value=IMPACT_DEFAULT_DEPTH,
+                    help=f"How far to follow lineage. The walk stops after {IMPACT_MAX_NODES} assets.",
+                )
+                preview = st.form_submit_button("Preview Downstream Impact")
+
+        publish_targets = _render_publish_targets(client) if not offline else {}
+
         # Navigation and Submission
         st.markdown("---")
-        cols = st.columns(2)
+        cols = st.columns(3)
         go_back = cols[0].form_submit_button("Go Back", use_container_width=True)
+        queue = cols[1].form_submit_button(
+            "📥 Queue for Submission", use_container_width=True, type="primary" if offline else "secondary",
+            help="Save this draft to the queue on the Drafts page, to be submitted with other queued drafts.",
+        )
         
         submit_text = "Create Asset in Atlan" if not is_update else "Update Asset in Atlan"
-        submit = cols[1].form_submit_button(
-            submit_text, use_container_width=True, type="primary"
+        submit = cols[2].form_submit_button(
+            submit_text, use_container_width=True, type="primary", disabled=offline,
         )
 
         if go_back:
             del st.session_state["enrichment_details"]
             st.rerun()
 
+        elif queue:
+            if autosave_session_draft(queued=True) is None:
+                st.error("The draft could not be saved; check that the drafts directory is writable.")
+                return
+            clear_workflow_state()
+            st.success("📥 Draft queued. Submit it from the Drafts page together with your other queued drafts.")
+            return
+
+        elif preview:
+            _preview_lineage_impact(client, is_update, lineage_outputs, search_results, impact_depth)
+
         elif submit:
             spinner_text = "Creating assets in Atlan... This may take a moment." if not is_update else "Updating assets in Atlan... This may take a moment."
-            with st.spinner(spinner_text):
-                try:
+            publishing = {}
+            if (
+                st.session_state.get("column_lineage_mode") == COLUMN_LINEAGE_CSV
+                and _uploaded_column_lineage_import() is None
+            ):
+                st.error("Upload a readable mapping CSV under Column-Level Lineage, or choose another mode.")
+                return
+            try:
+                with st.spinner("Validating submission..."):
+                    referenced_qns = [
+                        search_results[a].qualified_name
+                        for a in set(owned_assets_selection) | set(lineage_inputs) | set(lineage_outputs)
+                    ]
+                    report = validate_submission(client, get_asset_details(), referenced_qns)
+                if not report["is_valid"]:
+                    _show_validation_report(report)
+                    return
+
+                # Other tenants are written in the background while this one is submitted below
+                publishing = _start_publishing(
+                    publish_targets, owned_assets_selection, lineage_inputs, lineage_outputs, search_results
+                )
+                with st.spinner(spinner_text):
                     _handle_asset_submission(
                         client, is_update, owned_assets_selection, 
-                        lineage_inputs, lineage_outputs, search_results
+                        lineage_inputs, lineage_outputs, search_results, rerun=not publishing
                     )
-                except AtlanError as e:
-                    action = "updating" if is_update else "creating"
-                    st.error(f"An error occurred while {action} the asset: {e}")
-                except Exception as e:
-                    st.error(f"An unexpected error occurred: {e}")
+            except AtlanError as e:
+                action = "updating" if is_update else "creating"
+                st.error(f"An error occurred while {action} the asset: {e}")
+                st.info("💡 Your progress is saved as a draft, which can be queued from the Drafts page.")
+            except Exception as e:
+                st.error(f"An unexpected error occurred: {e}")
+                st.info("💡 Your progress is saved as a draft, which can be queued from the Drafts page.")
+            if publishing:
+                _render_publish_results(publishing)
+
+    _render_impact_preview()
+
+
+def _connection_name(client, asset_details):
+    """Name of the connection the application is created in, used to match connections in other tenants."""
+    if asset_details.get("create_new_connection"):
+        return asset_details.get("new_connection_name")
+    qualified_name = asset_details.get("connection_qualified_name")
+    return next((c.name for c in get_connections(client) if c.qualified_name == qualified_name), None)
+
+
+def _render_publish_targets(client):
+    """
+    Let the user pick additional tenants to publish to, with the connection to use in each.
+
+    Returns:
+        Mapping of tenant key to (client, user, connection qualified name or None,
+        name of a connection to create or None, include relationships)
+    """
+    tenants = get_tenant_clients()
+    if not tenants:
+        return {}
+    asset_details = get_asset_details()
+    connection_name = _connection_name(client, asset_details) or asset_details["name"]
+    new_connection = f"➕ New connection '{connection_name}'"
+
+    targets = {}
+    with st.expander(f"🌐 Also Publish to {len(tenants)} Other Tenants"):
+        st.caption(
+            "The application, its fields, owners and tags are created or updated by name under the "
+            "connection chosen for each tenant, concurrently with this one."
+        )
+        include_relationships = st.checkbox(
+            "Include owned assets and lineage",
+            help="Only for assets that exist under the same qualified names in the other tenants.",
+        )
+        for tenant, (tenant_client, user) in tenants.items():
+            # Inside the form the checkbox only takes effect on submission, so every tenant's picker is shown
+            cols = st.columns([2, 3])
+            selected = cols[0].checkbox(tenant, key=f"publish_{tenant}")
+            connections = {
+                f"{c.name} ({c.qualified_name})": c for c in get_api_connections(get_connections(tenant_client))
+            }
+            options = [new_connection] + list(connections)
+            matching = [label for label, c in connections.items() if c.name == connection_name]
+            choice = cols[1].selectbox(
+                "Connection", options, index=options.index(matching[0]) if matching else 0,
+                key=f"publish_connection_{tenant}", label_visibility="collapsed",
+            )
+            if not selected:
+                continue
+            if choice == new_connection:
+                targets[tenant] = (tenant_client, user, None, connection_name, include_relationships)
+            else:
+                targets[tenant] = (tenant_client, user, connections[choice].qualified_name, None, include_relationships)
+    return targets
+
+
+def _start_publishing(targets, owned_assets_selection, lineage_inputs, lineage_outputs, search_results):
+    """Start writing the application to the selected other tenants; returns their futures by tenant."""
+    if not targets:
+        return {}
+    submission = {
+        "asset_details": get_asset_details(),
+        "enrichment_details": get_enrichment_details(),
+        "owned_assets": [search_results[a] for a in owned_assets_selection],
+        "lineage_inputs": [search_results[i] for i in lineage_inputs],
+        "lineage_outputs": [search_results[o] for o in lineage_outputs],
+    }
+    return publish_to_tenants([
+        (
+            tenant_client, user.username,
+            retarget_submission(submission, connection_qn, new_connection_name, include_relationships),
+        )
+        for tenant_client, user, connection_qn, new_connection_name, include_relationships in targets.values()
+    ])
+
+
+def _render_publish_results(publishing):
+    """Wait for the other tenants and report each one's outcome."""
+    with st.spinner(f"Waiting for {len(publishing)} other tenants..."):
+        results = [future.result() for future in publishing.values()]
+    st.subheader("🌐 Other Tenants")
+    st.dataframe(
+        [
+            {
+                "Tenant": r.tenant,
+                "Status": "✅ Published" if r.succeeded else "❌ Failed",
+                "Application": r.app_qualified_name or "",
+                "Assets": r.written,
+                "Requests": r.requests,
+                "Seconds": round(r.seconds, 1),
+                "Error": r.error or "",
+            }
+            for r in results
+        ],
+        hide_index=True,
+    )
+    for r in results:
+        if r.skipped_tags:
+            st.warning(f"{r.tenant}: skipped unknown Atlan tags {', '.join(sorted(r.skipped_tags))}")
+
+
+def _relationship_picker(label, group, available_assets, existing, help_text):
+    """Multiselect of related assets, defaulting to the application's current ones when updating."""
+    key = RELATIONSHIP_KEYS[group]
+    return st.multiselect(
+        label,
+        options=available_assets,
+        # A restored draft sets the picker's state directly, which then takes precedence
+        default=None if key in st.session_state or not existing else list(existing[group]),
+        key=key,
+        help=help_text,
+    )
+
+
+def _picked_assets():
+    """Display names selected in the relationship pickers, which new searches must keep as options."""
+    return [name for key in RELATIONSHIP_KEYS.values() for name in st.session_state.get(key) or ()]
+
+
+def _render_asset_search(client):
+    """Search for assets to link, with facets and loading of further pages."""
+    st.subheader("Asset Search")
+    search_query = st.text_input(
+        "Search for assets to link",
+        help="Enter a search term (e.g., 'orders') and click Search.",
+    )
+    if st.button("Search Assets"):
+        with st.spinner("Searching..."):
+            progress = st.empty()
+            results, cursor, facets = search_assets_direct(client, search_query, on_page=_search_progress(progress))
+            progress.empty()
+            set_search_results(results, keep=_picked_assets())
+            set_search_cursor(search_query, cursor)
+            set_search_facets(search_query, facets)
+            for facet in SEARCH_FACETS:
+                st.session_state.pop(f"facet_{facet}", None)
+            st.success(f"Found {len(results)} assets.")
+
+    _render_search_facets(client)
+
+    # Searches stop after a deadline or page budget; let the user continue where they stopped
+    more_search = get_search_cursor()
+    if more_search is not None:
+        more_term, cursor, filters = more_search
+        if st.button(f"Load More Results for '{more_term}'"):
+            with st.spinner("Searching..."):
+                progress = st.empty()
+                results, cursor, _ = search_assets_direct(
+                    client, more_term, cursor, on_page=_search_progress(progress), **filters
+                )
+                progress.empty()
+                add_search_results(results)
+                set_search_cursor(more_term, cursor, filters)
+                st.success(f"Found {len(results)} more assets.")
+        if cursor is not None:
+            st.caption("More assets may match this search.")
+
+
+def _preview_lineage_impact(client, is_update, lineage_outputs, search_results, depth):
+    """Walk downstream lineage from the application and its selected outputs."""
+    starts = [search_results[o] for o in lineage_outputs]
+    selected_app = get_selected_application() if is_update else None
+    if selected_app is not None and getattr(selected_app, "guid", None):
+        starts.insert(0, selected_app)
+    if not starts:
+        st.info("Select downstream assets (or update an existing application) to preview their impact.")
+        return
+    with st.spinner("Walking downstream lineage..."):
+        preview = preview_impact(client, [ref.guid for ref in starts], depth=depth)
+    set_impact_preview({ref.guid: ref.name for ref in starts}, preview)
 
 
-def _handle_asset_submission(client, is_update, owned_assets_selection, lineage_inputs, lineage_outputs, search_results):
+def _render_impact_preview():
+    """Show the assets reached by the last lineage impact preview."""
+    stored = get_impact_preview()
+    if stored is None:
+        return
+    start_names, preview = stored
+    st.subheader("🔭 Downstream Impact")
+    st.caption(
+        f"From {', '.join(start_names.values())}: {len(preview)} assets within {preview.depth} hops "
+        f"({preview.requests} lineage requests, {preview.seconds:.1f}s)."
+    )
+    if preview.truncated:
+        st.warning(f"Stopped after {len(preview)} assets; there may be more downstream.")
+    if preview.failures:
+        st.warning(f"Lineage of {preview.failures} assets could not be fetched and is missing from the preview.")
+    if not preview.nodes:
+        st.info("No downstream assets found.")
+        return
+
+    names = {**start_names, **{ref.guid: ref.name for ref, _, _ in preview.nodes}}
+    st.dataframe(
+        [
+            {"Hop": hop, "Name": ref.name, "Type": ref.type_name, "Via": names.get(via, ""), "Qualified Name": ref.qualified_name}
+            for ref, hop, via in preview.nodes
+        ],
+        hide_index=True,
+    )
+
+
+def _show_validation_report(report):
+    """Show the pre-submission validation report. Nothing has been written to Atlan at this point."""
+    st.error(f"❌ Submission blocked: {len(report['errors'])} problem(s) found. Nothing was written to Atlan.")
+    for error in report["errors"]:
+        st.write(f"   - {error}")
+
+
+def _render_search_facets(client):
+    """
+    Show how the latest search's matches split by type and connection, and
+    re-run the search narrowed to the selected values.
+    """
+    facet_state = get_search_facets()
+    if facet_state is None:
+        return
+    search_term, facets = facet_state
+
+    st.caption("Narrow the results by type or connection:")
+    counts = {facet: dict(buckets) for facet, buckets in facets.items()}
+    type_names = st.pills(
+        "Asset types",
+        options=list(counts["type"]),
+        format_func=lambda value: f"{value} ({counts['type'][value]})",
+        selection_mode="multi",
+        key="facet_type",
+    )
+    connection_qualified_names = st.pills(
+        "Connections",
+        options=list(counts["connection"]),
+        format_func=lambda value: f"{value} ({counts['connection'][value]})",
+        selection_mode="multi",
+        key="facet_connection",
+    )
+
+    filters = {}
+    if type_names:
+        filters["type_names"] = list(type_names)
+    if connection_qualified_names:
+        filters["connection_qualified_names"] = list(connection_qualified_names)
+    if filters == get_search_filters():
+        return
+
+    with st.spinner("Searching..."):
+        progress = st.empty()
+        results, cursor, _ = search_assets_direct(client, search_term, on_page=_search_progress(progress), **filters)
+        progress.empty()
+    set_search_results(results, keep=_picked_assets())
+    set_search_cursor(search_term, cursor, filters)
+    set_search_filters(filters)
+
+
+def _search_progress(placeholder):
+    """Build a search callback that shows the results found so far as each page arrives."""
+    def show_found(found):
+        names = ", ".join(list(found)[:10])
+        placeholder.caption(f"Found {len(found)} so far: {names}" if found else "No matches yet...")
+    return show_found
+
+
+def _handle_asset_submission(client, is_update, owned_assets_selection, lineage_inputs, lineage_outputs, search_results, rerun=True):
     """Handle the main asset submission logic."""
     asset_details = get_asset_details()
     enrichment_details = get_enrichment_details()
@@ -137,10 +475,14 @@ def _handle_asset_submission(client, is_update, owned_assets_selection, lineage_
         add_atlan_tags(client, Application, app_qn, enrichment_details["tag_names"])
 
     # Step 4: Create Lineage
-    _create_lineage_processes(client, lineage_inputs, lineage_outputs, asset_details, connection_qn, app_qn, search_results)
+    existing_processes = (get_existing_application_state() or {}).get("lineage_processes") if is_update else None
+    _create_lineage_processes(
+        client, lineage_inputs, lineage_outputs, asset_details, connection_qn, app_qn, search_results, existing_processes
+    )
+    _create_column_lineage(client, lineage_inputs, lineage_outputs, asset_details, connection_qn, app_qn, search_results)
 
     # Step 5: Show success and clean up
-    _show_success_and_cleanup(is_update, asset_details, app_qn)
+    _show_success_and_cleanup(is_update, asset_details, app_qn, rerun)
 
 
 def _create_new_connection(client, asset_details):
@@ -309,37 +651,111 @@ def _handle_application_fields(client, asset_details, app_qn):
     if existing_fields:
         update_application_fields(client, existing_fields)
 
+    # Tag fields once they exist, one request per chunk of fields sharing a tag set
+    append_field_tags(client, asset_details["fields"], app_qn)
 
-def _create_lineage_processes(client, lineage_inputs, lineage_outputs, asset_details, connection_qn, app_qn, search_results):
-    """Create lineage Process assets."""
-    if not lineage_inputs and not lineage_outputs:
-        return
-        
-    # The app itself is an output of its inputs
-    if lineage_inputs:
-        process_inputs = Process.create(
-            name=f"{asset_details['name']} Upstream Lineage",
-            connection_qualified_name=connection_qn,
-            inputs=[
-                Asset.ref_by_qualified_name(search_results[i].qualified_name)
-                for i in lineage_inputs
-            ],
-            outputs=[Asset.ref_by_qualified_name(app_qn)],
+
+def _create_lineage_processes(client, lineage_inputs, lineage_outputs, asset_details, connection_qn, app_qn, search_results, existing_processes=()):
+    """Create lineage Process assets, or update and archive the application's existing ones."""
+    writes, archived, still_linked = plan_lineage_processes(
+        asset_details["name"], app_qn,
+        [search_results[i].qualified_name for i in lineage_inputs],
+        [search_results[o].qualified_name for o in lineage_outputs],
+        existing_processes or (),
+    )
+    for name, qualified_name, inputs, outputs in writes:
+        save_process(client, lineage_process_writer(name, qualified_name, connection_qn, inputs, outputs))
+    archive_assets(client, archived)
+    if still_linked:
+        st.warning(
+            f"{len(still_linked)} unpicked asset(s) stay linked through lineage processes shared with other assets: "
+            + ", ".join(still_linked[:5])
         )
-        save_process(client, process_inputs)
-
-    # If the app produces outputs
-    if lineage_outputs:
-        process_outputs = Process.create(
-            name=f"{asset_details['name']} Downstream Lineage",
-            connection_qualified_name=connection_qn,
-            inputs=[Asset.ref_by_qualified_name(app_qn)],
-            outputs=[
-                Asset.ref_by_qualified_name(search_results[o].qualified_name)
-                for o in lineage_outputs
-            ],
+
+
+def _render_column_lineage_options():
+    """Let the user choose how fields are mapped to upstream and downstream columns."""
+    with st.expander("🧬 Column-Level Lineage"):
+        mode = st.radio(
+            "Field-to-column lineage",
+            (COLUMN_LINEAGE_OFF, COLUMN_LINEAGE_BY_NAME, COLUMN_LINEAGE_CSV),
+            key="column_lineage_mode",
+            help="Creates a ColumnProcess per field linking it to the columns it reads from or feeds.",
         )
-        save_process(client, process_outputs)
+        if mode == COLUMN_LINEAGE_BY_NAME:
+            st.caption(
+                "On submission, columns of the selected upstream and downstream assets "
+                "whose names match a field (ignoring case and separators) are linked to it."
+            )
+        elif mode == COLUMN_LINEAGE_CSV:
+            uploaded = st.file_uploader(
+                "Mapping CSV",
+                type=["csv"],
+                key="column_lineage_csv",
+                help="Columns: `field`, `column` (qualified name) and optionally `direction` (upstream/downstream).",
+            )
+            if uploaded is None:
+                clear_column_lineage_import()
+            else:
+                imported = get_column_lineage_import()
+                if imported is None or imported[0] != uploaded.file_id:
+                    try:
+                        mappings, skipped = read_mapping_csv(uploaded)
+                    except (MappingImportError, UnicodeDecodeError) as e:
+                        clear_column_lineage_import()
+                        st.error(f"Could not read mappings: {e}")
+                        return
+                    set_column_lineage_import(uploaded.file_id, mappings, skipped)
+                    imported = get_column_lineage_import()
+                _, mappings, skipped = imported
+                st.caption(f"{len(mappings)} mappings ready ({skipped} invalid or duplicate rows skipped).")
+
+
+def _uploaded_column_lineage_import():
+    """The imported column lineage CSV, or None unless it is the file currently in the uploader."""
+    uploaded = st.session_state.get("column_lineage_csv")
+    imported = get_column_lineage_import()
+    if uploaded is None or imported is None or imported[0] != uploaded.file_id:
+        return None
+    return imported
+
+
+def _create_column_lineage(client, lineage_inputs, lineage_outputs, asset_details, connection_qn, app_qn, search_results):
+    """Create field-to-column lineage in the mode chosen in the Column-Level Lineage panel."""
+    mode = st.session_state.get("column_lineage_mode", COLUMN_LINEAGE_OFF)
+    field_names = [f.get("name") for f in asset_details["fields"] if f.get("name") and not f.get("mark_for_deletion")]
+    if mode == COLUMN_LINEAGE_OFF or not field_names:
+        return
+
+    directions = {search_results[i].qualified_name: UPSTREAM for i in lineage_inputs}
+    directions.update({search_results[o].qualified_name: DOWNSTREAM for o in lineage_outputs})
+    if mode == COLUMN_LINEAGE_CSV:
+        imported = _uploaded_column_lineage_import()
+        if imported is None:
+            st.warning("⚠️ No mapping CSV is uploaded, so no column-level lineage was created.")
+            return
+        checked = check_mapped_columns(client, imported[1], directions)
+        if checked is None:
+            st.error("❌ Could not look up the mapped columns, so no column-level lineage was created.")
+            return
+        mappings, unknown, out_of_scope = checked
+        if unknown:
+            st.warning(
+                f"⚠️ Skipping {len(unknown)} mapping rows whose column does not exist: "
+                + ", ".join(sorted({column for _, column, _ in unknown})[:10])
+            )
+        if out_of_scope:
+            st.warning(
+                f"⚠️ Skipping {len(out_of_scope)} mapping rows whose column is not in a selected "
+                "upstream (or, for downstream rows, downstream) asset: "
+                + ", ".join(sorted({column for _, column, _ in out_of_scope})[:10])
+            )
+    else:
+        columns = fetch_columns(client, directions)
+        mappings = match_by_name(field_names, ((name, qn, directions[parent]) for name, qn, parent in columns))
+        st.write(f"🔗 Matched {len(mappings)} field-to-column mappings by name across {len(columns)} columns.")
+
+    create_column_lineage(client, mappings, field_names, app_qn, asset_details["name"], connection_qn)
 
 
 def _update_owned_assets_relationship(client, app_qn, app_name, owned_assets_selection, search_results):
@@ -389,30 +805,37 @@ def _update_owned_assets_relationship(client, app_qn, app_name, owned_assets_sel
         
         # Use batch processing for efficiency
         try:
-            batch = Batch(client, max_size=20)  # Process in batches
+            bulk_limiter = get_tenant_limiter(get_tenant_key(client))
+            with bulk_limiter.slot(BULK_LANE):
+                batch = Batch(client, max_size=20)  # Process in batches
             
-            for asset_name in owned_assets_selection:
-                try:
-                    owned_asset = search_results[asset_name]
-                    asset_qn = owned_asset.qualified_name
-                    asset_type_name = owned_asset.type_name
+                for asset_name in owned_assets_selection:
+                    try:
+                        owned_asset = search_results[asset_name]
+                        asset_qn = owned_asset.qualified_name
+                        asset_type_name = owned_asset.type_name
                     
-                    # Use trimToRequired() pattern from Atlan documentation for updates
-                    # This gives us a builder with only the minimum required attributes
-                    asset_updater = owned_asset.trim_to_required()
+                        # Use trimToRequired() pattern from Atlan documentation for updates
+                        # This gives us a builder with only the minimum required attributes
+                        asset_updater = owned_asset.trim_to_required(client)
                     
-                    # Set the applicationQualifiedName to create the reverse relationship
-                    asset_updater.application_qualified_name = app_qn
+                        # Set the applicationQualifiedName to create the reverse relationship
+                        asset_updater.application_qualified_name = app_qn
                     
-                    batch.add(asset_updater)
-                    st.write(f"   - Queued: {asset_qn} -> applicationQualifiedName = {app_qn}")
+                        batch.add(asset_updater)
+                        st.write(f"   - Queued: {asset_qn} -> applicationQualifiedName = {app_qn}")
                     
-                except Exception as asset_prep_e:
-                    st.warning(f"   - Failed to prepare asset {asset_name}: {asset_prep_e}")
+                    except Exception as asset_prep_e:
+                        st.warning(f"   - Failed to prepare asset {asset_name}: {asset_prep_e}")
             
             # Flush the batch to update all owned assets
             if batch.size > 0:
-                batch_response = batch.flush()
+                with bulk_limiter.slot(BULK_LANE), span("atlan.update_owned_assets", **{
+                    "atlan.operation": "update_owned_assets", "atlan.tenant": bulk_limiter.tenant,
+                    "batch.size": 20, "batch.items": batch.size,
+                }):
+                    batch_response = batch.flush()
+                notify_assets_written(client, [search_results[name] for name in owned_assets_selection])
                 st.success(f"✅ Step 2: Successfully updated {len(owned_assets_selection)} assets with applicationQualifiedName")
                 success_count += 1
             else:
@@ -430,7 +853,7 @@ def _update_owned_assets_relationship(client, app_qn, app_name, owned_assets_sel
                     asset_qn = owned_asset.qualified_name
                     
                     # Use trimToRequired() for individual updates
-                    asset_updater = owned_asset.trim_to_required()
+                    asset_updater = owned_asset.trim_to_required(client)
                     asset_updater.application_qualified_name = app_qn
                     
                     # Save individual asset
@@ -458,8 +881,8 @@ def _update_owned_assets_relationship(client, app_qn, app_name, owned_assets_sel
         st.info("💡 **Note:** Application was updated successfully, but the owned assets relationship could not be established. The assets may need to be linked manually in the Atlan UI.")
 
 
-def _show_success_and_cleanup(is_update, asset_details, app_qn):
-    """Show success message and clean up session state."""
+def _show_success_and_cleanup(is_update, asset_details, app_qn, rerun=True):
+    """Show success message and clean up session state (rerunning unless other results are still to be shown)."""
     atlan_url = st.session_state["atlan_url"]
     
     if is_update:
@@ -477,6 +900,8 @@ def _show_success_and_cleanup(is_update, asset_details, app_qn):
         # For now, use a generic success message
         st.success(f"🎉 Successfully created Application: {asset_details['name']}")
 
-    # Clean up session state for next operation
+    # Clean up session state (and the draft it was saved to) for next operation
+    discard_session_draft()
     clear_workflow_state()
-    st.rerun() 
\ No newline at end of file
+    if rerun:
+        st.rerun() 
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Compact representations of search results and application fields for session state.
+
+Every session keeps its search results and field list in server memory, so
+these structures store only what the workflow needs instead of full pyatlan
+pydantic models and per-field dictionaries.
+"""
+
+import sys
+from array import array
+
+# Bit flags stored per field row
+_FLAG_IS_EXISTING = 1
+_FLAG_MARK_FOR_DELETION = 2
+_FLAG_KEYS = {
+    "is_existing": _FLAG_IS_EXISTING,
+    "mark_for_deletion": _FLAG_MARK_FOR_DELETION,
+}
+
+# Tag sets shared between field rows, so thousands of fields tagged alike hold one tuple
+_TAG_SETS = {}
+
+# pyatlan types whose trim_to_required() needs more than qualified_name and name
+_TYPES_REQUIRING_FULL_ASSET = {"AtlasGlossaryCategory", "AtlasGlossaryTerm", "Procedure"}
+
+
+class AssetRef:
+    """Slim reference to a search result, holding only its identifying attributes."""
+
+    __slots__ = ("guid", "qualified_name", "type_name", "name")
+
+    def __init__(self, guid, qualified_name, type_name, name):
+        self.guid = guid
+        self.qualified_name = qualified_name
+        self.type_name = type_name
+        self.name = name
+
+    @classmethod
+    def from_asset(cls, asset):
+        """Build a reference from a pyatlan asset (or another reference)."""
+        return cls(
+            getattr(asset, "guid", None),
+            getattr(asset, "qualified_name", None),
+            getattr(asset, "type_name", None),
+            getattr(asset, "name", None),
+        )
+
+    def rehydrate(self, client):
+        """Fetch the full asset from Atlan."""
+        return client.asset.get_by_guid(self.guid, min_ext_info=True, ignore_relationships=True)
+
+    def trim_to_required(self, client=None):
+        """
+        Build an updater with only the minimum required attributes.
+
+        The full asset is only fetched for types whose updater needs more than
+        the qualified name and name (e.g. glossary terms need their anchor).
+
+        Args:
+            client: AtlanClient used to rehydrate the asset when required
+        """
+        if self.type_name in _TYPES_REQUIRING_FULL_ASSET:
+            if client is None:
+                raise ValueError(f"A client is required to update {self.type_name} assets")
+            return self.rehydrate(client).trim_to_required()
+
+        from pyatlan.model import assets
+
+        asset_class = getattr(assets, self.type_name or "", None) or assets.Asset
+        return asset_class.create_for_modification(
+            qualified_name=self.qualified_name or "", name=self.name or ""
+        )
+
+    def __repr__(self):
+        return f"AssetRef({self.type_name}: {self.qualified_name})"
+
+
+class FieldRow:
+    """Dictionary-like view of a single row in a FieldStore."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    def get(self, key, default=None):
+        return self._store.get_value(self._index, key, default)
+
+    def __getitem__(self, key):
+        value = self._store.get_value(self._index, key, KeyError)
+        if value is KeyError:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._store.set_value(self._index, key, value)
+
+    def __contains__(self, key):
+        return self._store.get_value(self._index, key, KeyError) is not KeyError
+
+    def to_dict(self):
+        """Return the row as a plain dictionary."""
+        return self._store.row_dict(self._index)
+
+
+class FieldStore:
+    """
+    Column-oriented storage for ApplicationField rows.
+
+    Text attributes are kept in one list per column (with repeated data types
+    and tag sets interned) and boolean markers in a byte array, while rows are exposed as
+    dictionary-like views so existing ``field.get(...)`` code keeps working.
+    """
+
+    __slots__ = ("_columns", "_flags", "version")
+
+    def __init__(self, fields=()):
+        self._columns = {"name": [], "type": [], "description": [], "qualified_name": []}
+        self._flags = array("B")
+        self.version = 0  # Incremented by every change, so callers can tell cheaply whether rows changed
+        for field in fields:
+            self.append(field)
+
+    def append(self, field):
+        """Append a field given as a dictionary or FieldRow."""
+        if isinstance(field, FieldRow):
+            field = field.to_dict()
+        index = len(self._flags)
+        self.version += 1
+        self._flags.append(0)
+        for column in self._columns.values():
+            column.append(None)
+        for key, value in field.items():
+            self.set_value(index, key, value)
+
+    def pop(self, index=-1):
+        """Remove and return the row at the given index as a dictionary."""
+        row = self.row_dict(index)
+        self.version += 1
+        self._flags.pop(index)
+        for column in self._columns.values():
+            column.pop(index)
+        return row
+
+    def get_value(self, index, key, default=None):
+        if key in _FLAG_KEYS:
+            return bool(self._flags[index] & _FLAG_KEYS[key])
+        column = self._columns.get(key)
+        if column is None or column[index] is None:
+            # Text columns read as empty strings, like freshly added editor rows
+            if key == "tags":
+                return ()
+            return "" if key in ("name", "type", "description") else default
+        return column[index]
+
+    def set_value(self, index, key, value):
+        if key in _FLAG_KEYS:
+            flags = self._flags[index] | _FLAG_KEYS[key] if value else self._flags[index] & ~_FLAG_KEYS[key] & 0xFF
+            if flags != self._flags[index]:
+                self._flags[index] = flags
+                self.version += 1
+            return
+        if key == "type" and isinstance(value, str):
+            value = sys.intern(value)
+        elif key == "tags":
+            value = tuple(sorted(set(value))) if value else None
+            if value is not None:
+                value = _TAG_SETS.setdefault(value, value)
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = [None] * len(self._flags)
+        # Editor widgets write every row back on each rerun; only real changes count
+        if column[index] != value:
+            column[index] = value
+            self.version += 1
+
+    def row_dict(self, index):
+        row = {key: column[index] for key, column in self._columns.items() if column[index] is not None}
+        for key, flag in _FLAG_KEYS.items():
+            if self._flags[index] & flag:
+                row[key] = True
+        return row
+
+    def to_dicts(self):
+        """Return all rows as plain dictionaries."""
+        return [self.row_dict(i) for i in range(len(self))]
+
+    def to_columns(self):
+        """Return the rows as JSON-serializable columns (see ``from_columns``)."""
+        return {
+            "columns": {key: [list(v) if isinstance(v, tuple) else v for v in column] for key, column in self._columns.items()},
+            "flags": list(self._flags),
+        }
+
+    @classmethod
+    def from_columns(cls, data):
+        """Rebuild a store from the output of ``to_columns``, interning types and tag sets again."""
+        store = cls()
+        flags = data.get("flags") or []
+        store._flags = array("B", flags)
+        for column in store._columns.values():
+            column.extend([None] * len(flags))
+        for key, values in (data.get("columns") or {}).items():
+            for index, value in enumerate(values[:len(flags)]):
+                if value is not None:
+                    store.set_value(index, key, value)
+        return store
+
+    def __len__(self):
+        return len(self._flags)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("field index out of range")
+        return FieldRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield FieldRow(self, index)
+
+
+def compact_search_results(results):
+    """Convert a {display name: asset} mapping into {display name: AssetRef}."""
+    return {display_name: AssetRef.from_asset(asset) for display_name, asset in results.items()}
+
+
+def estimate_size(obj, _seen=None):
+    """
+    Estimate the deep memory footprint of an object in bytes.
+
+    Follows containers, ``__dict__`` and ``__slots__`` attributes, counting
+    each object once.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += estimate_size(vars(obj), _seen)
+    slots = getattr(type(obj), "__slots__", ())
+    for slot in (slots,) if isinstance(slots, str) else slots:
+        if hasattr(obj, slot):
+            size += estimate_size(getattr(obj, slot), _seen)
+    return size
@@ -0,0 +1,408 @@
+"""
+Local drafts of the builder wizard.
+
+The wizard's session state is captured as plain data (fields as FieldStore
+columns, search results as reference lists), gzipped as JSON and written to
+DRAFTS_DIR whenever a rerun changed it, so work survives "Start Over", a
+browser refresh or a lost Atlan session, and can be done with no connection
+at all. A draft that reached the relationships step can be queued; queued
+drafts are submitted together once a client is available (see
+``services.mutation_queue``).
+
+Drafts are files on the server running the app. Each records the user and
+tenant that saved it, and is only listed, resumed or submitted for them.
+Drafts saved before connecting record the browser instead (an ID kept in the
+app URL) until they are claimed by a connected user.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+
+import streamlit as st
+from config.settings import DRAFTS_DIR, DRAFT_BROWSER_QUERY_PARAM
+from utils.compact_state import AssetRef, FieldStore
+from utils.session_state import clear_workflow_state
+
+logger = logging.getLogger(__name__)
+
+DRAFT_FORMAT_VERSION = 1
+_SUFFIX = ".json.gz"
+
+# Relationship picker widget keys, restored with the draft
+RELATIONSHIP_KEYS = {
+    "owned_assets": "owned_assets_selection",
+    "lineage_inputs": "lineage_inputs_selection",
+    "lineage_outputs": "lineage_outputs_selection",
+}
+_REF_GROUPS = ("owned_assets", "lineage_inputs", "lineage_outputs")
+
+
+class Draft:
+    """A saved draft: its wizard state and whether it waits in the submission queue."""
+
+    __slots__ = ("draft_id", "title", "owner", "browser", "saved_at", "queued_at", "error", "state")
+
+    def __init__(self, draft_id, title, owner, browser, saved_at, queued_at, error, state):
+        self.draft_id = draft_id
+        self.title = title
+        self.owner = owner  # (username, tenant URL) that saved it, or None if saved before connecting
+        self.browser = browser  # Browser ID (see browser_id) it was first saved from, or None
+        self.saved_at = saved_at  # Epoch seconds of the last save
+        self.queued_at = queued_at  # Epoch seconds it was queued, or None
+        self.error = error  # Why its last submission failed, or None
+        self.state = state  # Captured wizard state (see capture_session_draft)
+
+    @property
+    def is_update(self):
+        return self.state.get("operation_type") == "Update an existing Application"
+
+    @property
+    def is_complete(self):
+        """Whether the draft reached the relationships step and can be queued for submission."""
+        return "asset_details" in self.state and "enrichment_details" in self.state
+
+
+def _refs_to_data(refs):
+    return {name: [ref.guid, ref.qualified_name, ref.type_name, ref.name] for name, ref in refs.items()}
+
+
+def _refs_from_data(data):
+    return {name: AssetRef(*values) for name, values in (data or {}).items()}
+
+
+def _path(draft_id):
+    return os.path.join(DRAFTS_DIR, f"{draft_id}{_SUFFIX}")
+
+
+def _draft_title(state):
+    details = state.get("asset_details") or {}
+    return details.get("name") or "Untitled application"
+
+
+def session_owner():
+    """The (username, tenant URL) of the session's connected user, or None before connecting."""
+    user = st.session_state.get("user")
+    tenant = (st.session_state.get("atlan_url") or "").rstrip("/")
+    username = getattr(user, "username", None)
+    return (username, tenant) if username and tenant else None
+
+
+def browser_id():
+    """
+    ID of the browser's drafts, kept in the app URL so a refresh or a new
+    session in the same tab still finds the drafts it saved before connecting.
+    """
+    value = st.query_params.get(DRAFT_BROWSER_QUERY_PARAM)
+    if not value:
+        value = st.session_state.get("draft_browser") or uuid.uuid4().hex
+        st.query_params[DRAFT_BROWSER_QUERY_PARAM] = value
+    st.session_state["draft_browser"] = value
+    return value
+
+
+def is_session_draft(draft):
+    """
+    Whether the session may see and act on a draft: its user's own on this
+    tenant, or one saved from this browser before connecting.
+    """
+    if draft.owner is None:
+        return draft.browser == browser_id() or draft.draft_id == st.session_state.get("draft_id")
+    return draft.owner == session_owner()
+
+
+def is_claimable_draft(draft):
+    """Whether a connected user may claim a draft nobody owns, saved before drafts recorded a browser."""
+    return draft.owner is None and draft.browser is None and session_owner() is not None
+
+
+def save_draft(draft_id, state, queued=None, error=None):
+    """
+    Write a draft to disk atomically, owned by the session's user and tenant unless it has an owner.
+
+    Args:
+        draft_id: Identifier of the draft (its file name)
+        state: Captured wizard state
+        queued: True to queue the draft, False to unqueue it, None to keep its queue status
+        error: Error of its last failed submission, kept until it is saved again without one
+    """
+    existing = load_draft(draft_id)
+    queued_at = None
+    if queued is None:
+        queued_at = existing.queued_at if existing is not None else None
+    elif queued:
+        queued_at = time.time()
+    # A draft saved before connecting is claimed when it is next saved connected
+    owner = existing.owner if existing is not None and existing.owner else session_owner()
+    browser = existing.browser if existing is not None and existing.browser else browser_id()
+    document = {
+        "version": DRAFT_FORMAT_VERSION,
+        "title": _draft_title(state),
+        "owner": list(owner) if owner else None,
+        "browser": browser,
+        "saved_at": time.time(),
+        "queued_at": queued_at,
+        "error": error,
+        "state": state,
+    }
+    os.makedirs(DRAFTS_DIR, exist_ok=True)
+    path = _path(draft_id)
+    temporary = f"{path}.tmp"
+    with gzip.open(temporary, "wt", encoding="utf-8") as f:
+        json.dump(document, f, separators=(",", ":"))
+    os.replace(temporary, path)
+
+
+def load_draft(draft_id):
+    """Read a draft from disk; None if it does not exist or cannot be read."""
+    try:
+        with gzip.open(_path(draft_id), "rt", encoding="utf-8") as f:
+            document = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.exception("Draft %s could not be read", draft_id)
+        return None
+    if document.get("version") != DRAFT_FORMAT_VERSION:
+        return None
+    owner = document.get("owner")
+    return Draft(
+        draft_id, document.get("title"), tuple(owner) if owner else None, document.get("browser"),
+        document.get("saved_at"), document.get("queued_at"), document.get("error"), document.get("state") or {},
+    )
+
+
+def list_drafts(include=is_session_draft):
+    """
+    Readable drafts, most recently saved first.
+
+    Args:
+        include: Predicate selecting the drafts to list; by default the session's (see is_session_draft)
+    """
+    try:
+        names = os.listdir(DRAFTS_DIR)
+    except FileNotFoundError:
+        return []
+    drafts = [load_draft(name[:-len(_SUFFIX)]) for name in names if name.endswith(_SUFFIX)]
+    drafts = [d for d in drafts if d is not None and include(d)]
+    return sorted(drafts, key=lambda d: d.saved_at or 0, reverse=True)
+
+
+def claim_draft(draft_id):
+    """
+    Make the connected user the owner of a claimable draft (see is_claimable_draft).
+
+    Returns:
+        Whether the draft was claimed
+    """
+    draft = load_draft(draft_id)
+    if draft is None or not is_claimable_draft(draft):
+        return False
+    save_draft(draft_id, draft.state, error=draft.error)
+    return True
+
+
+def delete_draft(draft_id):
+    """Delete a draft; deleting one that does not exist is a no-op."""
+    try:
+        os.remove(_path(draft_id))
+    except FileNotFoundError:
+        pass
+
+
+def capture_session_draft():
+    """
+    Capture the wizard's session state as JSON-serializable data.
+
+    Returns:
+        Dict of the wizard state, or None before there is anything to save
+        (no application details and no fields yet)
+    """
+    session = st.session_state
+    if "operation_type" not in session or ("asset_details" not in session and not session.get("application_fields")):
+        return None
+    state = {"operation_type": session["operation_type"]}
+
+    fields = session.get("application_fields")
+    if fields is not None:
+        state["application_fields"] = FieldStore(fields).to_columns() if not isinstance(fields, FieldStore) else fields.to_columns()
+    if "asset_details" in session:
+        details = dict(session["asset_details"])
+        # Once the field editor has run, asset_details refers to its store, restored from application_fields
+        fields = details.pop("fields", None)
+        if "application_fields" not in state:
+            state["asset_fields"] = FieldStore(fields or ()).to_columns()
+        state["asset_details"] = details
+    if "enrichment_details" in session:
+        state["enrichment_details"] = dict(session["enrichment_details"])
+    selected = session.get("selected_application")
+    if selected is not None:
+        state["selected_application"] = [selected.guid, selected.qualified_name, selected.type_name, selected.name]
+    if session.get("search_results"):
+        state["search_results"] = _refs_to_data(session["search_results"])
+    existing = session.get("existing_application_state")
+    if existing is not None:
+        state["existing_application_state"] = {
+            key: _refs_to_data(value) if key in _REF_GROUPS else list(value) for key, value in existing.items()
+        }
+    state["relationships"] = {
+        group: list(session[key]) for group, key in RELATIONSHIP_KEYS.items() if key in session
+    }
+    return state
+
+
+def restore_session_draft(draft):
+    """Replace the wizard's session state with a draft's, continuing to save to the same draft."""
+    clear_workflow_state()
+    state = draft.state
+    session = st.session_state
+    session["operation_type"] = state["operation_type"]
+    if "application_fields" in state:
+        session["application_fields"] = FieldStore.from_columns(state["application_fields"])
+    if "asset_details" in state:
+        details = dict(state["asset_details"])
+        fields = session.get("application_fields")
+        details["fields"] = fields if fields is not None else FieldStore.from_columns(state.get("asset_fields") or {})
+        session["asset_details"] = details
+    if "enrichment_details" in state:
+        session["enrichment_details"] = dict(state["enrichment_details"])
+    if state.get("selected_application"):
+        session["selected_application"] = AssetRef(*state["selected_application"])
+    session["search_results"] = _refs_from_data(state.get("search_results"))
+    if "existing_application_state" in state:
+        session["existing_application_state"] = {
+            key: _refs_from_data(value) if key in _REF_GROUPS else value
+            for key, value in state["existing_application_state"].items()
+        }
+    for group, names in (state.get("relationships") or {}).items():
+        session[RELATIONSHIP_KEYS[group]] = [name for name in names if name in session["search_results"]]
+    session["draft_id"] = draft.draft_id
+    session["draft_digest"] = _digest(capture_session_draft())
+    session["draft_fingerprint"] = _fingerprint(session)
+
+
+def _digest(state):
+    # The owner is included so a draft started offline is saved (and claimed) once connected
+    document = {"owner": session_owner(), "state": state}
+    return hashlib.sha1(json.dumps(document, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class _Same:
+    """Equal only to a wrapper of the same object, which it keeps alive so its identity is not reused."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _Same) and other.obj is self.obj
+
+    __hash__ = None
+
+
+def _fingerprint(session):
+    """
+    Cheap stand-in for the captured wizard state, to skip capturing it on reruns that changed nothing.
+
+    The small dictionaries are compared by value. The field store is compared
+    by its version counter. Search results and the existing application state
+    are only ever replaced, never changed in place, so they are compared by identity.
+
+    Returns:
+        A comparable value, or None when it cannot tell (fields not in a FieldStore)
+    """
+    fingerprint = [session_owner(), session.get("operation_type")]
+    for key in ("application_fields", "asset_details"):
+        value = session.get(key)
+        fields = value.get("fields") if key == "asset_details" and value is not None else value
+        if fields is not None and not isinstance(fields, FieldStore):
+            return None
+        fingerprint.append((_Same(fields), fields.version if fields is not None else None))
+    details = session.get("asset_details")
+    if details is not None:
+        details = {key: value for key, value in details.items() if key != "fields"}
+    fingerprint.append(json.dumps([details, session.get("enrichment_details")], sort_keys=True, default=str))
+    fingerprint += [
+        _Same(session.get("search_results")),
+        _Same(session.get("existing_application_state")),
+        _Same(session.get("selected_application")),
+        tuple(tuple(session.get(key) or ()) for key in RELATIONSHIP_KEYS.values()),
+    ]
+    return tuple(fingerprint)
+
+
+def autosave_session_draft(queued=None):
+    """
+    Save the wizard's state to the session's draft if it changed since the last save.
+
+    The session's draft is created on the first save after an operation is
+    chosen, and "Start Over" starts a new one (the old draft is kept).
+
+    Args:
+        queued: True to queue the draft for submission (saved even if unchanged)
+
+    Returns:
+        The draft's ID, or None if there is nothing to save
+    """
+    session = st.session_state
+    fingerprint = _fingerprint(session)
+    if queued is None and fingerprint is not None and fingerprint == session.get("draft_fingerprint"):
+        return session.get("draft_id")
+    state = capture_session_draft()
+    if state is None:
+        return None
+    digest = _digest(state)
+    if digest == session.get("draft_digest") and queued is None:
+        session["draft_fingerprint"] = fingerprint
+        return session.get("draft_id")
+    draft_id = session.setdefault("draft_id", uuid.uuid4().hex)
+    try:
+        save_draft(draft_id, state, queued=queued)
+    except OSError:
+        logger.exception("Draft %s could not be saved", draft_id)
+        return None
+    session["draft_digest"] = digest
+    session["draft_fingerprint"] = fingerprint
+    return draft_id
+
+
+def discard_session_draft():
+    """Delete the session's draft once its application was submitted."""
+    draft_id = st.session_state.get("draft_id")
+    if draft_id:
+        delete_draft(draft_id)
+
+
+def draft_submission(draft):
+    """
+    What a complete draft submits, in the shape the mutation queue replays.
+
+    Returns:
+        Dict with "asset_details" (its "fields" a FieldStore), "enrichment_details"
+        and the AssetRef lists "owned_assets", "lineage_inputs" and "lineage_outputs"
+        (plus the application's "lineage_processes" in update mode), or None if the
+        draft is not complete
+    """
+    if not draft.is_complete:
+        return None
+    state = draft.state
+    details = dict(state["asset_details"])
+    details["fields"] = FieldStore.from_columns(state.get("application_fields") or state.get("asset_fields") or {})
+    search_results = _refs_from_data(state.get("search_results"))
+    relationships = state.get("relationships") or {}
+    existing = state.get("existing_application_state") or {}
+    submission = {"asset_details": details, "enrichment_details": dict(state["enrichment_details"])}
+    for group in _REF_GROUPS:
+        if group in relationships:
+            submission[group] = [search_results[name] for name in relationships[group] if name in search_results]
+        else:
+            # Pickers never shown keep what the application had, as their defaults would
+            submission[group] = list(_refs_from_data(existing.get(group)).values())
+    if draft.is_update:
+        submission["lineage_processes"] = list(existing.get("lineage_processes") or ())
+    return submission
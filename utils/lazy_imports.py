@@ -0,0 +1,56 @@
+"""
+Deferred loading of pyatlan's asset model tree.
+
+Importing ``pyatlan.client.atlan`` or ``pyatlan.model.assets`` builds
+hundreds of pydantic models and takes seconds. The sidebar and step 0 do not
+need them, so the app imports them on first use and warms them up in a
+background thread while the user is still entering credentials.
+"""
+
+import importlib
+import threading
+
+# Modules loaded by the wizard steps and the Atlan client, heaviest first
+PYATLAN_MODULES = (
+    "pyatlan.client.atlan",
+    "pyatlan.model.assets",
+    "pyatlan.model.fluent_search",
+    "pyatlan.client.asset",
+)
+
+_preload_thread = None
+_preload_lock = threading.Lock()
+
+
+def _import_modules(module_names):
+    for name in module_names:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # The real import on first use will surface the error to the user
+            return
+
+
+def preload_in_background(module_names=PYATLAN_MODULES):
+    """
+    Start importing modules in a daemon thread, once per process.
+
+    A later import of the same module on another thread waits for this one
+    to finish instead of importing it twice.
+
+    Returns:
+        The preload thread
+    """
+    global _preload_thread
+    with _preload_lock:
+        if _preload_thread is None:
+            _preload_thread = threading.Thread(
+                target=_import_modules, args=(module_names,), name="pyatlan-preload", daemon=True
+            )
+            _preload_thread.start()
+        return _preload_thread
+
+
+def load_attribute(module_name, attribute):
+    """Import a module on first use and return one of its attributes."""
+    return getattr(importlib.import_module(module_name), attribute)
@@ -0,0 +1,109 @@
+"""
+Field-to-column lineage mappings, imported from CSV or matched by name.
+
+A mapping links one ApplicationField (by name) to one upstream or downstream
+asset, usually a column (by qualified name). Mappings are plain tuples so
+duplicates collapse in a set, and are turned into one lineage process per
+field and direction.
+"""
+
+import codecs
+import csv
+
+from utils.name_matching import tokenize
+
+UPSTREAM = "upstream"  # The column feeds the field
+DOWNSTREAM = "downstream"  # The field feeds the column
+
+_DIRECTIONS = {"upstream": UPSTREAM, "input": UPSTREAM, "downstream": DOWNSTREAM, "output": DOWNSTREAM}
+
+
+class MappingImportError(ValueError):
+    """Raised when a mapping CSV lacks the required columns."""
+
+
+def iter_mapping_csv(stream):
+    """
+    Read field-to-column mappings from a CSV file, row by row.
+
+    The header must contain ``field`` and ``column`` (the column's qualified
+    name); an optional ``direction`` is ``upstream`` (default) or ``downstream``.
+
+    Args:
+        stream: Text or binary file-like object (e.g. a Streamlit upload)
+
+    Yields:
+        (field name, column qualified name, direction), or None for a row that could not be used
+
+    Raises:
+        MappingImportError: If the header lacks the required columns
+    """
+    lines = stream
+    if isinstance(stream.read(0), bytes):
+        lines = codecs.getreader("utf-8-sig")(stream)
+    reader = csv.DictReader(lines)
+    header = {(name or "").strip().lower(): name for name in reader.fieldnames or []}
+    if "field" not in header or "column" not in header:
+        raise MappingImportError("the CSV header needs 'field' and 'column' columns")
+
+    direction_column = header.get("direction")
+    for row in reader:
+        field_name = (row.get(header["field"]) or "").strip()
+        column = (row.get(header["column"]) or "").strip()
+        direction = (row.get(direction_column) if direction_column else None) or UPSTREAM
+        direction = _DIRECTIONS.get(direction.strip().lower())
+        yield (field_name, column, direction) if field_name and column and direction else None
+
+
+def read_mapping_csv(stream):
+    """
+    Read and de-duplicate the mappings in a CSV file.
+
+    Returns:
+        Tuple of (sorted list of unique mappings, number of rows skipped as invalid or duplicate)
+    """
+    mappings = set()
+    skipped = 0
+    for mapping in iter_mapping_csv(stream):
+        if mapping is None or mapping in mappings:
+            skipped += 1
+        else:
+            mappings.add(mapping)
+    return sorted(mappings), skipped
+
+
+def match_by_name(field_names, columns):
+    """
+    Map fields to the columns with the same name, ignoring case and separators
+    (``customer_id`` matches ``CustomerId``).
+
+    Args:
+        field_names: ApplicationField names
+        columns: Iterable of (column name, column qualified name, direction)
+
+    Returns:
+        Sorted list of unique mappings
+    """
+    fields_by_key = {}
+    for name in field_names:
+        key = "".join(tokenize(name))
+        if key:
+            fields_by_key.setdefault(key, []).append(name)
+    mappings = set()
+    for column_name, qualified_name, direction in columns:
+        for field_name in fields_by_key.get("".join(tokenize(column_name)) or None, ()):
+            mappings.add((field_name, qualified_name, direction))
+    return sorted(mappings)
+
+
+def group_mappings(mappings):
+    """
+    Group mappings into lineage processes, one per field and direction.
+
+    Returns:
+        Mapping of (field name, direction) to the sorted qualified names of its columns
+    """
+    groups = {}
+    for field_name, column, direction in set(mappings):
+        groups.setdefault((field_name, direction), set()).add(column)
+    return {key: sorted(columns) for key, columns in groups.items()}
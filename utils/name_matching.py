@@ -0,0 +1,267 @@
+"""
+Typo-tolerant, ranked matching of search terms against asset names.
+
+Names are normalised once per candidate set: split into tokens on camelCase,
+snake_case, punctuation and digit boundaries, joined into a compact form
+("Orders Service" -> "ordersservice") and broken into trigrams. Letters and
+digits of any script are kept, so "顧客テーブル" is a token of its own. A query
+then only scores candidates sharing enough trigrams with it (found through an
+inverted index), so ranking thousands of names stays cheap. A query with no
+letters or digits at all falls back to a case-insensitive substring search.
+
+Scores are in [0, 1]: exact names and ``app_id`` hits first, then prefixes,
+token prefixes ("ord serv"), substrings, abbreviations sharing a trigram with
+the name ("ordersvc"), misspellings within a small edit distance ("tabel")
+and finally trigram similarity.
+"""
+
+import heapq
+import re
+from collections import Counter
+
+from config.settings import NAME_MATCH_MIN_SCORE, NAME_MATCH_MIN_SHARED_TRIGRAMS, NAME_MATCH_MAX_FUZZY_CANDIDATES
+
+_TOKEN_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+_WORD_PATTERN = re.compile(r"[^\W_]+")  # Runs of letters and digits of any script
+
+# Score of each kind of match, before the small preference for shorter names
+_EXACT = 1.0
+_ID_EXACT = 0.97
+_PREFIX = 0.9
+_TOKEN_PREFIX = 0.85
+_SUBSTRING = 0.8
+_TOKEN_ABBREVIATION = 0.75
+_TYPO = 0.75  # Less 0.1 per edit after the first
+_ABBREVIATION = 0.7
+_SIMILARITY = 0.65
+
+
+def tokenize(name):
+    """Split a name into lower-case tokens on case, underscore, punctuation and digit boundaries."""
+    name = name or ""
+    if name.isascii():
+        return [token.lower() for token in _TOKEN_PATTERN.findall(name)]
+    # The same boundaries, using Unicode character classes
+    tokens = []
+    for word in _WORD_PATTERN.findall(name):
+        start = 0
+        for i in range(1, len(word)):
+            previous, char = word[i - 1], word[i]
+            if (
+                previous.isdigit() != char.isdigit()
+                or (previous.islower() and char.isupper())
+                or (previous.isupper() and char.isupper() and i + 1 < len(word) and word[i + 1].islower())
+            ):
+                tokens.append(word[start:i].lower())
+                start = i
+        tokens.append(word[start:].lower())
+    return tokens
+
+
+def trigrams(compact):
+    """Overlapping three-character substrings of a compact name (the name itself if shorter)."""
+    if len(compact) < 3:
+        return {compact} if compact else set()
+    return {compact[i:i + 3] for i in range(len(compact) - 2)}
+
+
+def _token_abbreviation(query, tokens, query_index=0, token_index=0):
+    """
+    Whether ``query`` abbreviates the name: each part of it starts a token and
+    continues with letters of that token in order ("ordsvc" for orders_service).
+    """
+    if query_index == len(query):
+        return True
+    for index in range(token_index, len(tokens)):
+        token = tokens[index]
+        if token[0] != query[query_index]:
+            continue
+        # Query positions this token can take us to, longest first
+        ends = [query_index + 1]
+        for char in token[1:]:
+            if ends[-1] < len(query) and char == query[ends[-1]]:
+                ends.append(ends[-1] + 1)
+        if any(_token_abbreviation(query, tokens, end, index + 1) for end in reversed(ends)):
+            return True
+    return False
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions
+    and adjacent transpositions) between two strings.
+
+    Returns:
+        The distance, or ``max_distance + 1`` as soon as it is known to exceed ``max_distance``
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if cost and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _abbreviation_pattern(query):
+    """Regex finding the characters of ``query`` in order, with anything between them."""
+    return re.compile(".*?".join(re.escape(char) for char in query))
+
+
+def _tokens_prefix(query_tokens, tokens):
+    """Whether every query token is a prefix of a distinct name token, in order."""
+    index = 0
+    for query_token in query_tokens:
+        while index < len(tokens) and not tokens[index].startswith(query_token):
+            index += 1
+        if index == len(tokens):
+            return False
+        index += 1
+    return True
+
+
+class NameRanker:
+    """
+    Ranks a fixed set of candidates against search terms.
+
+    Build one per candidate set (a page of results or a whole index) and call
+    :meth:`rank` for each query.
+    """
+
+    __slots__ = ("candidates", "_name", "_tokens", "_compact", "_ids", "_postings")
+
+    def __init__(self, candidates, name=lambda c: getattr(c, "name", None), app_id=None):
+        """
+        Args:
+            candidates: Objects to rank
+            name: Function returning a candidate's name
+            app_id: Optional function returning a candidate's application ID, boosted on exact hits
+        """
+        self.candidates = list(candidates)
+        self._name = name
+        self._tokens = [tokenize(name(c)) for c in self.candidates]
+        self._compact = ["".join(tokens) for tokens in self._tokens]
+        self._ids = {}  # compact app_id -> candidate indexes
+        if app_id is not None:
+            for index, candidate in enumerate(self.candidates):
+                compact_id = "".join(tokenize(str(app_id(candidate) or "")))
+                if compact_id:
+                    self._ids.setdefault(compact_id, []).append(index)
+        self._postings = {}
+        for index, compact in enumerate(self._compact):
+            for gram in trigrams(compact):
+                self._postings.setdefault(gram, []).append(index)
+
+    def _direct_score(self, index, query, query_tokens, id_hits):
+        """Score of an exact, ID, prefix or substring match, or None if it is none of these."""
+        compact = self._compact[index]
+        if compact == query:
+            return _EXACT
+        if index in id_hits:
+            return _ID_EXACT
+        if compact.startswith(query):
+            return _PREFIX
+        if len(query_tokens) > 1 and _tokens_prefix(query_tokens, self._tokens[index]):
+            return _TOKEN_PREFIX
+        if query in compact:
+            return _SUBSTRING
+        return None
+
+    def _fuzzy_score(self, index, query, query_grams, shared, abbreviation):
+        """Score of an abbreviation, misspelling or trigram-similar name."""
+        compact = self._compact[index]
+        # Share of the query's trigrams found in the name; longer names lose out on the tie-breaker
+        score = _SIMILARITY * shared / len(query_grams)
+        match = abbreviation.search(compact)
+        if match is not None:
+            if _token_abbreviation(query, self._tokens[index]):
+                return _TOKEN_ABBREVIATION
+            score = max(score, _ABBREVIATION * len(query) / (match.end() - match.start()))
+        # Misspelt name, or misspelt start of the name (typos in the first letter are rare)
+        if score < _TYPO and compact[0] in query[:2]:
+            max_edits = max(1, len(query) // 4)
+            query_chars = set(query)
+            for target in (compact, compact[:len(query)]):
+                # Each edit changes at most two letters of the character set, so most names are ruled out here
+                if len(query_chars ^ set(target)) <= 2 * max_edits:
+                    edits = edit_distance(query, target, max_edits)
+                    if edits <= max_edits:
+                        score = max(score, _TYPO - 0.1 * (edits - 1))
+        return score
+
+    def rank(self, search_term, limit=None, min_score=NAME_MATCH_MIN_SCORE):
+        """
+        Rank candidates against a search term.
+
+        Args:
+            search_term: Text typed by the user
+            limit: Maximum number of results (all matches when omitted)
+            min_score: Lowest score returned
+
+        Returns:
+            List of (score, candidate), best first
+        """
+        query_tokens = tokenize(search_term)
+        query = "".join(query_tokens)
+        if not query:
+            return self._rank_substring(search_term, limit, min_score)
+        query_grams = trigrams(query)
+
+        # Candidates sharing enough trigrams, plus ID hits which need not look like the name
+        if len(query) < 3:
+            pool = {index: 1 for index, compact in enumerate(self._compact) if query in compact}
+        else:
+            shared_counts = Counter()
+            for gram in query_grams:
+                shared_counts.update(self._postings.get(gram, ()))
+            needed = max(1, int(len(query_grams) * NAME_MATCH_MIN_SHARED_TRIGRAMS))
+            pool = {index: shared for index, shared in shared_counts.items() if shared >= needed}
+        id_hits = set(self._ids.get(query, ()))
+        for index in id_hits:
+            pool.setdefault(index, 0)
+
+        # Exact, prefix and substring matches always outrank fuzzy ones, which are
+        # only scored if they could make the cut, most shared trigrams first
+        scored = []
+        fuzzy = []
+        for index, shared in pool.items():
+            if not self._compact[index]:
+                continue
+            score = self._direct_score(index, query, query_tokens, id_hits)
+            if score is None:
+                fuzzy.append(index)
+            elif score >= min_score:
+                # Prefer the shorter of two otherwise equal names
+                scored.append((score - len(self._compact[index]) * 1e-4, -index))
+        if limit is None or len(scored) < limit:
+            abbreviation = _abbreviation_pattern(query)
+            fuzzy.sort(key=pool.get, reverse=True)
+            for index in fuzzy[:NAME_MATCH_MAX_FUZZY_CANDIDATES]:
+                score = self._fuzzy_score(index, query, query_grams, pool[index], abbreviation)
+                if score >= min_score:
+                    scored.append((score - len(self._compact[index]) * 1e-4, -index))
+        return self._best(scored, limit)
+
+    def _rank_substring(self, search_term, limit, min_score):
+        """Rank names containing a search term that has no letters or digits (e.g. "-" or an emoji)."""
+        needle = (search_term or "").strip().lower()
+        if not needle or _SUBSTRING < min_score:
+            return []
+        scored = []
+        for index, candidate in enumerate(self.candidates):
+            candidate_name = (self._name(candidate) or "").lower()
+            if needle in candidate_name:
+                scored.append((_SUBSTRING - len(candidate_name) * 1e-4, -index))
+        return self._best(scored, limit)
+
+    def _best(self, scored, limit):
+        best = heapq.nlargest(limit, scored) if limit is not None else sorted(scored, reverse=True)
+        return [(round(score, 4), self.candidates[-negated]) for score, negated in best]
@@ -0,0 +1,147 @@
+"""
+Opt-in per-rerun profiler for the Streamlit app.
+
+When enabled (``ATLAN_PROFILE=1``, or the ``?profile=1`` query parameter
+once ``ATLAN_PROFILE_QUERY_PARAM=1`` allows it), each rerun of ``main()``
+runs under cProfile. The slowest functions by cumulative time are shown in a
+sidebar panel and the raw stats are written as ``.prof`` files for offline
+analysis (snakeviz, flameprof, ...). Only the newest PROFILE_MAX_FILES files
+are kept.
+"""
+
+import cProfile
+import os
+import pstats
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from config.settings import (
+    PROFILER_ENABLED,
+    PROFILER_QUERY_PARAM_ENABLED,
+    PROFILE_OUTPUT_DIR,
+    PROFILE_MAX_FILES,
+    PROFILE_TOP_FUNCTIONS,
+)
+
+PROFILE_QUERY_PARAM = "profile"
+
+
+def profiling_enabled():
+    """Check whether this rerun should be profiled."""
+    if PROFILER_ENABLED:
+        return True
+    if not PROFILER_QUERY_PARAM_ENABLED:
+        # Otherwise any visitor could make the server write profiles
+        return False
+    try:
+        return st.query_params.get(PROFILE_QUERY_PARAM, "").lower() in ("1", "true", "yes")
+    except Exception:
+        # Query parameters are unavailable outside `streamlit run`
+        return False
+
+
+@contextmanager
+def profile_rerun():
+    """
+    Profile the wrapped rerun if profiling is enabled.
+
+    The ``.prof`` file is written even when the rerun ends with ``st.rerun()``
+    or ``st.stop()``; the sidebar panel is only rendered when it completes.
+    """
+    if not profiling_enabled():
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    completed = False
+    profiler.enable()
+    try:
+        yield
+        completed = True
+    finally:
+        profiler.disable()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        path = _write_profile(profiler)
+        if completed:
+            render_profile_panel(profiler, elapsed_ms, path)
+
+
+def _write_profile(profiler):
+    """Dump the profiler stats to a ``.prof`` file, returning its path (or None on failure)."""
+    ctx = get_script_run_ctx()
+    session = "".join(ch for ch in ctx.session_id if ch.isalnum())[:8] if ctx is not None else "bare"
+    path = os.path.join(PROFILE_OUTPUT_DIR, f"rerun-{session}-{time.time_ns()}.prof")
+    try:
+        os.makedirs(PROFILE_OUTPUT_DIR, exist_ok=True)
+        profiler.dump_stats(path)
+    except OSError:
+        return None
+    _prune_profiles()
+    return path
+
+
+def _prune_profiles(keep=PROFILE_MAX_FILES):
+    """Delete all but the newest ``keep`` rerun profiles."""
+    try:
+        paths = [
+            os.path.join(PROFILE_OUTPUT_DIR, name)
+            for name in os.listdir(PROFILE_OUTPUT_DIR)
+            if name.startswith("rerun-") and name.endswith(".prof")
+        ]
+        paths.sort(key=os.path.getmtime, reverse=True)
+    except OSError:
+        return
+    for path in paths[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Already pruned by another session
+
+
+def top_functions(profiler, limit=PROFILE_TOP_FUNCTIONS):
+    """
+    Get the functions with the highest cumulative time.
+
+    Args:
+        profiler: A disabled cProfile.Profile
+        limit: Number of functions to return
+
+    Returns:
+        List of dicts with function, calls, own time and cumulative time in milliseconds
+    """
+    stats = pstats.Stats(profiler).stats
+    rows = []
+    for (filename, line, func_name), (_, calls, own_time, cumulative_time, _) in stats.items():
+        rows.append({
+            "function": _format_function(filename, line, func_name),
+            "calls": calls,
+            "own_ms": round(own_time * 1000, 2),
+            "cumulative_ms": round(cumulative_time * 1000, 2),
+        })
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows[:limit]
+
+
+def _format_function(filename, line, func_name):
+    """Shorten a profiled function location to package-relative form."""
+    if filename == "~":
+        return func_name  # Built-in function
+    for marker in ("site-packages" + os.sep, os.getcwd() + os.sep):
+        if marker in filename:
+            filename = filename.split(marker, 1)[1]
+            break
+    return f"{filename}:{line}({func_name})"
+
+
+def render_profile_panel(profiler, elapsed_ms, path):
+    """Render the top functions of the last rerun in the sidebar."""
+    with st.sidebar.expander(f"⏱️ Rerun profile: {elapsed_ms:.0f} ms"):
+        st.dataframe(top_functions(profiler), hide_index=True)
+        if path:
+            st.caption(f"Saved to `{path}`")
+        else:
+            st.caption("Could not write the .prof file.")
@@ -0,0 +1,290 @@
+"""
+Streaming import of ApplicationField definitions from OpenAPI / JSON Schema documents.
+
+Specs are read in fixed-size chunks and tokenized incrementally, so only the
+properties of the schema currently being parsed are held in memory.
+"""
+
+import codecs
+import json
+import re
+from json.decoder import scanstring
+
+from config.settings import SCHEMA_IMPORT_CHUNK_SIZE
+
+_WHITESPACE = " \t\n\r"
+_PUNCTUATION = "{}[]:,"
+_DELIMITERS = _WHITESPACE + _PUNCTUATION
+_SCALAR_PATTERN = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+# Locations of named schemas in OpenAPI 3, Swagger 2 and JSON Schema documents
+_SCHEMA_CONTAINERS = (("components", "schemas"), ("definitions",), ("$defs",))
+
+
+def _iter_tokens(stream, chunk_size):
+    """Yield (kind, value) tokens from a text or binary stream, reading it chunk by chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            chunk = b"" if not isinstance(chunk, str) else ""
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk, final=eof)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return not eof
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buffer):
+            if not fill():
+                if pos >= len(buffer):
+                    return
+            continue
+
+        char = buffer[pos]
+        if char in _PUNCTUATION:
+            pos += 1
+            yield char, None
+        elif char == '"':
+            try:
+                value, end = scanstring(buffer, pos + 1)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError("Unterminated string in JSON document")
+                fill()
+                continue
+            pos = end
+            yield "string", value
+        else:
+            match = _SCALAR_PATTERN.match(buffer, pos)
+            end = match.end() if match else pos
+            if match is None or (end < len(buffer) and buffer[end] not in _DELIMITERS) or (
+                end == len(buffer) and not eof
+            ):
+                # The token may continue in the next chunk
+                if eof:
+                    raise ValueError(f"Invalid JSON near: {buffer[pos:pos + 20]!r}")
+                fill()
+                continue
+            text = match.group()
+            pos = match.end()
+            if text in _LITERALS:
+                yield "scalar", _LITERALS[text]
+            else:
+                yield "scalar", float(text) if any(c in text for c in ".eE") else int(text)
+
+
+def iter_json_events(stream, chunk_size=SCHEMA_IMPORT_CHUNK_SIZE):
+    """
+    Parse a JSON document incrementally.
+
+    Args:
+        stream: A file-like object opened in text or binary mode
+        chunk_size: Number of characters/bytes to read at a time
+
+    Yields:
+        Tuples of (path, event, value), where path is a tuple of map keys
+        (``"item"`` for array elements) and event is one of ``start_map``,
+        ``map_key``, ``end_map``, ``start_array``, ``end_array`` or ``value``.
+    """
+    path = []
+    containers = []
+    # What may come next: "value", "value_or_end" (after '['), "key", "key_or_end" (after '{'),
+    # "colon", "comma_or_end" (after a container's value) or "done" (after the top-level value)
+    expect = "value"
+
+    for kind, value in _iter_tokens(stream, chunk_size):
+        if expect == "done":
+            raise ValueError("Unexpected data after the end of the JSON document")
+        if kind in ("}", "]"):
+            container, empty = ("map", "key_or_end") if kind == "}" else ("array", "value_or_end")
+            if not containers or containers[-1] != container or expect not in ("comma_or_end", empty):
+                raise ValueError(f"Unexpected '{kind}' in JSON document")
+            containers.pop()
+            path.pop()
+            yield tuple(path), f"end_{container}", None
+        elif kind == ",":
+            if expect != "comma_or_end":
+                raise ValueError("Unexpected ',' in JSON document")
+            expect = "key" if containers[-1] == "map" else "value"
+            continue
+        elif kind == ":":
+            if expect != "colon":
+                raise ValueError("Unexpected ':' in JSON document")
+            expect = "value"
+            continue
+        elif expect in ("key", "key_or_end"):
+            if kind != "string":
+                raise ValueError("Expected a string key in JSON object")
+            path[-1] = value
+            expect = "colon"
+            yield tuple(path[:-1]), "map_key", value
+            continue
+        elif expect == "colon":
+            raise ValueError("Expected ':' after a key in JSON object")
+        elif expect == "comma_or_end":
+            raise ValueError("Expected ',' between values in JSON document")
+        elif kind == "{":
+            yield tuple(path), "start_map", None
+            containers.append("map")
+            path.append(None)
+            expect = "key_or_end"
+            continue
+        elif kind == "[":
+            yield tuple(path), "start_array", None
+            containers.append("array")
+            path.append("item")
+            expect = "value_or_end"
+            continue
+        else:
+            yield tuple(path), "value", value
+        # A value (or container) just ended
+        expect = "comma_or_end" if containers else "done"
+
+    if containers:
+        raise ValueError(f"Unexpected end of JSON document inside an {'object' if containers[-1] == 'map' else 'array'}")
+    if expect != "done":
+        raise ValueError("Empty JSON document")
+
+
+def _split_schema_path(path):
+    """Split an event path into (schema name, path relative to that schema)."""
+    for container in _SCHEMA_CONTAINERS:
+        size = len(container)
+        if path[:size] == container and len(path) > size:
+            return path[size], path[size + 1:]
+    return None, path
+
+
+def _split_property_path(relative_path):
+    """
+    Split a schema-relative path into its nested property names.
+
+    Returns:
+        Tuple of (property names, whether the remainder is inside ``items``, remainder)
+    """
+    names = []
+    in_items = False
+    i = 0
+    while i < len(relative_path):
+        segment = relative_path[i]
+        if segment == "properties" and i + 1 < len(relative_path):
+            names.append(relative_path[i + 1])
+            in_items = False
+            i += 2
+        elif segment == "items" and names:
+            in_items = True
+            i += 1
+        else:
+            break
+    return tuple(names), in_items, relative_path[i:]
+
+
+def _format_field_type(prop):
+    """Build the display type for a collected property."""
+    base = prop.get("ref") or "|".join(t for t in prop.get("types", []) if t != "null")
+    if prop.get("format"):
+        base = f"{base} ({prop['format']})" if base else prop["format"]
+    if prop.get("is_array") or base == "array":
+        item = prop.get("item_ref") or "|".join(t for t in prop.get("item_types", []) if t != "null")
+        return f"array<{item}>" if item else "array"
+    return base
+
+
+def iter_schema_fields(stream, include_schema_name=True, chunk_size=SCHEMA_IMPORT_CHUNK_SIZE):
+    """
+    Stream ApplicationField definitions out of an OpenAPI or JSON Schema document.
+
+    Properties of every named schema (``components.schemas``, ``definitions``,
+    ``$defs``) and of a root JSON Schema are flattened, with nested properties
+    joined by dots (e.g. ``Order.customer.id``). Only JSON documents are supported.
+
+    Args:
+        stream: A file-like object containing the spec
+        include_schema_name: Prefix field names with the name of their schema
+        chunk_size: Number of characters/bytes to read at a time
+
+    Yields:
+        Field dictionaries in the same shape as the field editor
+        (``name``, ``type``, ``description``)
+    """
+    pending = {}
+
+    for path, event, value in iter_json_events(stream, chunk_size):
+        schema, relative_path = _split_schema_path(path)
+        names, in_items, remainder = _split_property_path(relative_path)
+
+        if not names:
+            # End of a schema: emit its properties in document order
+            if event == "end_map" and not relative_path:
+                for (prop_schema, prop_names), prop in pending.items():
+                    name = ".".join(prop_names)
+                    if include_schema_name and prop_schema:
+                        name = f"{prop_schema}.{name}"
+                    yield {
+                        "name": name,
+                        "type": _format_field_type(prop),
+                        "description": prop.get("description", ""),
+                    }
+                pending.clear()
+            continue
+
+        key = (schema, names)
+        if event == "start_map" and not remainder and not in_items:
+            pending.setdefault(key, {})
+            continue
+        if event != "value" or key not in pending or not remainder:
+            continue
+
+        prop = pending[key]
+        attribute = remainder[0]
+        nested = remainder[1:]
+        if attribute == "type" and nested in ((), ("item",)):
+            prop.setdefault("item_types" if in_items else "types", []).append(str(value))
+            if not in_items and value == "array":
+                prop["is_array"] = True
+        elif attribute == "$ref" and not nested and isinstance(value, str):
+            prop["item_ref" if in_items else "ref"] = value.rsplit("/", 1)[-1]
+            if in_items:
+                prop["is_array"] = True
+        elif attribute == "format" and not nested and not in_items:
+            prop["format"] = str(value)
+        elif attribute == "description" and not nested and not in_items:
+            prop["description"] = str(value)
+
+
+def merge_imported_fields(existing_fields, imported_fields):
+    """
+    Append imported fields to an existing field list, skipping duplicate names.
+
+    Names are compared case-insensitively against the existing fields and
+    against fields already imported in this call.
+
+    Args:
+        existing_fields: The list to extend (e.g. ``st.session_state.application_fields``)
+        imported_fields: Iterable of field dictionaries
+
+    Returns:
+        Tuple of (number of fields added, number of duplicates skipped)
+    """
+    seen = {(f.get("name") or "").strip().lower() for f in existing_fields}
+    added = 0
+    skipped = 0
+    for field in imported_fields:
+        key = (field.get("name") or "").strip().lower()
+        if not key or key in seen:
+            skipped += 1
+            continue
+        seen.add(key)
+        existing_fields.append(field)
+        added += 1
+    return added, skipped
@@ -4,6 +4,7 @@ Session state utility functions for managing workflow state.
 
 import streamlit as st
 from config.settings import PERSISTENT_SESSION_KEYS
+from utils.compact_state import FieldStore, compact_search_results, estimate_size
 
 
 def clear_workflow_state():
@@ -19,9 +20,9 @@ def initialize_application_fields():
         # Check if we're in update mode and have existing fields
         if (st.session_state.get("asset_details", {}).get("is_update", False) and 
             "asset_details" in st.session_state):
-            st.session_state.application_fields = st.session_state["asset_details"]["fields"]
+            st.session_state.application_fields = FieldStore(st.session_state["asset_details"]["fields"])
         else:
-            st.session_state.application_fields = []
+            st.session_state.application_fields = FieldStore()
 
 
 def get_operation_type():
@@ -54,12 +55,140 @@ def get_search_results():
     return st.session_state.get("search_results", {})
 
 
-def set_search_results(results):
-    """Set search results in session state."""
-    st.session_state.search_results = results
+def set_search_results(results, keep=()):
+    """
+    Set search results in session state, keeping only slim asset references.
+
+    Args:
+        results: The new results keyed by display name
+        keep: Display names of current results to keep after the new ones (e.g. picked assets)
+    """
+    current = get_search_results()
+    kept = {name: current[name] for name in keep if name in current and name not in results}
+    st.session_state.search_results = {**compact_search_results(results), **kept}
+
+
+def add_search_results(results):
+    """Add more search results to those already in session state."""
+    st.session_state.search_results = {**get_search_results(), **compact_search_results(results)}
+
+
+def get_search_cursor():
+    """Get the (search term, cursor, filters) of a search with more results available, or None."""
+    return st.session_state.get("search_cursor")
+
+
+def set_search_cursor(search_term, cursor, filters=None):
+    """Remember where a search stopped so more results can be loaded; None when it was exhausted."""
+    st.session_state.search_cursor = (search_term, cursor, filters or {}) if cursor is not None else None
+
+
+def get_search_facets():
+    """Get the (search term, facet counts) of the latest search, or None."""
+    return st.session_state.get("search_facets")
+
+
+def set_search_facets(search_term, facets):
+    """Store the facet counts returned with a search's first page."""
+    st.session_state.search_facets = (search_term, facets) if facets and any(facets.values()) else None
+    st.session_state.search_filters = {}
+
+
+def get_search_filters():
+    """Get the facet filters the current results were narrowed with."""
+    return st.session_state.get("search_filters", {})
+
+
+def set_search_filters(filters):
+    """Store the facet filters the current results were narrowed with."""
+    st.session_state.search_filters = filters
+
+
+def get_explorer_levels():
+    """Get the explorer tree levels loaded so far, keyed by (level, parent qualified name)."""
+    if "explorer_levels" not in st.session_state:
+        st.session_state.explorer_levels = {}
+    return st.session_state.explorer_levels
+
+
+def clear_explorer_levels():
+    """Forget the loaded explorer levels so they are fetched again."""
+    st.session_state.pop("explorer_levels", None)
+
+
+def get_column_lineage_import():
+    """Get the (file ID, mappings, rows skipped) of the imported column lineage CSV, or None."""
+    return st.session_state.get("column_lineage_import")
+
+
+def set_column_lineage_import(file_id, mappings, skipped):
+    """Store the mappings read from a column lineage CSV."""
+    st.session_state.column_lineage_import = (file_id, mappings, skipped)
+
+
+def clear_column_lineage_import():
+    """Forget the mappings read from a column lineage CSV that is no longer uploaded."""
+    st.session_state.pop("column_lineage_import", None)
+
+
+def get_existing_application_state():
+    """Get the owners, tags and relationships loaded with the application being updated, or None."""
+    return st.session_state.get("existing_application_state")
+
+
+def set_existing_application_state(state):
+    """Store what was loaded with the application being updated (its fields live in asset_details)."""
+    if state is None:
+        st.session_state.pop("existing_application_state", None)
+    else:
+        existing = {key: value for key, value in state.items() if key not in ("application", "fields")}
+        for group in ("owned_assets", "lineage_inputs", "lineage_outputs"):
+            existing[group] = compact_search_results(existing[group])
+        st.session_state.existing_application_state = existing
+
+
+def get_tenant_clients():
+    """Get the additional tenants registered for publishing, as {tenant key: (client, user)}."""
+    return st.session_state.get("tenant_clients", {})
+
+
+def add_tenant_client(tenant, client, user):
+    """Register (or reconnect) an additional tenant applications can be published to."""
+    st.session_state.tenant_clients = {**get_tenant_clients(), tenant: (client, user)}
+
+
+def remove_tenant_client(tenant):
+    """Stop publishing to an additional tenant."""
+    st.session_state.tenant_clients = {key: value for key, value in get_tenant_clients().items() if key != tenant}
+
+
+def get_impact_preview():
+    """Get the ({starting GUID: name}, ImpactPreview) of the last lineage impact preview, or None."""
+    return st.session_state.get("impact_preview")
+
+
+def set_impact_preview(start_names, preview):
+    """Store a lineage impact preview and the assets it started from."""
+    st.session_state.impact_preview = (start_names, preview)
 
 
 def initialize_search_results():
     """Initialize search results if not present."""
     if "search_results" not in st.session_state:
-        st.session_state.search_results = {} 
\ No newline at end of file
+        st.session_state.search_results = {} 
+
+
+def get_session_memory_usage():
+    """
+    Estimate the memory held by this session's workflow state.
+
+    The shared client and user objects are excluded.
+
+    Returns:
+        Dictionary mapping session state keys to their estimated size in bytes
+    """
+    return {
+        key: estimate_size(value)
+        for key, value in st.session_state.items()
+        if key not in ("client", "user")
+    }